@@ -8,8 +8,14 @@ This example shows:
 - Debug operations
 - Oplog operations
 - Export/import
+
+Only ingestion and search run by default; pass --lifecycle, --debug,
+--oplog or --export to also run the slower demos.
 """
 
+import argparse
+import os
+
 from shilp import (
     Client,
     AddCollectionRequest,
@@ -23,8 +29,21 @@ from shilp import (
     SortOrder,
     AttrType,
     StorageBackendType,
+    NotFoundError,
 )
 
+# Metadata schema shared by every record; sent once per batch
+_METADATA_SCHEMA = {
+    "category": AttrType.STRING,
+    "rating": AttrType.FLOAT64,
+    "views": AttrType.INT64,
+    "published": AttrType.BOOL,
+}
+
+# Example vector shared by every record. Real embeddings can be passed as
+# numpy arrays, which the client serializes without converting to lists.
+_DEMO_VECTOR = [0.1, 0.2, 0.3, 0.4, 0.5]
+
 
 def print_section(title):
     """Print a formatted section header."""
@@ -33,10 +52,8 @@ def print_section(title):
     print('=' * 60)
 
 
-def main():
-    # Initialize client
-    client = Client("http://localhost:3000")
-    
+def demo_ingest(client, collection_name):
+    """Create the collection, ingest records and run searches."""
     print_section("Health Check")
     health = client.health_check()
     print(f"Server Status: {health.success}")
@@ -48,12 +65,10 @@ def main():
     collections = client.list_collections()
     print(f"Total collections: {len(collections.data)}")
     
-    # Create a test collection
-    collection_name = "advanced-example"
-    try:
+    # Create a test collection, dropping a leftover one from the listing above
+    existing = {c.name for c in collections.data}
+    if collection_name in existing:
         client.drop_collection(collection_name)
-    except:
-        pass
     
     client.add_collection(AddCollectionRequest(
         name=collection_name,
@@ -96,25 +111,27 @@ def main():
         },
     ]
 
-    for rec in records:
-        client.insert_record(InsertRecordRequest(
-            collection=collection_name,
-            id=rec["id"],
-            record={
-                "title": rec["title"],
-                "content": rec["content"],
-                "vector": [0.1, 0.2, 0.3, 0.4, 0.5],  # Example vector
-            },
-            metadata_fields={
-                "category": AttrType.STRING,
-                "rating": AttrType.FLOAT64,
-                "views": AttrType.INT64,
-                "published": AttrType.BOOL,
-            }
-        ))
-        print(f"  ✓ Inserted: {rec['id']}")
-
-    # Flush to persist
+    response = client.insert_records(
+        collection_name,
+        [
+            InsertRecordRequest(
+                collection=collection_name,
+                id=rec["id"],
+                record={
+                    "title": rec["title"],
+                    "content": rec["content"],
+                    "vector": _DEMO_VECTOR,
+                },
+            )
+            for rec in records
+        ],
+        batch_size=500,
+        metadata_fields=_METADATA_SCHEMA,
+    )
+    print(f"  ✓ Inserted {response.inserted} records")
+
+    # Flush to persist. One flush per bulk ingest is enough, not one per
+    # batch: flush once after the last insert_records call.
     client.flush_collection(collection_name)
     print("\n✓ Collection flushed")
 
@@ -126,9 +143,10 @@ def main():
         fields=["title", "content"],
         limit=5
     ))
-    print(f"Found {len(results.data)} results")
-    for i, result in enumerate(results.data, 1):
-        print(f"  {i}. {result.get('title', 'N/A')}")
+    titles = results.as_records(["title"], default="N/A")
+    print(f"Found {len(titles)} results")
+    for i, (title,) in enumerate(titles, 1):
+        print(f"  {i}. {title}")
 
     print_section("Advanced Search with Filtering")
     
@@ -159,10 +177,14 @@ def main():
         sort=sort,
     ))
     
-    print(f"Filtered results: {len(filtered_results.data)}")
-    for result in filtered_results.data:
-        print(f"  - {result.get('title', 'N/A')} (rating: {result.get('rating', 'N/A')})")
+    rows = filtered_results.as_records(["title", "rating"], default="N/A")
+    print(f"Filtered results: {len(rows)}")
+    for title, rating in rows:
+        print(f"  - {title} (rating: {rating})")
+
 
+def demo_lifecycle(client, collection_name):
+    """Unload, load and reindex the collection, then manage records."""
     print_section("Collection Operations")
     
     # Unload and load collection
@@ -186,6 +208,9 @@ def main():
     client.expiry_cleanup(collection_name)
     print("✓ Expiry cleanup completed")
 
+
+def demo_debug(client, collection_name):
+    """Inspect storage, embedding models and collection levels."""
     print_section("Storage Operations")
     
     # List storage (this may be empty in a test environment)
@@ -221,6 +246,9 @@ def main():
     except Exception as e:
         print(f"Debug operations: {e}")
 
+
+def demo_oplog(client, collection_name):
+    """Register a replica and read the oplog."""
     print_section("Oplog Operations")
     
     try:
@@ -247,16 +275,18 @@ def main():
     except Exception as e:
         print(f"Oplog operations: {e}")
 
+
+def demo_export(client, collection_name):
+    """Export the collection to a local file."""
     print_section("Export/Import Collection")
     
     try:
         # Export collection
         export_file = "/tmp/test-collection-export.bin"
-        with client.export_collection(collection_name) as export_data:
-            with open(export_file, "wb") as f:
-                content = export_data.read()
-                f.write(content)
-        print(f"✓ Exported collection to {export_file} ({len(content)} bytes)")
+        with open(export_file, "wb") as f:
+            for chunk in client.export_collection_chunks(collection_name):
+                f.write(chunk)
+        print(f"✓ Exported collection to {export_file} ({os.path.getsize(export_file)} bytes)")
         
         # Import would create a new collection from the export
         # client.import_collection(export_file)
@@ -264,12 +294,56 @@ def main():
     except Exception as e:
         print(f"Export/Import: {e}")
 
+
+def parse_args():
+    """Parse command-line flags selecting the optional demos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url", default="http://localhost:3000",
+        help="Shilp server URL",
+    )
+    parser.add_argument(
+        "--lifecycle", action="store_true",
+        help="run unload/load/reindex and record management",
+    )
+    parser.add_argument(
+        "--debug", action="store_true",
+        help="run storage, embedding model and debug operations",
+    )
+    parser.add_argument(
+        "--oplog", action="store_true",
+        help="run oplog operations",
+    )
+    parser.add_argument(
+        "--export", action="store_true",
+        help="export the collection to /tmp",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Initialize client
+    client = Client(args.url)
+    collection_name = "advanced-example"
+
+    demo_ingest(client, collection_name)
+    if args.lifecycle:
+        demo_lifecycle(client, collection_name)
+    if args.debug:
+        demo_debug(client, collection_name)
+    if args.oplog:
+        demo_oplog(client, collection_name)
+    if args.export:
+        demo_export(client, collection_name)
+
     print_section("Rename Collection")
     
     new_name = f"{collection_name}-renamed"
     try:
         client.drop_collection(new_name)
-    except:
+    except NotFoundError:
         pass
     
     client.rename_collection(collection_name, new_name)
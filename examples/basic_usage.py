@@ -25,12 +25,12 @@ def main():
     collections = client.list_collections()
     print(f"Existing collections: {[c.name for c in collections.data]}\n")
 
-    # Drop collection if it already exists
+    # Drop collection if it already exists, reusing the listing above
     collection_name = "example-collection"
-    try:
+    if collection_name in {c.name for c in collections.data}:
         client.drop_collection(collection_name)
         print(f"Dropped existing collection: {collection_name}")
-    except Exception:
+    else:
         print(f"Collection {collection_name} doesn't exist (OK)")
 
     # Create a new collection
@@ -65,8 +65,9 @@ def main():
         },
     ]
 
-    for record in records:
-        response = client.insert_record(
+    response = client.insert_records(
+        collection_name,
+        [
             InsertRecordRequest(
                 collection=collection_name,
                 id=record["id"],
@@ -76,8 +77,11 @@ def main():
                 },
                 fields=["title", "content"],
             )
-        )
-        print(f"  ✓ Inserted record: {record['id']}")
+            for record in records
+        ],
+        batch_size=500,
+    )
+    print(f"  ✓ Inserted {response.inserted} records")
 
     # Flush collection to ensure all records are persisted
     print(f"\nFlushing collection...")
@@ -95,12 +99,15 @@ def main():
         )
     )
     
-    print(f"Found {len(search_results.data)} results:")
-    for i, result in enumerate(search_results.data, 1):
+    # as_records pulls the needed columns out of every row in one pass, which
+    # is cheaper than repeated result.get() calls on large result sets
+    rows = search_results.as_records(["id", "title", "content"], default="N/A")
+    print(f"Found {len(rows)} results:")
+    for i, (doc_id, title, content) in enumerate(rows, 1):
         print(f"\n  Result {i}:")
-        print(f"    ID: {result.get('id', 'N/A')}")
-        print(f"    Title: {result.get('title', 'N/A')}")
-        print(f"    Content: {result.get('content', 'N/A')[:100]}...")
+        print(f"    ID: {doc_id}")
+        print(f"    Title: {title}")
+        print(f"    Content: {content[:100]}...")
 
     # Advanced search with max distance
     print(f"\n\nAdvanced search with max_distance=0.5...")
@@ -114,18 +121,20 @@ def main():
         )
     )
     
-    print(f"Found {len(advanced_results.data)} results within distance threshold:")
-    for i, result in enumerate(advanced_results.data, 1):
-        print(f"  {i}. {result.get('title', 'N/A')}")
+    titles = advanced_results.as_records(["title"], default="N/A")
+    print(f"Found {len(titles)} results within distance threshold:")
+    for i, (title,) in enumerate(titles, 1):
+        print(f"  {i}. {title}")
 
     # Delete a record
     print(f"\n\nDeleting record 'doc-2'...")
     client.delete_record(collection_name, "doc-2")
     print(f"✓ Record deleted")
 
-    # List collections again
-    collections = client.list_collections()
-    collection = next((c for c in collections.data if c.name == collection_name), None)
+    # Find the collection, stopping at the first page that contains it
+    collection = next(
+        (c for c in client.iter_collections() if c.name == collection_name), None
+    )
     if collection:
         print(f"\n\nCollection info:")
         print(f"  Name: {collection.name}")
@@ -1,174 +1,205 @@
 """Shilp Python SDK - Official Python SDK for the Shilp Vector Database API."""
 
-from shilp.client import Client
-from shilp.discovery_client import DiscoveryClient
-from shilp.models import (
-    # Request models
-    AddCollectionRequest,
-    InsertRecordRequest,
-    IngestRequest,
-    SearchRequest,
-    UpdateReplicaLSNRequest,
-    RegisterReplicaRequest,
-    UnRegisterReplicaRequest,
-    FileReaderOptions,
-    DebugGetEmbeddingsRequest,
-    EnableMetadataStoreRequest,
-    SettingsUpdateRequest,
-    # Response models
-    GenericResponse,
-    HealthResponse,
-    ListCollectionsResponse,
-    Collection,
-    MetadataSupportInfo,
-    InsertRecordResponse,
-    IngestResponse,
-    ListIngestionSourcesResponse,
-    SearchResponse,
-    ListStorageResponse,
-    ReadDocumentResponse,
-    ListEmbeddingModelsResponse,
-    OplogStatusResponse,
-    GetOplogResponse,
-    UpdateReplicaLSNResponse,
-    GetCollectionDataResponse,
-    CollectionDataRecord,
-    GetCollectionSchemaResponse,
-    CollectionSchema,
-    Attribute,
-    AttributeType,
-    CategorySchema,
-    CategoryValue,
-    ListNLIVerticalsResponse,
-    VerticalInfo,
-    EnableMetadataStoreResponse,
-    GetSettingsResponse,
-    SettingsAvailableProvidersResponse,
-    # Debug models
-    DebugDistanceData,
-    DebugDistanceResponse,
-    DebugNodeInfoResponse,
-    DebugLevelsResponse,
-    DebugNodesAtLevelResponse,
-    DebugReferenceNodeResponse,
-    DebugGetEmbeddingsResponse,
-    # Enums and types
-    AttrType,
-    FilterOp,
-    SortOrder,
-    StorageBackendType,
-    IndexType,
-    IngestSourceType,
-    FuzzyAlgo,
-    OpType,
-    SyncStatus,
-    ReplicaType,
-    # Filter and Sort expressions
-    FilterExpression,
-    CompoundFilter,
-    SortExpression,
-    CompoundSort,
-    # Discovery and Replica models
-    Replica,
-    Status,
-    ProxyStats,
-    DiscoveryStats,
-    VectorCreateConfig,
-    VectorSearchConfig,
-    Settings,
-    SettingsAuth,
-    APIAuthConfig,
-    ProviderArgumentValue,
-    SettingsIntegration,
-    SettingsProviderArguments,
-    SettingsProviderType,
-    SettingsProviderInfo,
-    SettingsAvailableProvidersData,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-__version__ = "0.14.0"
-__all__ = [
-    "Client",
-    "DiscoveryClient",
+# Public names are imported on first access (PEP 562) so that importing the
+# package, or a single name from it, only loads the modules actually used.
+_LAZY = {
+    "Client": "shilp.client",
+    "AsyncClient": "shilp.async_client",
+    "DiscoveryClient": "shilp.discovery_client",
+    "AsyncDiscoveryClient": "shilp.async_discovery_client",
+    # Exceptions
+    "ShilpError": "shilp.exceptions",
+    "NotFoundError": "shilp.exceptions",
     # Request models
-    "AddCollectionRequest",
-    "InsertRecordRequest",
-    "IngestRequest",
-    "SearchRequest",
-    "UpdateReplicaLSNRequest",
-    "RegisterReplicaRequest",
-    "UnRegisterReplicaRequest",
-    "FileReaderOptions",
-    "DebugGetEmbeddingsRequest",
-    "EnableMetadataStoreRequest",
-    "SettingsUpdateRequest",
+    "AddCollectionRequest": "shilp.models",
+    "InsertRecordRequest": "shilp.models",
+    "BulkInsertRequest": "shilp.models",
+    "IngestRequest": "shilp.models",
+    "SearchRequest": "shilp.models",
+    "UpdateReplicaLSNRequest": "shilp.models",
+    "RegisterReplicaRequest": "shilp.models",
+    "UnRegisterReplicaRequest": "shilp.models",
+    "FileReaderOptions": "shilp.models",
+    "DebugGetEmbeddingsRequest": "shilp.models",
+    "EnableMetadataStoreRequest": "shilp.models",
+    "SettingsUpdateRequest": "shilp.models",
     # Response models
-    "GenericResponse",
-    "HealthResponse",
-    "ListCollectionsResponse",
-    "Collection",
-    "MetadataSupportInfo",
-    "InsertRecordResponse",
-    "IngestResponse",
-    "ListIngestionSourcesResponse",
-    "SearchResponse",
-    "ListStorageResponse",
-    "ReadDocumentResponse",
-    "ListEmbeddingModelsResponse",
-    "OplogStatusResponse",
-    "GetOplogResponse",
-    "UpdateReplicaLSNResponse",
-    "GetCollectionDataResponse",
-    "CollectionDataRecord",
-    "GetCollectionSchemaResponse",
-    "CollectionSchema",
-    "Attribute",
-    "AttributeType",
-    "CategorySchema",
-    "CategoryValue",
-    "ListNLIVerticalsResponse",
-    "VerticalInfo",
-    "EnableMetadataStoreResponse",
-    "GetSettingsResponse",
-    "SettingsAvailableProvidersResponse",
+    "GenericResponse": "shilp.models",
+    "HealthResponse": "shilp.models",
+    "ListCollectionsResponse": "shilp.models",
+    "Collection": "shilp.models",
+    "MetadataSupportInfo": "shilp.models",
+    "InsertRecordResponse": "shilp.models",
+    "BulkInsertResponse": "shilp.models",
+    "IngestResponse": "shilp.models",
+    "ListIngestionSourcesResponse": "shilp.models",
+    "SearchResponse": "shilp.models",
+    "ListStorageResponse": "shilp.models",
+    "ReadDocumentResponse": "shilp.models",
+    "ListEmbeddingModelsResponse": "shilp.models",
+    "OplogStatusResponse": "shilp.models",
+    "GetOplogResponse": "shilp.models",
+    "UpdateReplicaLSNResponse": "shilp.models",
+    "GetCollectionDataResponse": "shilp.models",
+    "CollectionDataRecord": "shilp.models",
+    "GetCollectionSchemaResponse": "shilp.models",
+    "CollectionSchema": "shilp.models",
+    "Attribute": "shilp.models",
+    "AttributeType": "shilp.models",
+    "CategorySchema": "shilp.models",
+    "CategoryValue": "shilp.models",
+    "ListNLIVerticalsResponse": "shilp.models",
+    "VerticalInfo": "shilp.models",
+    "EnableMetadataStoreResponse": "shilp.models",
+    "GetSettingsResponse": "shilp.models",
+    "SettingsAvailableProvidersResponse": "shilp.models",
     # Debug models
-    "DebugDistanceData",
-    "DebugDistanceResponse",
-    "DebugNodeInfoResponse",
-    "DebugLevelsResponse",
-    "DebugNodesAtLevelResponse",
-    "DebugReferenceNodeResponse",
-    "DebugGetEmbeddingsResponse",
+    "DebugDistanceData": "shilp.models",
+    "DebugDistanceResponse": "shilp.models",
+    "DebugNodeInfoResponse": "shilp.models",
+    "DebugLevelsResponse": "shilp.models",
+    "DebugNodesAtLevelResponse": "shilp.models",
+    "DebugReferenceNodeResponse": "shilp.models",
+    "DebugGetEmbeddingsResponse": "shilp.models",
     # Enums and types
-    "AttrType",
-    "FilterOp",
-    "SortOrder",
-    "StorageBackendType",
-    "IndexType",
-    "IngestSourceType",
-    "FuzzyAlgo",
-    "OpType",
-    "SyncStatus",
-    "ReplicaType",
+    "AttrType": "shilp.models",
+    "FilterOp": "shilp.models",
+    "SortOrder": "shilp.models",
+    "StorageBackendType": "shilp.models",
+    "IndexType": "shilp.models",
+    "IngestSourceType": "shilp.models",
+    "FuzzyAlgo": "shilp.models",
+    "OpType": "shilp.models",
+    "SyncStatus": "shilp.models",
+    "ReplicaType": "shilp.models",
     # Filter and Sort expressions
-    "FilterExpression",
-    "CompoundFilter",
-    "SortExpression",
-    "CompoundSort",
+    "FilterExpression": "shilp.models",
+    "CompoundFilter": "shilp.models",
+    "SortExpression": "shilp.models",
+    "CompoundSort": "shilp.models",
     # Discovery and Replica models
-    "Replica",
-    "Status",
-    "ProxyStats",
-    "DiscoveryStats",
-    "VectorSearchConfig",
-    "VectorCreateConfig",
-    "Settings",
-    "SettingsAuth",
-    "APIAuthConfig",
-    "ProviderArgumentValue",
-    "SettingsIntegration",
-    "SettingsProviderArguments",
-    "SettingsProviderType",
-    "SettingsProviderInfo",
-    "SettingsAvailableProvidersData",
-]
+    "Replica": "shilp.models",
+    "Status": "shilp.models",
+    "ProxyStats": "shilp.models",
+    "DiscoveryStats": "shilp.models",
+    "VectorCreateConfig": "shilp.models",
+    "VectorSearchConfig": "shilp.models",
+    "Settings": "shilp.models",
+    "SettingsAuth": "shilp.models",
+    "APIAuthConfig": "shilp.models",
+    "ProviderArgumentValue": "shilp.models",
+    "SettingsIntegration": "shilp.models",
+    "SettingsProviderArguments": "shilp.models",
+    "SettingsProviderType": "shilp.models",
+    "SettingsProviderInfo": "shilp.models",
+    "SettingsAvailableProvidersData": "shilp.models",
+}
+
+if TYPE_CHECKING:
+    # Static imports for type checkers and IDEs, which cannot follow
+    # __getattr__; keep in step with _LAZY (checked by tests/test_init.py)
+    from shilp.async_client import AsyncClient
+    from shilp.async_discovery_client import AsyncDiscoveryClient
+    from shilp.client import Client
+    from shilp.discovery_client import DiscoveryClient
+    from shilp.exceptions import ShilpError, NotFoundError
+    from shilp.models import (
+        AddCollectionRequest,
+        InsertRecordRequest,
+        BulkInsertRequest,
+        IngestRequest,
+        SearchRequest,
+        UpdateReplicaLSNRequest,
+        RegisterReplicaRequest,
+        UnRegisterReplicaRequest,
+        FileReaderOptions,
+        DebugGetEmbeddingsRequest,
+        EnableMetadataStoreRequest,
+        SettingsUpdateRequest,
+        GenericResponse,
+        HealthResponse,
+        ListCollectionsResponse,
+        Collection,
+        MetadataSupportInfo,
+        InsertRecordResponse,
+        BulkInsertResponse,
+        IngestResponse,
+        ListIngestionSourcesResponse,
+        SearchResponse,
+        ListStorageResponse,
+        ReadDocumentResponse,
+        ListEmbeddingModelsResponse,
+        OplogStatusResponse,
+        GetOplogResponse,
+        UpdateReplicaLSNResponse,
+        GetCollectionDataResponse,
+        CollectionDataRecord,
+        GetCollectionSchemaResponse,
+        CollectionSchema,
+        Attribute,
+        AttributeType,
+        CategorySchema,
+        CategoryValue,
+        ListNLIVerticalsResponse,
+        VerticalInfo,
+        EnableMetadataStoreResponse,
+        GetSettingsResponse,
+        SettingsAvailableProvidersResponse,
+        DebugDistanceData,
+        DebugDistanceResponse,
+        DebugNodeInfoResponse,
+        DebugLevelsResponse,
+        DebugNodesAtLevelResponse,
+        DebugReferenceNodeResponse,
+        DebugGetEmbeddingsResponse,
+        AttrType,
+        FilterOp,
+        SortOrder,
+        StorageBackendType,
+        IndexType,
+        IngestSourceType,
+        FuzzyAlgo,
+        OpType,
+        SyncStatus,
+        ReplicaType,
+        FilterExpression,
+        CompoundFilter,
+        SortExpression,
+        CompoundSort,
+        Replica,
+        Status,
+        ProxyStats,
+        DiscoveryStats,
+        VectorCreateConfig,
+        VectorSearchConfig,
+        Settings,
+        SettingsAuth,
+        APIAuthConfig,
+        ProviderArgumentValue,
+        SettingsIntegration,
+        SettingsProviderArguments,
+        SettingsProviderType,
+        SettingsProviderInfo,
+        SettingsAvailableProvidersData,
+    )
+
+__version__ = "0.15.0"
+# _LAZY is the single source of truth for the public API
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,513 @@
+"""Asynchronous Shilp API Client implementation built on httpx."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Type, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+from shilp.client import _M, Client, _decode_model, _dumps, _loads
+from shilp.exceptions import _api_error
+from shilp.models import (
+    GenericResponse,
+    GetOplogResponse,
+    HealthResponse,
+    ListCollectionsResponse,
+    AddCollectionRequest,
+    InsertRecordRequest,
+    InsertRecordResponse,
+    OplogStatusResponse,
+    SearchRequest,
+    SearchResponse,
+)
+
+
+class AsyncClient:
+    """Asynchronous client for the Shilp API.
+
+    Independent requests can be issued concurrently, e.g.
+    ``await asyncio.gather(*[client.ainsert_record(r) for r in records])``.
+    Requires the ``async`` extra (``pip install shilp-sdk[async]``).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        auth_token: Optional[str] = None,
+        http2: bool = True,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+    ):
+        """
+        Initialize the asynchronous Shilp API client.
+
+        Args:
+            base_url: Base URL of the Shilp server (e.g., "http://localhost:3000")
+            timeout: Request timeout in seconds (default: 30)
+            http_client: Optional custom httpx.AsyncClient instance
+            auth_token: Optional auth token to send as Bearer token
+            http2: Whether to negotiate HTTP/2 (default: True)
+            max_connections: Maximum number of pooled connections (default: 64)
+            max_keepalive_connections: Maximum idle keep-alive connections (default: 32)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncClient requires httpx; install it with `pip install shilp-sdk[async]`"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.auth_token = auth_token
+        self._http = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    def set_auth_token(self, token: str) -> None:
+        """Set auth token used in Authorization header for API calls."""
+        self.auth_token = token
+
+    def _build_auth_headers(self) -> Optional[Dict[str, str]]:
+        """Build auth headers for API requests."""
+        if not self.auth_token:
+            return None
+        return {"Authorization": f"Bearer {self.auth_token}"}
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Perform an HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API endpoint path
+            json_data: JSON data to send in request body
+            params: Query parameters
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        content = await self._request_content(method, path, json_data, params, timeout)
+        return _loads(content) if content else {}
+
+    async def _request_content(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Perform an HTTP request and return the undecoded response body.
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        headers = self._build_auth_headers()
+        body = None
+        if json_data is not None:
+            headers = headers or {}
+            headers["Content-Type"] = "application/json"
+            body = _dumps(json_data)
+
+        response = await self._http.request(
+            method,
+            self.base_url + path,
+            content=body,
+            params=params,
+            headers=headers,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
+
+        if response.status_code >= 400:
+            raise _api_error(response)
+
+        return response.content
+
+    async def _request_model(
+        self,
+        model: Type[_M],
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> _M:
+        """
+        Perform an HTTP request and decode the response into a flat model.
+
+        Decoding matches Client._request_model, so keys the model does not
+        declare are ignored.
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        content = await self._request_content(method, path, json_data, params)
+        return _decode_model(model, content)
+
+    # Health Check
+    async def ahealth_check(self) -> HealthResponse:
+        """
+        Perform a health check on the API.
+
+        Returns:
+            HealthResponse with success status and version
+        """
+        return await self._request_model(HealthResponse, "GET", "/health")
+
+    # Collection Management
+    async def alist_collections(self) -> ListCollectionsResponse:
+        """
+        List all collections.
+
+        Returns:
+            ListCollectionsResponse containing list of collections
+        """
+        data = await self._request("GET", "/api/collections/v1/")
+        return Client._parse_list_collections(data)
+
+    async def aadd_collection(self, request: AddCollectionRequest) -> GenericResponse:
+        """
+        Add a new collection.
+
+        Args:
+            request: AddCollectionRequest with collection details
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = Client._add_collection_to_dict(request)
+        return await self._request_model(
+            GenericResponse, "POST", "/api/collections/v1/", json_data=json_data
+        )
+
+    async def adrop_collection(self, name: str) -> GenericResponse:
+        """
+        Drop an existing collection.
+
+        Args:
+            name: Name of the collection to drop
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse, "DELETE", f"/api/collections/v1/{name}"
+        )
+
+    async def arename_collection(self, old_name: str, new_name: str) -> GenericResponse:
+        """
+        Rename an existing collection.
+
+        Args:
+            old_name: Current name of the collection
+            new_name: New name for the collection
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse,
+            "PUT",
+            f"/api/collections/v1/{old_name}/rename/{new_name}",
+        )
+
+    async def aload_collection(self, name: str) -> GenericResponse:
+        """
+        Load a collection into memory.
+
+        Args:
+            name: Name of the collection to load
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{name}/load"
+        )
+
+    async def aunload_collection(self, name: str) -> GenericResponse:
+        """
+        Unload a collection from memory.
+
+        Args:
+            name: Name of the collection to unload
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{name}/unload"
+        )
+
+    async def aflush_collection(self, name: str) -> GenericResponse:
+        """
+        Flush a collection to disk.
+
+        Args:
+            name: Name of the collection to flush
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{name}/flush"
+        )
+
+    async def areindex_collection(self, name: str) -> GenericResponse:
+        """
+        Re-index a collection for debug purposes.
+
+        Args:
+            name: Name of the collection to reindex
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse, "PUT", f"/api/collections/v1/{name}/reindex"
+        )
+
+    async def adelete_record(
+        self, collection_name: str, record_id: str
+    ) -> GenericResponse:
+        """
+        Delete a record from a collection.
+
+        Args:
+            collection_name: Name of the collection
+            record_id: ID of the record to delete
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse,
+            "DELETE",
+            f"/api/collections/v1/{collection_name}/{record_id}",
+        )
+
+    async def aexpiry_cleanup(self, collection_name: str) -> GenericResponse:
+        """
+        Perform expiry cleanup on a collection.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        return await self._request_model(
+            GenericResponse,
+            "POST",
+            f"/api/collections/v1/{collection_name}/expiry-cleanup",
+        )
+
+    # Data Operations
+    async def ainsert_record(
+        self, request: Union[InsertRecordRequest, Dict[str, Any]]
+    ) -> InsertRecordResponse:
+        """
+        Insert a new record into a collection.
+
+        Args:
+            request: InsertRecordRequest with record details, or a dict already
+                in the wire format, which is sent without conversion
+
+        Returns:
+            InsertRecordResponse with inserted record details
+        """
+        json_data = Client._insert_record_to_dict(request)
+        data = await self._request(
+            "POST", "/api/collections/v1/record", json_data=json_data
+        )
+        return InsertRecordResponse(**data)
+
+    async def ainsert_records_concurrent(
+        self,
+        records: List[Union[InsertRecordRequest, Dict[str, Any]]],
+        concurrency: int = 16,
+    ) -> List[InsertRecordResponse]:
+        """
+        Insert records concurrently, with at most `concurrency` requests in flight.
+
+        Args:
+            records: Records to insert
+            concurrency: Maximum number of in-flight requests (default: 16)
+
+        Returns:
+            InsertRecordResponse for each record, in input order
+
+        Raises:
+            ValueError: If concurrency is not positive
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def insert(
+            request: Union[InsertRecordRequest, Dict[str, Any]]
+        ) -> InsertRecordResponse:
+            async with semaphore:
+                return await self.ainsert_record(request)
+
+        return list(await asyncio.gather(*[insert(r) for r in records]))
+
+    async def asearch_data(self, request: SearchRequest) -> SearchResponse:
+        """
+        Search for data in a collection using POST request.
+
+        Args:
+            request: SearchRequest with search parameters
+
+        Returns:
+            SearchResponse with search results
+
+        Raises:
+            ValueError: If collection name is empty or both query and vector_query are empty
+        """
+        json_data = Client._search_request_to_dict(request)
+        data = await self._request("POST", "/api/data/v1/search", json_data=json_data)
+        return SearchResponse(**data)
+
+    async def asearch_data_many(
+        self, search_requests: List[SearchRequest], concurrency: int = 16
+    ) -> List[SearchResponse]:
+        """
+        Run several independent searches concurrently.
+
+        Args:
+            search_requests: SearchRequests to run
+            concurrency: Maximum number of in-flight requests (default: 16)
+
+        Returns:
+            SearchResponse for each request, in input order
+
+        Raises:
+            ValueError: If concurrency is not positive or any request is invalid
+                (see asearch_data)
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        # Validate everything before sending anything
+        for request in search_requests:
+            Client._search_request_to_dict(request)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search(request: SearchRequest) -> SearchResponse:
+            async with semaphore:
+                return await self.asearch_data(request)
+
+        return list(await asyncio.gather(*[search(r) for r in search_requests]))
+
+    # Oplog Operations
+    async def aget_oplog_entries(
+        self,
+        collection: str,
+        after_lsn: int,
+        limit: int = 0,
+        wait_ms: Optional[int] = None,
+    ) -> GetOplogResponse:
+        """
+        Retrieve oplog entries after a specific LSN for replica synchronization.
+
+        Args:
+            collection: Collection name (empty string for all collections)
+            after_lsn: LSN after which to retrieve oplog entries
+            limit: Maximum number of oplog entries to retrieve (optional)
+            wait_ms: Long-poll for up to this many milliseconds while there
+                are no new entries (optional)
+
+        Returns:
+            GetOplogResponse with oplog entries
+        """
+        params = Client._oplog_params(collection, after_lsn, limit, wait_ms)
+        timeout = None
+        if wait_ms is not None:
+            # Leave the server the whole wait before the read times out
+            timeout = self.timeout + wait_ms / 1000
+
+        data = await self._request(
+            "GET", "/api/oplog/v1/", params=params, timeout=timeout
+        )
+        return GetOplogResponse(**data)
+
+    async def aregister_replica(self, replica_id: str) -> GenericResponse:
+        """
+        Register a replica for oplog retention tracking.
+
+        Args:
+            replica_id: Replica identifier
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = {"replica_id": replica_id}
+        return await self._request_model(
+            GenericResponse, "POST", "/api/oplog/v1/register", json_data=json_data
+        )
+
+    async def aunregister_replica(self, replica_id: str) -> GenericResponse:
+        """
+        Unregister a replica for oplog retention tracking.
+
+        Args:
+            replica_id: Replica identifier
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = {"replica_id": replica_id}
+        return await self._request_model(
+            GenericResponse,
+            "POST",
+            "/api/oplog/v1/unregister",
+            json_data=json_data,
+        )
+
+    async def aget_oplog_status(self, collection: str) -> OplogStatusResponse:
+        """
+        Retrieve current oplog status and statistics for a collection.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            OplogStatusResponse with oplog status
+        """
+        params = {"collection": collection}
+        return await self._request_model(
+            OplogStatusResponse, "GET", "/api/oplog/v1/status", params=params
+        )
@@ -0,0 +1,283 @@
+"""Asynchronous Shilp Discovery API Client implementation built on httpx."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+from shilp.client import _dumps, _loads
+from shilp.discovery_client import _ENDPOINTS, DiscoveryClient, _write_response
+from shilp.exceptions import _api_error
+from shilp.models import (
+    GenericResponse,
+    DiscoveryStats,
+    ReplicaType,
+)
+
+
+class AsyncDiscoveryClient:
+    """Asynchronous client for the Shilp Discovery API.
+
+    Independent calls can be issued concurrently, e.g. registering many
+    replicas with `aregister_shilp_services` or fetching stats for several
+    accounts with ``asyncio.gather``. With HTTP/2 they are multiplexed over
+    one connection instead of queueing for pooled HTTP/1.1 connections,
+    and repeated headers are compressed. Requires the ``async`` extra
+    (``pip install shilp-sdk[async]``).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        http2: bool = True,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+    ):
+        """
+        Initialize the asynchronous Shilp Discovery API client.
+
+        Args:
+            base_url: Base URL of the Shilp Discovery server
+            timeout: Request timeout in seconds (default: 30)
+            http_client: Optional custom httpx.AsyncClient instance
+            http2: Whether to negotiate HTTP/2 (default: True)
+            max_connections: Maximum number of pooled connections (default: 64)
+            max_keepalive_connections: Maximum idle keep-alive connections (default: 32)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncDiscoveryClient requires httpx; install it with `pip install shilp-sdk[async]`"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._urls = {name: self.base_url + path for name, path in _ENDPOINTS.items()}
+        self._http = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncDiscoveryClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Perform an HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: Name of the API endpoint in _ENDPOINTS
+            json_data: JSON data to send in request body
+            params: Query parameters
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        content = await self._request_content(method, endpoint, json_data, params)
+        return _loads(content) if content else {}
+
+    async def _request_content(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Perform an HTTP request and return the undecoded response body.
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        headers = None
+        body = None
+        if json_data is not None:
+            headers = {"Content-Type": "application/json"}
+            body = _dumps(json_data)
+
+        response = await self._http.request(
+            method,
+            self._urls[endpoint],
+            content=body,
+            params=params,
+            headers=headers,
+        )
+
+        if response.status_code >= 400:
+            raise _api_error(response)
+
+        # Success responses with no body (e.g. 204 from register/unregister)
+        if response.status_code == 204 or response.headers.get("Content-Length") == "0":
+            return b""
+        return response.content
+
+    async def _write(
+        self, method: str, endpoint: str, json_data: Dict[str, Any]
+    ) -> GenericResponse:
+        """Send a discovery write and build its GenericResponse."""
+        content = await self._request_content(method, endpoint, json_data=json_data)
+        return _write_response(content)
+
+    async def aget_shilp_stats(self, account_id: str) -> DiscoveryStats:
+        """
+        Get statistics for Shilp services.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            DiscoveryStats with service statistics
+        """
+        params = {"account_id": account_id}
+        content = await self._request_content("GET", "shilp_stats", params=params)
+        return DiscoveryClient._decode_shilp_stats(content)
+
+    async def aupdate_shilp_sync_status(
+        self, account_id: str, address: str, status: str
+    ) -> GenericResponse:
+        """
+        Update the sync status of a Shilp service.
+
+        Args:
+            account_id: Account identifier
+            address: Service address
+            status: Sync status (SyncStatus.READY or SyncStatus.SYNCING)
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = {
+            "account_id": account_id,
+            "address": address,
+            "status": status,
+        }
+        return await self._write("PUT", "shilp_sync", json_data)
+
+    async def aregister_shilp_service(
+        self, account_id: str, address: str, service_id: str, replica_type: ReplicaType
+    ) -> GenericResponse:
+        """
+        Register a Shilp service with the discovery system.
+
+        Args:
+            account_id: Account identifier
+            address: Service address
+            service_id: Service identifier
+            replica_type: Type of replica (READ_REPLICA, WRITE_REPLICA, or SINGLE_NODE)
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = DiscoveryClient._shilp_service_to_dict(
+            account_id, address, service_id, replica_type
+        )
+        return await self._write("POST", "shilp_register", json_data)
+
+    async def aregister_shilp_services(
+        self, services: List[Dict[str, Any]], concurrency: int = 16
+    ) -> List[GenericResponse]:
+        """
+        Register several Shilp services concurrently.
+
+        Args:
+            services: Keyword arguments for aregister_shilp_service, one dict
+                per service (account_id, address, service_id, replica_type)
+            concurrency: Maximum number of in-flight requests (default: 16)
+
+        Returns:
+            GenericResponse for each service, in input order
+
+        Raises:
+            ValueError: If concurrency is not positive
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def register(service: Dict[str, Any]) -> GenericResponse:
+            async with semaphore:
+                return await self.aregister_shilp_service(**service)
+
+        return list(await asyncio.gather(*[register(s) for s in services]))
+
+    async def aunregister_shilp_service(
+        self, account_id: str, address: str, service_id: str, replica_type: ReplicaType
+    ) -> GenericResponse:
+        """
+        Unregister a Shilp service from the discovery system.
+
+        Args:
+            account_id: Account identifier
+            address: Service address
+            service_id: Service identifier
+            replica_type: Type of replica (READ_REPLICA, WRITE_REPLICA, or SINGLE_NODE)
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = DiscoveryClient._shilp_service_to_dict(
+            account_id, address, service_id, replica_type
+        )
+        return await self._write("DELETE", "shilp_unregister", json_data)
+
+    async def aregister_tei_service(
+        self, account_id: str, address: str, service_id: str
+    ) -> GenericResponse:
+        """
+        Register a TEI (Text Embedding Inference) service.
+
+        Args:
+            account_id: Account identifier
+            address: Service address
+            service_id: Service identifier
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = DiscoveryClient._tei_service_to_dict(account_id, address, service_id)
+        return await self._write("POST", "tei_register", json_data)
+
+    async def aunregister_tei_service(
+        self, account_id: str, address: str, service_id: str
+    ) -> GenericResponse:
+        """
+        Unregister a TEI (Text Embedding Inference) service.
+
+        Args:
+            account_id: Account identifier
+            address: Service address
+            service_id: Service identifier
+
+        Returns:
+            GenericResponse indicating success or failure
+        """
+        json_data = DiscoveryClient._tei_service_to_dict(account_id, address, service_id)
+        return await self._write("DELETE", "tei_unregister", json_data)
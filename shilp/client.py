@@ -1,20 +1,52 @@
 """Shilp API Client implementation."""
 
 import json
+import logging
+import os
 import requests
-from typing import Any, Dict, List, Optional, BinaryIO, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from typing import Any, Dict, List, Optional, BinaryIO, Callable, Iterator, Tuple, Type, TypeVar, Union
 from io import IOBase
-from urllib.parse import urljoin, quote
+from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without the extra
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ijson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # pragma: no cover - exercised only without the extra
+    MultipartEncoder = None
+
+from shilp.exceptions import NotFoundError, ShilpError, _api_error
 from shilp.models import (
     GenericResponse,
     HealthResponse,
     ListCollectionsResponse,
     Collection,
+    MetadataColumnSchema,
     MetadataSupportInfo,
     AddCollectionRequest,
     InsertRecordRequest,
     InsertRecordResponse,
+    BulkInsertRequest,
+    BulkInsertResponse,
     IngestRequest,
     IngestResponse,
     ListIngestionSourcesResponse,
@@ -54,6 +86,7 @@ from shilp.models import (
     RegisterReplicaRequest,
     UnRegisterReplicaRequest,
     StorageBackendType,
+    AttrType,
     FuzzyAlgo,
     GetSettingsResponse,
     Settings,
@@ -73,16 +106,236 @@ from shilp.models import (
     CollectionModel,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode array-likes (e.g. numpy arrays, array.array) as JSON lists."""
+    tolist = getattr(obj, "tolist", None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return tolist()
+
+
+if orjson is not None:
+    # numpy arrays are encoded natively, without a Python-level tolist() copy
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj, default=_json_default).encode("utf-8")
+
+    _loads = json.loads
+
+# Connection pool sizing and retry policy for sessions created by the client
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 64
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=[502, 503, 504],
+    raise_on_status=False,
+)
+
+
+# Accepted SearchRequest.fuzzy_algo values
+_FUZZY_ALGOS = (FuzzyAlgo.LEVENSHTEIN, FuzzyAlgo.JARO_WINKLER)
+
+# Optional request attributes sent only when set, in wire order
+_INGEST_FIELDS = (
+    # Source configuration
+    "file_path",
+    "source_type",
+    # MongoDB source configuration
+    "database_name",
+    "mongo_collection",
+    "query",
+    "mongo_fetch_batch_size",
+    # Common configuration
+    "fields",
+    "keyword_fields",
+    "metadata_fields",
+    "id_field",
+    "expiry_field",
+    "embedding_provider",
+    "embedding_model",
+    "ingestion_batch_size",
+)
+_INSERT_RECORD_FIELDS = (
+    "expiry",
+    "id",
+    "metadata_fields",
+    "embedding_provider",
+    "fields",
+    "keyword_fields",
+    "vectors",
+    "model",
+    "array_fields",
+)
+_SEARCH_FIELDS = (
+    "fields",
+    "limit",
+    "weights",
+    "max_distance",
+    "vector_query",
+    "use_nli",
+    "queries",
+    "vector_queries",
+    "fuzzy_algo",
+)
+_ADD_COLLECTION_FIELDS = ("storage_type", "reference_storage_type")
+
+
+def _only_set(obj: Any, names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build a dict of the named attributes of obj that are not None."""
+    json_data = {}
+    for name in names:
+        value = getattr(obj, name)
+        if value is not None:
+            json_data[name] = value
+    return json_data
+
+
+@lru_cache(maxsize=256)
+def _debug_field_path(collection_name: str, field: str) -> str:
+    """Path prefix of the debug endpoints for one field of a collection."""
+    return f"/api/collections/v1/debug/{collection_name}/{field}"
+
+
+# Read size for streamed event responses; iter_lines' default is 512 bytes
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_stream_lines(response: requests.Response) -> Iterator[str]:
+    """Yield the non-empty lines of a streamed event response as text."""
+    # Split the raw bytes, which only breaks on \n and \r, and decode each
+    # line as UTF-8 afterwards. Decoded chunks would be split with
+    # str.splitlines(), which also breaks on U+0085, U+2028 and other
+    # separators that may appear inside JSON string values.
+    for line in response.iter_lines(chunk_size=_STREAM_CHUNK_SIZE):
+        if line:
+            yield line.decode("utf-8")
+
+
+class _MembersByValue(dict):
+    """Map values to enum members with a dict lookup instead of an Enum call.
+
+    Values that are not members are passed to the enum itself, so invalid
+    values still raise ValueError and _missing_ hooks still apply.
+    """
+
+    def __init__(self, enum: type):
+        super().__init__((member.value, member) for member in enum)
+        self._enum = enum
+
+    def __missing__(self, value: Any) -> Any:
+        return self._enum(value)
+
+
+_STORAGE_BACKEND_BY_VALUE = _MembersByValue(StorageBackendType)
+_ATTR_TYPE_BY_VALUE = _MembersByValue(AttrType)
+
+# Typed decoder that builds ListCollectionsResponse straight from the response
+# bytes, skipping the intermediate dicts, when msgspec is installed
+_LIST_COLLECTIONS_DECODER = (
+    msgspec.json.Decoder(ListCollectionsResponse) if msgspec is not None else None
+)
+
+
+_M = TypeVar("_M")
+
+
+@lru_cache(maxsize=None)
+def _model_decoder(model: type) -> "msgspec.json.Decoder":
+    """Typed msgspec decoder for a response model, built once per model."""
+    return msgspec.json.Decoder(model)
+
+
+@lru_cache(maxsize=None)
+def _model_field_names(model: type) -> frozenset:
+    """Names of a response model's fields, computed once per model."""
+    return frozenset(f.name for f in fields(model))
+
+
+def _decode_model(model: Type[_M], content: bytes) -> _M:
+    """
+    Decode a response body into a model whose fields are all JSON scalars.
+
+    With msgspec installed the model is built straight from the bytes.
+    Without it, or for bodies that do not match the declared field types, it
+    is built from the decoded dict. Either way, keys the model does not
+    declare are ignored, so new server fields do not break older clients.
+    """
+    if msgspec is not None and content:
+        try:
+            return _model_decoder(model).decode(content)
+        except msgspec.DecodeError:
+            pass
+    return _model_from_dict(model, _loads(content) if content else {})
+
+
+def _model_from_dict(model: Type[_M], data: Dict[str, Any]) -> _M:
+    """Build a flat response model from a decoded dict, ignoring unknown keys."""
+    names = _model_field_names(model)
+    return model(**{k: v for k, v in data.items() if k in names})
+
+
+def _is_transient(exc: requests.RequestException) -> bool:
+    """Whether a failed request may succeed if sent again."""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = exc.response
+    return response is not None and response.status_code >= 500
+
+
+def _new_session() -> requests.Session:
+    """Create a session with a pooled, retrying adapter for http and https."""
+    session = requests.Session()
+    # Advertise every encoding urllib3 can decode here, which includes zstd
+    # and br when zstandard and brotli are installed
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=_RETRY,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class Client:
     """Client for the Shilp API."""
 
+    __slots__ = (
+        "base_url",
+        "timeout",
+        "_owns_session",
+        "session",
+        "auth_token",
+        "_bulk_insert_supported",
+        "_batch_search_supported",
+        "_executors",
+        "_url_prefix",
+        "_etag_cache",
+        "_schema_cache",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         base_url: str,
         timeout: int = 30,
         session: Optional[requests.Session] = None,
         auth_token: Optional[str] = None,
+        cache_schemas: bool = False,
     ):
         """
         Initialize the Shilp API client.
@@ -92,11 +345,43 @@ class Client:
             timeout: Request timeout in seconds (default: 30)
             session: Optional custom requests.Session instance
             auth_token: Optional auth token to send as Bearer token
+            cache_schemas: Leave metadata_fields out of inserts once this client
+                has sent the same schema for the collection (default: False).
+                Only enable it when no other client changes the collections'
+                schemas, since the server's copy is not checked.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self._owns_session = session is None
+        self.session = session or _new_session()
         self.auth_token = auth_token
+        self._bulk_insert_supported = True
+        self._batch_search_supported = True
+        # max_workers -> thread pool reused by search_data_many's fallback
+        self._executors: Dict[int, ThreadPoolExecutor] = {}
+        self._url_prefix = self.base_url
+        # Path -> (ETag, parsed response) for conditional GETs
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+        # Metadata schema last sent per collection, when cache_schemas is set;
+        # the server keeps it, so later inserts with the same schema omit it
+        self._schema_cache: Optional[Dict[str, Dict[str, AttrType]]] = (
+            {} if cache_schemas else None
+        )
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections and worker threads held by the client."""
+        executors = list(self._executors.values())
+        self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=True)
+        if self._owns_session:
+            self.session.close()
 
     def set_auth_token(self, token: str) -> None:
         """Set auth token used in Authorization header for API calls."""
@@ -108,12 +393,19 @@ class Client:
             return None
         return {"Authorization": f"Bearer {self.auth_token}"}
 
+    def _url(self, path: str) -> str:
+        """Build the absolute URL for an API path."""
+        if path.startswith("/"):
+            return self._url_prefix + path
+        return self._url_prefix + "/" + path
+
     def _request(
         self,
         method: str,
         path: str,
-        json_data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Union[Dict[str, Any], bytes]] = None,
         params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Perform an HTTP request.
@@ -121,39 +413,128 @@ class Client:
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             path: API endpoint path
-            json_data: JSON data to send in request body
+            json_data: JSON data to send in request body, or an already
+                serialized JSON document as bytes
             params: Query parameters
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Response JSON as dictionary
 
         Raises:
-            requests.HTTPError: If the request fails
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        content = self._request_content(method, path, json_data, params, timeout)
+        return _loads(content) if content else {}
+
+    def _request_content(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Perform an HTTP request and return the undecoded response body.
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
         """
-        url = urljoin(self.base_url, path)
+        headers, body = self._encode_body(json_data)
 
         response = self.session.request(
             method=method,
-            url=url,
-            json=json_data,
+            url=self._url(path),
+            data=body,
             params=params,
-            headers=self._build_auth_headers(),
-            timeout=self.timeout,
+            headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
         )
 
         if response.status_code >= 400:
-            raise requests.HTTPError(
-                f"API error: {response.text} (status: {response.status_code})",
-                response=response,
-            )
+            raise _api_error(response)
+
+        return response.content
+
+    def _request_model(
+        self,
+        model: Type[_M],
+        method: str,
+        path: str,
+        json_data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> _M:
+        """
+        Perform an HTTP request and decode the response into a flat model.
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        return _decode_model(model, self._request_content(method, path, json_data, params))
+
+    def _get_cached(self, path: str, parse: Callable[[Dict[str, Any]], Any]) -> Any:
+        """
+        Perform a conditional GET, reusing the last parsed response on 304.
+
+        The ETag of the last response for path is sent as If-None-Match. When
+        the server answers 304 Not Modified, the object parse built from that
+        response is returned again without reading or decoding a body.
+
+        Args:
+            path: API endpoint path
+            parse: Builds the typed response from the decoded JSON
+
+        Returns:
+            The parsed response
 
-        return response.json() if response.content else {}
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        cached = self._etag_cache.get(path)
+        headers = self._build_auth_headers()
+        if cached is not None:
+            headers = headers or {}
+            headers["If-None-Match"] = cached[0]
+
+        response = self.session.request(
+            method="GET",
+            url=self._url(path),
+            headers=headers,
+            timeout=self.timeout,
+        )
+
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        if response.status_code >= 400:
+            raise _api_error(response)
+
+        result = parse(_loads(response.content) if response.content else {})
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            self._etag_cache[path] = (etag, result)
+        else:
+            self._etag_cache.pop(path, None)
+        return result
+
+    def _encode_body(
+        self, json_data: Optional[Union[Dict[str, Any], bytes]]
+    ) -> Tuple[Optional[Dict[str, str]], Optional[bytes]]:
+        """Build request headers and the serialized JSON body."""
+        headers = self._build_auth_headers()
+        if json_data is None:
+            return headers, None
+        headers = headers or {}
+        headers["Content-Type"] = "application/json"
+        if isinstance(json_data, bytes):
+            return headers, json_data
+        return headers, _dumps(json_data)
 
     def _request_file_response(
         self,
         method: str,
         path: str,
-        json_data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Union[Dict[str, Any], bytes]] = None,
         params: Optional[Dict[str, Any]] = None,
     ) -> BinaryIO:
         """
@@ -162,34 +543,49 @@ class Client:
         Args:
             method: HTTP method
             path: API endpoint path
-            json_data: JSON data to send in request body
+            json_data: JSON data to send in request body, or an already
+                serialized JSON document as bytes
             params: Query parameters
 
         Returns:
             Response content as binary stream
 
         Raises:
-            requests.HTTPError: If the request fails
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        response = self._request_stream(method, path, json_data, params)
+        # Undo any Content-Encoding while streaming so callers read plain bytes
+        response.raw.decode_content = True
+        return response.raw
+
+    def _request_stream(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """
+        Perform an HTTP request without reading the response body.
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
         """
-        url = urljoin(self.base_url, path)
+        headers, body = self._encode_body(json_data)
 
         response = self.session.request(
             method=method,
-            url=url,
-            json=json_data,
+            url=self._url(path),
+            data=body,
             params=params,
-            headers=self._build_auth_headers(),
+            headers=headers,
             timeout=self.timeout,
             stream=True,
         )
 
         if response.status_code >= 400:
-            raise requests.HTTPError(
-                f"API error: {response.text} (status: {response.status_code})",
-                response=response,
-            )
-
-        return response.raw
+            raise _api_error(response)
+        return response
 
     def _upload_file(self, path: str, file_path: str) -> Dict[str, Any]:
         """
@@ -203,37 +599,62 @@ class Client:
             Response JSON as dictionary
 
         Raises:
-            requests.HTTPError: If the request fails
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
         """
-        url = urljoin(self.base_url, path)
+        url = self._url(path)
 
         with open(file_path, "rb") as f:
-            files = {"file": f}
-            response = self.session.post(
-                url=url,
-                files=files,
-                headers=self._build_auth_headers(),
-                timeout=self.timeout,
-            )
+            if MultipartEncoder is not None:
+                # Stream the file with a fixed Content-Length rather than
+                # building the whole multipart body in memory
+                encoder = MultipartEncoder(
+                    fields={
+                        "file": (
+                            os.path.basename(file_path),
+                            f,
+                            "application/octet-stream",
+                        )
+                    }
+                )
+                headers = self._build_auth_headers() or {}
+                headers["Content-Type"] = encoder.content_type
+                response = self.session.post(
+                    url=url,
+                    data=encoder,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
+            else:
+                files = {"file": f}
+                response = self.session.post(
+                    url=url,
+                    files=files,
+                    headers=self._build_auth_headers(),
+                    timeout=self.timeout,
+                )
 
         if response.status_code >= 400:
-            raise requests.HTTPError(
-                f"API error: {response.text} (status: {response.status_code})",
-                response=response,
-            )
+            raise _api_error(response)
 
-        return response.json() if response.content else {}
+        return _loads(response.content) if response.content else {}
 
     # Health Check
     def health_check(self) -> HealthResponse:
         """
         Perform a health check on the API.
 
+        The ETag of the last response is sent back as If-None-Match, so servers
+        that support it answer repeated polls (e.g. readiness loops) with a
+        bodyless 304 and the cached response is returned. Servers without ETag
+        support are unaffected.
+
         Returns:
             HealthResponse with success status and version
+
+        Raises:
+            ShilpError: If the request fails
         """
-        data = self._request("GET", "/health")
-        return HealthResponse(**data)
+        return self._get_cached("/health", lambda data: _model_from_dict(HealthResponse, data))
 
     # Collection Management
     def list_collections(self) -> ListCollectionsResponse:
@@ -243,42 +664,109 @@ class Client:
         Returns:
             ListCollectionsResponse containing list of collections
         """
-        data = self._request("GET", "/api/collections/v1/")
-        # Convert nested collections
-        if "data" in data:
-            data["data"] = [
+        content = self._request_content("GET", "/api/collections/v1/")
+        return self._decode_list_collections(content)
+
+    def iter_collections(self, page_size: int = 500) -> Iterator[Collection]:
+        """
+        Iterate over all collections, fetching one page at a time.
+
+        Pages are requested with `cursor`/`limit` query parameters and followed
+        through the `next_cursor` of each response. Servers that return every
+        collection at once simply yield a single page.
+
+        Args:
+            page_size: Maximum number of collections fetched per request (default: 500)
+
+        Yields:
+            Collection objects
+        """
+        params: Dict[str, Any] = {"limit": page_size}
+        while True:
+            content = self._request_content("GET", "/api/collections/v1/", params=params)
+            page = self._decode_list_collections(content)
+            yield from page.data
+            if not page.next_cursor:
+                return
+            params = {"limit": page_size, "cursor": page.next_cursor}
+
+    def collection_exists(self, name: str) -> bool:
+        """
+        Check whether a collection exists.
+
+        Args:
+            name: Name of the collection
+
+        Returns:
+            True if a collection with this name exists
+        """
+        return any(c.name == name for c in self.list_collections().data)
+
+    @staticmethod
+    def _decode_list_collections(content: bytes) -> ListCollectionsResponse:
+        """Decode a list collections response body to typed model."""
+        if _LIST_COLLECTIONS_DECODER is not None:
+            try:
+                return _LIST_COLLECTIONS_DECODER.decode(content)
+            except msgspec.DecodeError:
+                # Payloads that do not match the declared types (e.g. null
+                # lists) still parse through the lenient path below
+                pass
+        return Client._parse_list_collections(_loads(content) if content else {})
+
+    @staticmethod
+    def _parse_list_collections(data: Dict[str, Any]) -> ListCollectionsResponse:
+        """Parse list collections payload to typed model in a single pass."""
+        storage_type = _STORAGE_BACKEND_BY_VALUE
+        attr_type = _ATTR_TYPE_BY_VALUE
+        file_storage = StorageBackendType.FILE
+        metadata_info = data.get("metadata_info")
+        return ListCollectionsResponse(
+            success=data["success"],
+            message=data["message"],
+            # Positional arguments follow Collection's field order
+            data=[
                 Collection(
-                    name=c["name"],
-                    is_loaded=c["is_loaded"],
-                    fields=c["fields"],
-                    searchable_fields=c["searchable_fields"],
-                    metadata=c.get("metadata"),
-                    has_metadata_enabled=c.get("has_metadata_enabled", False),
-                    no_reference_storage=c.get("no_reference_storage", False),
-                    storage_type=StorageBackendType(c.get("storage_type", 0)),
-                    reference_storage_type=StorageBackendType(
-                        c.get("reference_storage_type", 0)
+                    c["name"],
+                    c["is_loaded"],
+                    c["fields"],
+                    c["searchable_fields"],
+                    (
+                        [
+                            MetadataColumnSchema(m["name"], attr_type[m["type"]])
+                            for m in c["metadata"]
+                        ]
+                        if c.get("metadata") is not None
+                        else None
                     ),
-                    is_pq_enabled=c.get("is_pq_enabled", False),
-                    field_config=c.get("field_config"),
-                    is_nli_enabled=c.get("is_nli_enabled"),
-                    nli_domain=c.get("nli_domain"),
-                    total_no_of_documents=c.get("total_no_of_documents", 0),
+                    c.get("has_metadata_enabled", False),
+                    c.get("no_reference_storage", False),
+                    storage_type[c.get("storage_type", file_storage)],
+                    storage_type[c.get("reference_storage_type", file_storage)],
+                    c.get("is_pq_enabled", False),
+                    c.get("field_config"),
+                    c.get("is_nli_enabled"),
+                    c.get("nli_domain"),
+                    c.get("total_no_of_documents", 0),
                 )
                 for c in data["data"]
-            ]
-        # Convert metadata_info
-        if "metadata_info" in data and data["metadata_info"]:
-            data["metadata_info"] = [
-                MetadataSupportInfo(
-                    support_metadata=m["support_metadata"],
-                    name=m["name"],
-                    type=StorageBackendType(m["type"]),
-                    is_default=m["is_default"],
-                )
-                for m in data["metadata_info"]
-            ]
-        return ListCollectionsResponse(**data)
+            ],
+            metadata_info=(
+                [
+                    MetadataSupportInfo(
+                        m["support_metadata"],
+                        m["name"],
+                        storage_type[m["type"]],
+                        m["is_default"],
+                    )
+                    for m in metadata_info
+                ]
+                if metadata_info
+                else metadata_info
+            ),
+            is_nli_supported=data.get("is_nli_supported", False),
+            next_cursor=data.get("next_cursor"),
+        )
 
     def add_collection(self, request: AddCollectionRequest) -> GenericResponse:
         """
@@ -290,18 +778,24 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
+        json_data = self._add_collection_to_dict(request)
+        response = self._request_model(
+            GenericResponse, "POST", "/api/collections/v1/", json_data=json_data
+        )
+        self._forget_schema(request.name)
+        return response
+
+    @staticmethod
+    def _add_collection_to_dict(request: AddCollectionRequest) -> Dict[str, Any]:
+        """Serialize an add collection request."""
         json_data = {
             "name": request.name,
             "no_reference_storage": request.no_reference_storage,
             "has_metadata_storage": request.has_metadata_storage,
             "enable_pq": request.enable_pq,
         }
-        if request.storage_type is not None:
-            json_data["storage_type"] = request.storage_type
-        if request.reference_storage_type is not None:
-            json_data["reference_storage_type"] = request.reference_storage_type
-        data = self._request("POST", "/api/collections/v1/", json_data=json_data)
-        return GenericResponse(**data)
+        json_data.update(_only_set(request, _ADD_COLLECTION_FIELDS))
+        return json_data
 
     def drop_collection(self, name: str) -> GenericResponse:
         """
@@ -312,9 +806,15 @@ class Client:
 
         Returns:
             GenericResponse indicating success or failure
+
+        Raises:
+            NotFoundError: If the collection does not exist
         """
-        data = self._request("DELETE", f"/api/collections/v1/{name}")
-        return GenericResponse(**data)
+        response = self._request_model(
+            GenericResponse, "DELETE", f"/api/collections/v1/{name}"
+        )
+        self._forget_schema(name)
+        return response
 
     def rename_collection(self, old_name: str, new_name: str) -> GenericResponse:
         """
@@ -327,8 +827,12 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request("PUT", f"/api/collections/v1/{old_name}/rename/{new_name}")
-        return GenericResponse(**data)
+        response = self._request_model(
+            GenericResponse, "PUT", f"/api/collections/v1/{old_name}/rename/{new_name}"
+        )
+        self._forget_schema(old_name)
+        self._forget_schema(new_name)
+        return response
 
     def load_collection(self, name: str) -> GenericResponse:
         """
@@ -340,8 +844,9 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request("POST", f"/api/collections/v1/{name}/load")
-        return GenericResponse(**data)
+        return self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{name}/load"
+        )
 
     def unload_collection(self, name: str) -> GenericResponse:
         """
@@ -353,8 +858,9 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request("POST", f"/api/collections/v1/{name}/unload")
-        return GenericResponse(**data)
+        return self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{name}/unload"
+        )
 
     def flush_collection(self, name: str) -> GenericResponse:
         """
@@ -366,8 +872,9 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request("POST", f"/api/collections/v1/{name}/flush")
-        return GenericResponse(**data)
+        return self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{name}/flush"
+        )
 
     def enable_metadata_store(
         self,
@@ -394,6 +901,7 @@ class Client:
             f"/api/collections/v1/{collection_name}/metadata/enable",
             json_data=json_data,
         )
+        self._forget_schema(collection_name)
         return EnableMetadataStoreResponse(**data)
 
     def list_collection_models(self) -> ListCollectionsModelsResponse:
@@ -508,43 +1016,37 @@ class Client:
         Note:
             This is a blocking call that streams events until connection closes.
         """
-        url = urljoin(
-            self.base_url,
-            f"/api/collections/v1/{quote(collection_name, safe='')}/models/update",
+        url = self._url(
+            f"/api/collections/v1/{quote(collection_name, safe='')}/models/update"
         )
         response = self.session.post(url, stream=True, timeout=self.timeout)
 
         if response.status_code >= 400:
-            raise requests.HTTPError(
-                f"API error: {response.text} (status: {response.status_code})",
-                response=response,
+            raise _api_error(response)
+
+        for line_str in _iter_stream_lines(response):
+            # Skip SSE event type lines
+            if line_str.startswith("event:"):
+                continue
+            # Handle SSE format with 'data: ' prefix
+            if line_str.startswith("data: "):
+                line_str = line_str[6:]  # Remove 'data: ' prefix
+            else:
+                # Skip lines that don't start with 'data:'
+                continue
+            # Skip empty data or comment lines
+            if not line_str or line_str.startswith(":"):
+                continue
+            event_data = _loads(line_str)
+            event = UpdateModelsEvent(
+                status=event_data.get("status"),
+                message=event_data.get("message"),
+                field=event_data.get("field"),
+                total=event_data.get("total"),
+                current=event_data.get("current"),
+                error=event_data.get("error"),
             )
-
-        for line in response.iter_lines():
-            if line:
-                line_str = line.decode("utf-8")
-                # Skip SSE event type lines
-                if line_str.startswith("event:"):
-                    continue
-                # Handle SSE format with 'data: ' prefix
-                if line_str.startswith("data: "):
-                    line_str = line_str[6:]  # Remove 'data: ' prefix
-                else:
-                    # Skip lines that don't start with 'data:'
-                    continue
-                # Skip empty data or comment lines
-                if not line_str or line_str.startswith(":"):
-                    continue
-                event_data = json.loads(line_str)
-                event = UpdateModelsEvent(
-                    status=event_data.get("status"),
-                    message=event_data.get("message"),
-                    field=event_data.get("field"),
-                    total=event_data.get("total"),
-                    current=event_data.get("current"),
-                    error=event_data.get("error"),
-                )
-                callback(event)
+            callback(event)
 
     def reindex_collection(self, name: str) -> GenericResponse:
         """
@@ -556,8 +1058,9 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request("PUT", f"/api/collections/v1/{name}/reindex")
-        return GenericResponse(**data)
+        return self._request_model(
+            GenericResponse, "PUT", f"/api/collections/v1/{name}/reindex"
+        )
 
     def pq_train(self, collection_name: str) -> GenericResponse:
         """
@@ -569,8 +1072,9 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request("POST", f"/api/collections/v1/{collection_name}/pq-train")
-        return GenericResponse(**data)
+        return self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{collection_name}/pq-train"
+        )
 
     def delete_record(self, collection_name: str, record_id: str) -> GenericResponse:
         """
@@ -583,10 +1087,9 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request(
-            "DELETE", f"/api/collections/v1/{collection_name}/{record_id}"
+        return self._request_model(
+            GenericResponse, "DELETE", f"/api/collections/v1/{collection_name}/{record_id}"
         )
-        return GenericResponse(**data)
 
     def expiry_cleanup(self, collection_name: str) -> GenericResponse:
         """
@@ -598,10 +1101,9 @@ class Client:
         Returns:
             GenericResponse indicating success or failure
         """
-        data = self._request(
-            "POST", f"/api/collections/v1/{collection_name}/expiry-cleanup"
+        return self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/{collection_name}/expiry-cleanup"
         )
-        return GenericResponse(**data)
 
     def export_collection(self, name: str) -> BinaryIO:
         """
@@ -616,10 +1118,40 @@ class Client:
         Example:
             with client.export_collection("my-collection") as f:
                 with open("export.bin", "wb") as out:
-                    out.write(f.read())
+                    shutil.copyfileobj(f, out, length=1024 * 1024)
         """
         return self._request_file_response("POST", f"/api/collections/v1/{name}/export")
 
+    def export_collection_chunks(
+        self, name: str, chunk_size: int = 1024 * 1024
+    ) -> Iterator[bytes]:
+        """
+        Export a collection as an iterator of decoded byte chunks.
+
+        The export request is sent immediately; the body is then read
+        chunk_size bytes at a time, with any Content-Encoding undone, and the
+        connection is released once the iterator is exhausted.
+
+        Args:
+            name: Name of the collection to export
+            chunk_size: Number of bytes per chunk (default: 1 MiB)
+
+        Returns:
+            Iterator over the exported bytes
+
+        Example:
+            with open("export.bin", "wb") as out:
+                for chunk in client.export_collection_chunks("my-collection"):
+                    out.write(chunk)
+        """
+        response = self._request_stream("POST", f"/api/collections/v1/{name}/export")
+
+        def chunks() -> Iterator[bytes]:
+            with response:
+                yield from response.iter_content(chunk_size=chunk_size)
+
+        return chunks()
+
     def import_collection(self, file_path: str) -> GenericResponse:
         """
         Import a collection from a file.
@@ -631,41 +1163,313 @@ class Client:
             GenericResponse indicating success or failure
         """
         data = self._upload_file("/api/collections/v1/import", file_path)
+        # The imported collection's name is only known to the server
+        self._forget_schema()
         return GenericResponse(**data)
 
+    def import_collection_chunked(
+        self,
+        file_path: str,
+        chunk_size_mb: int = 30,
+        parallel: int = 4,
+        max_retries: int = 3,
+    ) -> GenericResponse:
+        """
+        Import a collection from a file, uploading it in independently retried chunks.
+
+        An upload session is opened on the server, chunks are sent
+        concurrently with their byte offset, and the session is then
+        completed. A chunk that fails with a connection error or a 5xx
+        response is retried on its own instead of restarting the whole
+        upload; other errors, such as 4xx responses, are raised at once. If
+        the server does not support chunked imports, this falls back to
+        import_collection.
+
+        Args:
+            file_path: Path to the exported collection file
+            chunk_size_mb: Size of each chunk in MiB (default: 30)
+            parallel: Maximum number of chunks in flight (default: 4)
+            max_retries: Attempts per chunk before giving up (default: 3)
+
+        Returns:
+            GenericResponse indicating success or failure
+
+        Raises:
+            ValueError: If chunk_size_mb, parallel or max_retries is not positive
+            ShilpError: If the server's init reply has no upload_id, a chunk is
+                rejected, or a chunk still fails after max_retries attempts
+        """
+        if chunk_size_mb <= 0 or parallel <= 0 or max_retries <= 0:
+            raise ValueError("chunk_size_mb, parallel and max_retries must be positive")
+
+        size = os.path.getsize(file_path)
+        try:
+            data = self._request(
+                "POST",
+                "/api/collections/v1/import/init",
+                json_data={"filename": os.path.basename(file_path), "size": size},
+            )
+        except NotFoundError:
+            logger.debug("chunked import endpoint not found, uploading in one request")
+            return self.import_collection(file_path)
+        upload_id = data.get("upload_id")
+        if upload_id is None:
+            raise ShilpError("chunked import init response has no upload_id field")
+
+        chunk_size = chunk_size_mb * 1024 * 1024
+
+        def upload(offset: int) -> None:
+            # Each chunk has its own handle, so at most `parallel` chunks are
+            # held in memory at once
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read(chunk_size)
+            for attempt in range(1, max_retries + 1):
+                try:
+                    self._upload_chunk(upload_id, offset, chunk)
+                    return
+                except requests.RequestException as exc:
+                    if attempt == max_retries or not _is_transient(exc):
+                        raise
+                    logger.debug(
+                        "retrying chunk at offset %d of %s (attempt %d)",
+                        offset, file_path, attempt + 1,
+                    )
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            # list() re-raises the first chunk failure
+            list(executor.map(upload, range(0, size, chunk_size)))
+
+        response = self._request_model(
+            GenericResponse, "POST", f"/api/collections/v1/import/complete/{upload_id}"
+        )
+        self._forget_schema()
+        return response
+
+    def _upload_chunk(self, upload_id: str, offset: int, chunk: bytes) -> None:
+        """Send one chunk of a chunked import."""
+        headers = self._build_auth_headers() or {}
+        headers["Content-Type"] = "application/octet-stream"
+        response = self.session.request(
+            method="PUT",
+            url=self._url(f"/api/collections/v1/import/chunk/{upload_id}"),
+            data=chunk,
+            params={"offset": str(offset)},
+            headers=headers,
+            timeout=self.timeout,
+        )
+        if response.status_code >= 400:
+            raise _api_error(response)
+
     # Data Operations
-    def insert_record(self, request: InsertRecordRequest) -> InsertRecordResponse:
+    def insert_record(
+        self, request: Union[InsertRecordRequest, Dict[str, Any]]
+    ) -> InsertRecordResponse:
         """
         Insert a new record into a collection.
 
+        With cache_schemas set, metadata_fields is omitted from the request
+        when it matches the schema already sent for the collection by an
+        earlier insert from this client.
+
         Args:
-            request: InsertRecordRequest with record details
+            request: InsertRecordRequest with record details, or a dict already
+                in the wire format, which is sent without conversion
 
         Returns:
             InsertRecordResponse with inserted record details
         """
+        json_data = self._insert_record_to_dict(request)
+        collection = json_data.get("collection")
+        new_schema = self._omit_known_schema(collection, json_data)
+        data = self._request("POST", "/api/collections/v1/record", json_data=json_data)
+        self._remember_schema(collection, new_schema)
+        return InsertRecordResponse(**data)
+
+    def _omit_known_schema(
+        self, collection: Optional[str], json_data: Dict[str, Any]
+    ) -> Optional[Dict[str, AttrType]]:
+        """
+        Drop metadata_fields from json_data if it was already sent for collection.
+
+        Returns:
+            The metadata_fields to remember once the request succeeds, or None
+        """
+        metadata_fields = json_data.get("metadata_fields")
+        if metadata_fields is None or self._schema_cache is None:
+            return None
+        if self._schema_cache.get(collection) == metadata_fields:
+            del json_data["metadata_fields"]
+            return None
+        return metadata_fields
+
+    def _remember_schema(
+        self, collection: Optional[str], metadata_fields: Optional[Dict[str, AttrType]]
+    ) -> None:
+        """Record the metadata schema accepted by the server for collection."""
+        if collection is not None and metadata_fields is not None:
+            self._schema_cache[collection] = dict(metadata_fields)
+
+    def _forget_schema(self, collection: Optional[str] = None) -> None:
+        """
+        Drop the remembered metadata schema of a dropped or replaced collection.
+
+        Args:
+            collection: Collection to drop; all collections when omitted
+        """
+        if self._schema_cache is None:
+            return
+        if collection is None:
+            self._schema_cache.clear()
+        else:
+            self._schema_cache.pop(collection, None)
+
+    def insert_records(
+        self,
+        collection: str,
+        records: List[Union[InsertRecordRequest, Dict[str, Any]]],
+        batch_size: int = 500,
+        metadata_fields: Optional[Dict[str, AttrType]] = None,
+        max_workers: int = 1,
+    ) -> BulkInsertResponse:
+        """
+        Insert many records into a collection, batch_size records per request.
+
+        If the server does not expose the batch endpoint, records are inserted
+        one request at a time instead. As with insert_record, with cache_schemas
+        set, metadata_fields is only sent until the server has accepted it for
+        the collection.
+
+        With max_workers > 1, the first batch is sent on its own and the rest
+        are sent concurrently over the client's session, so batches may be
+        applied out of order.
+
+        Args:
+            collection: Name of the collection
+            records: Records to insert, as InsertRecordRequest or wire-format
+                dicts (their collection field is ignored)
+            batch_size: Maximum number of records sent per request (default: 500)
+            metadata_fields: Metadata schema shared by all records (optional)
+            max_workers: Maximum number of batches in flight (default: 1)
+
+        Returns:
+            BulkInsertResponse with the number of inserted records
+
+        Raises:
+            ValueError: If batch_size or max_workers is not positive
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        batches = [
+            records[start : start + batch_size]
+            for start in range(0, len(records), batch_size)
+        ]
+        success = True
+        inserted = 0
+        for ok, count in self._iter_insert_batches(
+            collection, batches, metadata_fields, max_workers
+        ):
+            success = success and ok
+            inserted += count
+            logger.debug(
+                "inserted %d/%d records into %s", inserted, len(records), collection
+            )
+
+        return BulkInsertResponse(
+            success=success,
+            message=f"Inserted {inserted} records",
+            inserted=inserted,
+        )
+
+    def _iter_insert_batches(
+        self,
+        collection: str,
+        batches: List[List[Union[InsertRecordRequest, Dict[str, Any]]]],
+        metadata_fields: Optional[Dict[str, AttrType]],
+        max_workers: int,
+    ) -> Iterator[Tuple[bool, int]]:
+        """Insert batches, yielding each batch's result in input order."""
+        if not batches:
+            return
+        # The first batch settles endpoint support and registers the schema
+        # before any remaining batches are sent concurrently.
+        yield self._insert_batch(collection, batches[0], metadata_fields)
+        rest = batches[1:]
+        if max_workers == 1 or not rest:
+            for batch in rest:
+                yield self._insert_batch(collection, batch, metadata_fields)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(
+                lambda batch: self._insert_batch(collection, batch, metadata_fields),
+                rest,
+            )
+
+    def _insert_batch(
+        self,
+        collection: str,
+        batch: List[Union[InsertRecordRequest, Dict[str, Any]]],
+        metadata_fields: Optional[Dict[str, AttrType]],
+    ) -> Tuple[bool, int]:
+        """
+        Insert one batch, falling back to per-record inserts.
+
+        Returns:
+            Whether the server reported success and the number of inserted records
+        """
+        if self._bulk_insert_supported:
+            json_data = self._bulk_insert_to_dict(
+                BulkInsertRequest(
+                    collection=collection,
+                    records=batch,
+                    metadata_fields=metadata_fields,
+                )
+            )
+            new_schema = self._omit_known_schema(collection, json_data)
+            try:
+                data = self._request(
+                    "POST",
+                    f"/api/collections/v1/{collection}/records:batch",
+                    json_data=json_data,
+                )
+            except NotFoundError:
+                # Older servers have no batch endpoint; stop probing it.
+                logger.debug("batch insert endpoint not found, inserting per record")
+                self._bulk_insert_supported = False
+            else:
+                self._remember_schema(collection, new_schema)
+                return data.get("success", True), data.get("inserted", len(batch))
+
+        success = True
+        for record in batch:
+            json_data = self._insert_record_to_dict(record)
+            json_data["collection"] = collection
+            if metadata_fields is not None:
+                json_data.setdefault("metadata_fields", metadata_fields)
+            new_schema = self._omit_known_schema(collection, json_data)
+            data = self._request(
+                "POST", "/api/collections/v1/record", json_data=json_data
+            )
+            self._remember_schema(collection, new_schema)
+            success = success and data.get("success", True)
+        return success, len(batch)
+
+    @staticmethod
+    def _insert_record_to_dict(
+        request: Union[InsertRecordRequest, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Serialize an insert record request."""
+        if isinstance(request, dict):
+            # Already in wire format; copy so callers' dicts are never mutated
+            return dict(request)
         json_data = {
             "collection": request.collection,
             "record": request.record,
         }
-        if request.expiry is not None:
-            json_data["expiry"] = request.expiry
-        if request.id is not None:
-            json_data["id"] = request.id
-        if request.metadata_fields is not None:
-            json_data["metadata_fields"] = request.metadata_fields
-        if request.embedding_provider is not None:
-            json_data["embedding_provider"] = request.embedding_provider
-        if request.fields is not None:
-            json_data["fields"] = request.fields
-        if request.keyword_fields is not None:
-            json_data["keyword_fields"] = request.keyword_fields
-        if request.vectors is not None:
-            json_data["vectors"] = request.vectors
-        if request.model is not None:
-            json_data["model"] = request.model
-        if request.array_fields is not None:
-            json_data["array_fields"] = request.array_fields
+        json_data.update(_only_set(request, _INSERT_RECORD_FIELDS))
         if request.vector_config is not None:
             json_data["vector_config"] = {
                 field: {
@@ -673,9 +1477,23 @@ class Client:
                 }
                 for field, config in request.vector_config.items()
             }
-
-        data = self._request("POST", "/api/collections/v1/record", json_data=json_data)
-        return InsertRecordResponse(**data)
+        return json_data
+
+    @staticmethod
+    def _bulk_insert_to_dict(request: BulkInsertRequest) -> Dict[str, Any]:
+        """Serialize a bulk insert request."""
+        items = []
+        for record in request.records:
+            item = Client._insert_record_to_dict(record)
+            item.pop("collection", None)
+            items.append(item)
+        json_data: Dict[str, Any] = {
+            "collection": request.collection,
+            "records": items,
+        }
+        if request.metadata_fields is not None:
+            json_data["metadata_fields"] = request.metadata_fields
+        return json_data
 
     def ingest_data(self, request: IngestRequest) -> IngestResponse:
         """
@@ -690,39 +1508,7 @@ class Client:
         json_data = {
             "collection_name": request.collection_name,
         }
-        # Source configuration
-        if request.file_path is not None:
-            json_data["file_path"] = request.file_path
-        if request.source_type is not None:
-            json_data["source_type"] = request.source_type
-
-        # MongoDB source configuration
-        if request.database_name is not None:
-            json_data["database_name"] = request.database_name
-        if request.mongo_collection is not None:
-            json_data["mongo_collection"] = request.mongo_collection
-        if request.query is not None:
-            json_data["query"] = request.query
-        if request.mongo_fetch_batch_size is not None:
-            json_data["mongo_fetch_batch_size"] = request.mongo_fetch_batch_size
-
-        # Common configuration
-        if request.fields is not None:
-            json_data["fields"] = request.fields
-        if request.keyword_fields is not None:
-            json_data["keyword_fields"] = request.keyword_fields
-        if request.metadata_fields is not None:
-            json_data["metadata_fields"] = request.metadata_fields
-        if request.id_field is not None:
-            json_data["id_field"] = request.id_field
-        if request.expiry_field is not None:
-            json_data["expiry_field"] = request.expiry_field
-        if request.embedding_provider is not None:
-            json_data["embedding_provider"] = request.embedding_provider
-        if request.embedding_model is not None:
-            json_data["embedding_model"] = request.embedding_model
-        if request.ingestion_batch_size is not None:
-            json_data["ingestion_batch_size"] = request.ingestion_batch_size
+        json_data.update(_only_set(request, _INGEST_FIELDS))
 
         data = self._request("POST", "/api/data/v1/ingest", json_data=json_data)
         return IngestResponse(**data)
@@ -740,36 +1526,84 @@ class Client:
         Raises:
             ValueError: If collection name is empty or both query and vector_query are empty
         """
+        json_data = self._search_request_to_dict(request)
+        data = self._request("POST", "/api/data/v1/search", json_data=json_data)
+        return SearchResponse(**data)
+
+    def search_data_many(
+        self, search_requests: List[SearchRequest], max_workers: int = 16
+    ) -> List[SearchResponse]:
+        """
+        Run several independent searches.
+
+        The searches are sent in one request to the batch search endpoint. If
+        the server does not expose it, they run concurrently on a thread pool
+        over the client's session instead. One pool is kept per max_workers
+        value and reused by later calls until the client is closed.
+
+        Args:
+            search_requests: SearchRequests to run
+            max_workers: Maximum number of concurrent searches when the batch
+                endpoint is unavailable (default: 16)
+
+        Returns:
+            SearchResponse for each request, in input order
+
+        Raises:
+            ValueError: If any request is invalid (see search_data)
+            ShilpError: If the request fails, or the batch endpoint does not
+                return one result per query
+        """
+        queries = [self._search_request_to_dict(r) for r in search_requests]
+        if not queries:
+            return []
+
+        if self._batch_search_supported:
+            try:
+                data = self._request(
+                    "POST", "/api/data/v1/search:batch", json_data={"queries": queries}
+                )
+            except NotFoundError:
+                # Older servers have no batch endpoint; stop probing it.
+                logger.debug("batch search endpoint not found, searching concurrently")
+                self._batch_search_supported = False
+            else:
+                results = data.get("data") or []
+                if len(results) != len(queries):
+                    raise ShilpError(
+                        f"batch search returned {len(results)} results "
+                        f"for {len(queries)} queries"
+                    )
+                return [SearchResponse(**d) for d in results]
+
+        executor = self._executors.get(max_workers)
+        if executor is None:
+            # setdefault keeps one pool if two threads race to create it; the
+            # loser has started no threads yet
+            executor = self._executors.setdefault(
+                max_workers, ThreadPoolExecutor(max_workers=max_workers)
+            )
+        return list(executor.map(self.search_data, search_requests))
+
+    @staticmethod
+    def _search_request_to_dict(request: SearchRequest) -> Dict[str, Any]:
+        """Validate and serialize a search request."""
         if not request.collection:
             raise ValueError("Collection name cannot be empty")
         if not request.query and not request.vector_query:
             raise ValueError("At least one of query or vector_query must be provided")
-        if request.fuzzy_algo is not None and request.fuzzy_algo not in (
-            FuzzyAlgo.LEVENSHTEIN,
-            FuzzyAlgo.JARO_WINKLER,
-        ):
+        if request.fuzzy_algo is not None and request.fuzzy_algo not in _FUZZY_ALGOS:
             raise ValueError(f"invalid fuzzy algorithm - {request.fuzzy_algo}")
 
         json_data = {
             "collection": request.collection,
             "query": request.query,
         }
-        if request.fields is not None:
-            json_data["fields"] = request.fields
-        if request.limit is not None:
-            json_data["limit"] = request.limit
-        if request.weights is not None:
-            json_data["weights"] = request.weights
-        if request.max_distance is not None:
-            json_data["max_distance"] = request.max_distance
+        json_data.update(_only_set(request, _SEARCH_FIELDS))
         if request.filters is not None:
             json_data["filters"] = request.filters.to_dict()
         if request.sort is not None:
             json_data["sort"] = request.sort.to_dict()
-        if request.vector_query is not None:
-            json_data["vector_query"] = request.vector_query
-        if request.use_nli is not None:
-            json_data["use_nli"] = request.use_nli
         if request.field_config is not None:
             json_data["field_config"] = {
                 field: {
@@ -777,15 +1611,7 @@ class Client:
                 }
                 for field, config in request.field_config.items()
             }
-        if request.queries is not None:
-            json_data["queries"] = request.queries
-        if request.vector_queries is not None:
-            json_data["vector_queries"] = request.vector_queries
-        if request.fuzzy_algo is not None:
-            json_data["fuzzy_algo"] = request.fuzzy_algo
-
-        data = self._request("POST", "/api/data/v1/search", json_data=json_data)
-        return SearchResponse(**data)
+        return json_data
 
     # Storage Operations
     def upload_data_file(self, file_path: str) -> GenericResponse:
@@ -861,9 +1687,7 @@ class Client:
         if options.skip > 0:
             params["skip"] = str(options.skip)
         if options.source == "mongodb" and options.mongo_filter:
-            import json
-
-            params["mongo_filter"] = json.dumps(options.mongo_filter)
+            params["mongo_filter"] = _dumps(options.mongo_filter).decode("utf-8")
 
         data = self._request("GET", "/api/data/v1/storage/read", params=params)
         return ReadDocumentResponse(**data)
@@ -872,21 +1696,29 @@ class Client:
         """
         List all available embedding providers and their models.
 
+        Repeated calls are conditional GETs (see health_check).
+
         Returns:
             ListEmbeddingModelsResponse with embedding models
         """
-        data = self._request("GET", "/api/data/v1/embedding/models")
-        return ListEmbeddingModelsResponse(**data)
+        return self._get_cached(
+            "/api/data/v1/embedding/models",
+            lambda data: ListEmbeddingModelsResponse(**data),
+        )
 
     def list_ingest_sources(self) -> ListIngestionSourcesResponse:
         """
         List all available ingestion sources.
 
+        Repeated calls are conditional GETs (see health_check).
+
         Returns:
             ListIngestionSourcesResponse with available ingestion sources
         """
-        data = self._request("GET", "/api/data/v1/ingest/sources")
-        return ListIngestionSourcesResponse(**data)
+        return self._get_cached(
+            "/api/data/v1/ingest/sources",
+            lambda data: ListIngestionSourcesResponse(**data),
+        )
 
     def stream_ingest_stats(
         self, collection: str, callback: Callable[[str], None]
@@ -901,20 +1733,14 @@ class Client:
         Note:
             This is a blocking call that streams events until connection closes.
         """
-        url = urljoin(
-            self.base_url, f"/api/data/v1/ingest/stats?collection={collection}"
-        )
+        url = self._url(f"/api/data/v1/ingest/stats?collection={collection}")
         response = self.session.get(url, stream=True, timeout=self.timeout)
 
         if response.status_code >= 400:
-            raise requests.HTTPError(
-                f"API error: {response.text} (status: {response.status_code})",
-                response=response,
-            )
+            raise _api_error(response)
 
-        for line in response.iter_lines():
-            if line:
-                callback(line.decode("utf-8"))
+        for line in _iter_stream_lines(response):
+            callback(line)
 
     # Debug Operations
     def get_collection_distance(
@@ -943,7 +1769,7 @@ class Client:
             params["custom_matcher_text"] = custom_matcher_text
         raw = self._request(
             "GET",
-            f"/api/collections/v1/debug/{collection_name}/{field}/distance/{node_id}",
+            f"{_debug_field_path(collection_name, field)}/distance/{node_id}",
             params=params,
         )
         if "data" in raw and isinstance(raw["data"], dict):
@@ -966,7 +1792,7 @@ class Client:
         """
         data = self._request(
             "GET",
-            f"/api/collections/v1/debug/{collection_name}/{field}/nodes/{node_id}",
+            f"{_debug_field_path(collection_name, field)}/nodes/{node_id}",
         )
         return DebugNodeInfoResponse(**data)
 
@@ -1001,8 +1827,8 @@ class Client:
 
         data = self._request(
             "GET",
-            f"/api/collections/v1/debug/{collection_name}/{field}/nodes/{node_id}/neighbors/{level}",
-            params=params,
+            f"{_debug_field_path(collection_name, field)}/nodes/{node_id}/neighbors/{level}",
+            params=params or None,
         )
         return DebugNodeInfoResponse(**data)
 
@@ -1144,20 +1970,14 @@ class Client:
             This is a blocking call that streams events until connection closes.
         """
         params = f"vertical={vertical}"
-        url = urljoin(
-            self.base_url, f"/api/collections/v1/{collection}/nli/enable?{params}"
-        )
+        url = self._url(f"/api/collections/v1/{collection}/nli/enable?{params}")
         response = self.session.get(url, stream=True, timeout=self.timeout)
 
         if response.status_code >= 400:
-            raise requests.HTTPError(
-                f"API error: {response.text} (status: {response.status_code})",
-                response=response,
-            )
+            raise _api_error(response)
 
-        for line in response.iter_lines():
-            if line:
-                callback(line.decode("utf-8"))
+        for line in _iter_stream_lines(response):
+            callback(line)
 
     def get_collection_schema(
         self, collection_name: str
@@ -1404,7 +2224,11 @@ class Client:
 
     # Oplog Operations
     def get_oplog_entries(
-        self, collection: str, after_lsn: int, limit: int = 0
+        self,
+        collection: str,
+        after_lsn: int,
+        limit: int = 0,
+        wait_ms: Optional[int] = None,
     ) -> GetOplogResponse:
         """
         Retrieve oplog entries after a specific LSN for replica synchronization.
@@ -1413,18 +2237,104 @@ class Client:
             collection: Collection name (empty string for all collections)
             after_lsn: LSN after which to retrieve oplog entries
             limit: Maximum number of oplog entries to retrieve (optional)
+            wait_ms: Long-poll for up to this many milliseconds while there
+                are no new entries, instead of returning an empty response
+                immediately (optional)
 
         Returns:
             GetOplogResponse with oplog entries
         """
+        params = self._oplog_params(collection, after_lsn, limit, wait_ms)
+        timeout = None
+        if wait_ms is not None:
+            # Leave the server the whole wait before the read times out
+            timeout = self.timeout + wait_ms / 1000
+
+        data = self._request("GET", "/api/oplog/v1/", params=params, timeout=timeout)
+        return GetOplogResponse(**data)
+
+    def iter_oplog_entries(
+        self, collection: str, after_lsn: int, limit: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over oplog entries after a specific LSN as they are parsed.
+
+        With the ``stream`` extra installed (ijson), entries are decoded one
+        at a time while the response is read, so a large page never has to
+        be held in memory as raw bytes and a full dict tree at once.
+        Otherwise this falls back to get_oplog_entries.
+
+        Args:
+            collection: Collection name (empty string for all collections)
+            after_lsn: LSN after which to retrieve oplog entries
+            limit: Maximum number of oplog entries to retrieve (optional)
+
+        Yields:
+            Oplog entries, shaped like the items of GetOplogResponse.entries
+        """
+        if ijson is None:
+            yield from self.get_oplog_entries(collection, after_lsn, limit).entries
+            return
+
+        params = self._oplog_params(collection, after_lsn, limit)
+        with self._request_stream("GET", "/api/oplog/v1/", params=params) as response:
+            # Let urllib3 undo any Content-Encoding before ijson reads the body
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "entries.item", use_float=True)
+
+    @staticmethod
+    def _oplog_params(
+        collection: str, after_lsn: int, limit: int, wait_ms: Optional[int] = None
+    ) -> Dict[str, str]:
+        """Build the query parameters for an oplog entries request."""
         params = {"after_lsn": str(after_lsn)}
         if collection:
             params["collection"] = collection
         if limit > 0:
             params["limit"] = str(limit)
+        if wait_ms is not None:
+            params["wait_ms"] = str(wait_ms)
+        return params
 
-        data = self._request("GET", "/api/oplog/v1/", params=params)
-        return GetOplogResponse(**data)
+    def stream_oplog_entries(
+        self,
+        collection: str,
+        after_lsn: int,
+        callback: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """
+        Stream oplog entries after a specific LSN via SSE.
+
+        Replaces polling get_oplog_entries: the server pushes each new entry
+        over one open connection as it is written.
+
+        Args:
+            collection: Collection name (empty string for all collections)
+            after_lsn: LSN after which to stream oplog entries
+            callback: Function to call with each decoded entry, shaped like
+                the items of GetOplogResponse.entries
+
+        Note:
+            This is a blocking call that streams events until connection closes.
+        """
+        params = {"after_lsn": str(after_lsn)}
+        if collection:
+            params["collection"] = collection
+        response = self.session.get(
+            self._url("/api/oplog/v1/stream"),
+            params=params,
+            headers=self._build_auth_headers(),
+            stream=True,
+            timeout=self.timeout,
+        )
+
+        if response.status_code >= 400:
+            raise _api_error(response)
+
+        for line in _iter_stream_lines(response):
+            # Only data lines carry entries; skip event names and comments
+            if line.startswith("data: "):
+                callback(_loads(line[6:]))
 
     def update_replica_lsn(
         self, collection: str, replica_id: str, lsn: int
@@ -1445,8 +2355,9 @@ class Client:
             "replica_id": replica_id,
             "lsn": lsn,
         }
-        data = self._request("POST", "/api/oplog/v1/heartbeat", json_data=json_data)
-        return UpdateReplicaLSNResponse(**data)
+        return self._request_model(
+            UpdateReplicaLSNResponse, "POST", "/api/oplog/v1/heartbeat", json_data=json_data
+        )
 
     def register_replica(self, replica_id: str) -> GenericResponse:
         """
@@ -1459,8 +2370,9 @@ class Client:
             GenericResponse indicating success or failure
         """
         json_data = {"replica_id": replica_id}
-        data = self._request("POST", "/api/oplog/v1/register", json_data=json_data)
-        return GenericResponse(**data)
+        return self._request_model(
+            GenericResponse, "POST", "/api/oplog/v1/register", json_data=json_data
+        )
 
     def unregister_replica(self, replica_id: str) -> GenericResponse:
         """
@@ -1473,8 +2385,9 @@ class Client:
             GenericResponse indicating success or failure
         """
         json_data = {"replica_id": replica_id}
-        data = self._request("POST", "/api/oplog/v1/unregister", json_data=json_data)
-        return GenericResponse(**data)
+        return self._request_model(
+            GenericResponse, "POST", "/api/oplog/v1/unregister", json_data=json_data
+        )
 
     def get_oplog_status(self, collection: str) -> OplogStatusResponse:
         """
@@ -1487,5 +2400,6 @@ class Client:
             OplogStatusResponse with oplog status
         """
         params = {"collection": collection}
-        data = self._request("GET", "/api/oplog/v1/status", params=params)
-        return OplogStatusResponse(**data)
+        return self._request_model(
+            OplogStatusResponse, "GET", "/api/oplog/v1/status", params=params
+        )
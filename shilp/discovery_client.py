@@ -1,22 +1,92 @@
 """Shilp Discovery API Client implementation for service discovery and orchestration."""
 
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
-from urllib.parse import urljoin
+from concurrent.futures import Future
+from dataclasses import fields
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, Optional, Tuple
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without the extra
+    msgspec = None
+
+from shilp.client import _dumps, _loads, _new_session
+from shilp.exceptions import ShilpError, _api_error
 from shilp.models import (
     GenericResponse,
     DiscoveryStats,
+    ProxyStats,
     SyncStatus,
+    Replica,
     ReplicaType,
     RegisterToDiscoveryRequest,
+    Status,
 )
 
+# Discovery API endpoint paths, by name
+_ENDPOINTS = {
+    "shilp_stats": "/api/v1/discovery/shilp/stats",
+    "shilp_sync": "/api/v1/discovery/shilp/sync",
+    "shilp_register": "/api/v1/discovery/shilp/register",
+    "shilp_unregister": "/api/v1/discovery/shilp/unregister",
+    "tei_register": "/api/v1/discovery/tei/register",
+    "tei_unregister": "/api/v1/discovery/tei/unregister",
+}
+
+# (is_read, is_write) flags sent for each replica type
+_REPLICA_RW = {
+    ReplicaType.READ_REPLICA: (True, False),
+    ReplicaType.WRITE_REPLICA: (False, True),
+    ReplicaType.SINGLE_NODE: (True, True),
+}
+
+# Pulls Replica's fields out of a payload dict in order, for positional
+# construction, which skips the keyword parsing of Replica(**data)
+_replica_values = itemgetter(*(f.name for f in fields(Replica)))
+
+# Typed decoder that builds DiscoveryStats, with its nested Status, Replica
+# and ProxyStats, straight from the response bytes when msgspec is installed
+_STATS_DECODER = msgspec.json.Decoder(DiscoveryStats) if msgspec is not None else None
+
+
+@lru_cache(maxsize=32)
+def _generic_response(success: bool, message: str) -> GenericResponse:
+    """Return a shared GenericResponse; it is frozen, so reuse is safe."""
+    return GenericResponse(success, message)
+
+
+def _write_response(content: bytes) -> GenericResponse:
+    """
+    Build the GenericResponse of a discovery write from its response body.
+
+    Raises:
+        ShilpError: If a non-empty body has no success field
+    """
+    if not content:
+        # Success with no body (e.g. 204 from register/unregister)
+        return _generic_response(True, "")
+    data = _loads(content)
+    if not isinstance(data, dict) or "success" not in data:
+        raise ShilpError("discovery write response has no success field")
+    # Only the reported fields are passed on, so keys added by the server
+    # are ignored
+    return _generic_response(data["success"], data.get("message", ""))
+
 
 class DiscoveryClient:
     """Client for the Shilp Discovery API."""
 
-    def __init__(self, base_url: str, timeout: int = 30, session: Optional[requests.Session] = None):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        session: Optional[requests.Session] = None,
+        stats_ttl: float = 5.0,
+    ):
         """
         Initialize the Shilp Discovery API client.
 
@@ -24,15 +94,39 @@ class DiscoveryClient:
             base_url: Base URL of the Shilp Discovery server
             timeout: Request timeout in seconds (default: 30)
             session: Optional custom requests.Session instance
+            stats_ttl: Seconds a get_shilp_stats result is reused (default: 5);
+                0 disables the cache
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self._owns_session = session is None
+        self.session = session or _new_session()
+        # Full endpoint URLs, built once rather than on every request
+        self._urls = {name: self.base_url + path for name, path in _ENDPOINTS.items()}
+        self.stats_ttl = stats_ttl
+        # account_id -> (monotonic fetch time, stats)
+        self._stats_cache: Dict[str, Tuple[float, DiscoveryStats]] = {}
+        # account_id -> pending fetch, shared by threads asking at the same
+        # time; a fetch only caches its result if it is still the entry here,
+        # i.e. its account was not invalidated while the request was running
+        self._stats_inflight: Dict[str, Future] = {}
+        self._stats_lock = threading.Lock()
+
+    def __enter__(self) -> "DiscoveryClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections held by the client."""
+        if self._owns_session:
+            self.session.close()
 
     def _request(
         self,
         method: str,
-        path: str,
+        endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
@@ -41,7 +135,7 @@ class DiscoveryClient:
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
-            path: API endpoint path
+            endpoint: Name of the API endpoint in _ENDPOINTS
             json_data: JSON data to send in request body
             params: Query parameters
 
@@ -49,58 +143,200 @@ class DiscoveryClient:
             Response JSON as dictionary
 
         Raises:
-            requests.HTTPError: If the request fails
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
+        """
+        content = self._request_content(method, endpoint, json_data, params)
+        return _loads(content) if content else {}
+
+    def _request_content(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Perform an HTTP request and return the undecoded response body.
+
+        Raises:
+            ShilpError: If the request fails (NotFoundError for HTTP 404)
         """
-        url = urljoin(self.base_url, path)
-        
+        headers = None
+        body = None
+        if json_data is not None:
+            headers = {"Content-Type": "application/json"}
+            body = _dumps(json_data)
+
         response = self.session.request(
             method=method,
-            url=url,
-            json=json_data,
+            url=self._urls[endpoint],
+            data=body,
             params=params,
+            headers=headers,
             timeout=self.timeout,
         )
 
         if response.status_code >= 400:
-            raise requests.HTTPError(
-                f"API error: {response.text} (status: {response.status_code})",
-                response=response,
-            )
-
-        return response.json() if response.content else {}
+            raise _api_error(response)
 
-    def get_shilp_stats(self, account_id: str) -> DiscoveryStats:
-        """
-        Get statistics for Shilp services.
+        # Success responses with no body (e.g. 204 from register/unregister)
+        if response.status_code == 204 or response.headers.get("Content-Length") == "0":
+            return b""
+        return response.content
 
-        Args:
-            account_id: Account identifier
+    @staticmethod
+    def _decode_shilp_stats(content: bytes) -> DiscoveryStats:
+        """Decode a stats response body to DiscoveryStats."""
+        if _STATS_DECODER is not None:
+            try:
+                return _STATS_DECODER.decode(content)
+            except msgspec.DecodeError:
+                # Payloads that leave out fields (the lenient parser below
+                # defaults them) or do not match the declared types
+                pass
+        return DiscoveryClient._parse_shilp_stats(_loads(content) if content else {})
 
-        Returns:
-            DiscoveryStats with service statistics
-        """
-        params = {"account_id": account_id}
-        data = self._request("GET", "/api/v1/discovery/shilp/stats", params=params)
-        
+    @staticmethod
+    def _parse_shilp_stats(data: Dict[str, Any]) -> DiscoveryStats:
+        """Convert a stats response payload to DiscoveryStats."""
         # Convert the nested structure to DiscoveryStats
-        from shilp.models import Status, Replica, ProxyStats
-        
         registry_data = data.get("registry", {})
         registry = Status(
-            write_replica=Replica(**registry_data.get("write_replica", {})),
-            read_replicas=[Replica(**r) for r in registry_data.get("read_replicas", [])],
+            write_replica=DiscoveryClient._parse_replica(registry_data.get("write_replica", {})),
+            read_replicas=tuple(
+                DiscoveryClient._parse_replica(r)
+                for r in registry_data.get("read_replicas", ())
+            ),
             available=registry_data.get("available", 0),
             total=registry_data.get("total", 0),
         )
-        
+
         proxy_data = data.get("proxy", {})
         proxy = ProxyStats(
             active_proxies=proxy_data.get("active_proxies", 0),
-            targets=proxy_data.get("targets", []),
+            targets=tuple(proxy_data.get("targets", ())),
         )
-        
+
         return DiscoveryStats(registry=registry, proxy=proxy)
 
+    @staticmethod
+    def _parse_replica(data: Dict[str, Any]) -> Replica:
+        """Convert a replica payload to Replica."""
+        try:
+            return Replica(*_replica_values(data))
+        except KeyError as exc:
+            # Keep the TypeError Replica(**data) raised for incomplete payloads
+            raise TypeError(f"replica payload is missing field {exc.args[0]!r}") from None
+
+    @staticmethod
+    def _shilp_service_to_dict(
+        account_id: str, address: str, service_id: str, replica_type: ReplicaType
+    ) -> Dict[str, Any]:
+        """Build the register/unregister request body for a Shilp service."""
+        try:
+            is_read, is_write = _REPLICA_RW[replica_type]
+        except KeyError:
+            raise ValueError(f"unknown replica type: {replica_type!r}") from None
+        return {
+            "account_id": account_id,
+            "address": address,
+            "id": service_id,
+            "is_read": is_read,
+            "is_write": is_write,
+        }
+
+    @staticmethod
+    def _tei_service_to_dict(account_id: str, address: str, service_id: str) -> Dict[str, Any]:
+        """Build the register/unregister request body for a TEI service."""
+        return {
+            "account_id": account_id,
+            "address": address,
+            "id": service_id,
+        }
+
+    def get_shilp_stats(self, account_id: str) -> DiscoveryStats:
+        """
+        Get statistics for Shilp services.
+
+        Results are cached per account for `stats_ttl` seconds. Threads that
+        ask for the same account while a fetch is running wait for that fetch
+        instead of sending their own request. The register, unregister and
+        sync status methods drop the cached stats of the account they change.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            DiscoveryStats with service statistics
+        """
+        if self.stats_ttl <= 0:
+            return self._fetch_shilp_stats(account_id)
+
+        with self._stats_lock:
+            cached = self._stats_cache.get(account_id)
+            if cached is not None and time.monotonic() - cached[0] < self.stats_ttl:
+                return cached[1]
+            future = self._stats_inflight.get(account_id)
+            owner = future is None
+            if owner:
+                future = self._stats_inflight[account_id] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            stats = self._fetch_shilp_stats(account_id)
+        except BaseException as exc:
+            with self._stats_lock:
+                self._end_stats_fetch(account_id, future)
+            future.set_exception(exc)
+            raise
+
+        with self._stats_lock:
+            if self._stats_inflight.get(account_id) is future:
+                self._stats_cache[account_id] = (time.monotonic(), stats)
+            self._end_stats_fetch(account_id, future)
+        future.set_result(stats)
+        return stats
+
+    def _fetch_shilp_stats(self, account_id: str) -> DiscoveryStats:
+        """Fetch and parse stats for an account, bypassing the cache."""
+        params = {"account_id": account_id}
+        content = self._request_content("GET", "shilp_stats", params=params)
+        return self._decode_shilp_stats(content)
+
+    def _end_stats_fetch(self, account_id: str, future: Future) -> None:
+        """Stop sharing a finished fetch; call with _stats_lock held."""
+        # invalidate_stats may already have dropped it, and a newer fetch
+        # may have taken its place
+        if self._stats_inflight.get(account_id) is future:
+            del self._stats_inflight[account_id]
+
+    def invalidate_stats(self, account_id: Optional[str] = None) -> None:
+        """
+        Drop cached get_shilp_stats results.
+
+        Fetches already running are dropped as well: later calls send a new
+        request, and the older result is returned to its waiting callers
+        but not cached.
+
+        Args:
+            account_id: Account to drop; all accounts when omitted
+        """
+        with self._stats_lock:
+            if account_id is None:
+                self._stats_cache.clear()
+                self._stats_inflight.clear()
+            else:
+                self._stats_cache.pop(account_id, None)
+                self._stats_inflight.pop(account_id, None)
+
+    def _write(self, method: str, endpoint: str, json_data: Dict[str, Any]) -> GenericResponse:
+        """Send a discovery write and drop the cached stats of its account."""
+        content = self._request_content(method, endpoint, json_data=json_data)
+        self.invalidate_stats(json_data["account_id"])
+        return _write_response(content)
+
     def update_shilp_sync_status(
         self, account_id: str, address: str, status: str
     ) -> GenericResponse:
@@ -120,8 +356,7 @@ class DiscoveryClient:
             "address": address,
             "status": status,
         }
-        data = self._request("PUT", "/api/v1/discovery/shilp/sync", json_data=json_data)
-        return GenericResponse(**data)
+        return self._write("PUT", "shilp_sync", json_data)
 
     def register_shilp_service(
         self, account_id: str, address: str, service_id: str, replica_type: ReplicaType
@@ -138,18 +373,8 @@ class DiscoveryClient:
         Returns:
             GenericResponse indicating success or failure
         """
-        is_read = replica_type == ReplicaType.READ_REPLICA or replica_type == ReplicaType.SINGLE_NODE
-        is_write = replica_type == ReplicaType.WRITE_REPLICA or replica_type == ReplicaType.SINGLE_NODE
-        
-        json_data = {
-            "account_id": account_id,
-            "address": address,
-            "id": service_id,
-            "is_read": is_read,
-            "is_write": is_write,
-        }
-        data = self._request("POST", "/api/v1/discovery/shilp/register", json_data=json_data)
-        return GenericResponse(**data)
+        json_data = self._shilp_service_to_dict(account_id, address, service_id, replica_type)
+        return self._write("POST", "shilp_register", json_data)
 
     def unregister_shilp_service(
         self, account_id: str, address: str, service_id: str, replica_type: ReplicaType
@@ -166,18 +391,8 @@ class DiscoveryClient:
         Returns:
             GenericResponse indicating success or failure
         """
-        is_read = replica_type == ReplicaType.READ_REPLICA or replica_type == ReplicaType.SINGLE_NODE
-        is_write = replica_type == ReplicaType.WRITE_REPLICA or replica_type == ReplicaType.SINGLE_NODE
-        
-        json_data = {
-            "account_id": account_id,
-            "address": address,
-            "id": service_id,
-            "is_read": is_read,
-            "is_write": is_write,
-        }
-        data = self._request("DELETE", "/api/v1/discovery/shilp/unregister", json_data=json_data)
-        return GenericResponse(**data)
+        json_data = self._shilp_service_to_dict(account_id, address, service_id, replica_type)
+        return self._write("DELETE", "shilp_unregister", json_data)
 
     def register_tei_service(
         self, account_id: str, address: str, service_id: str
@@ -193,13 +408,8 @@ class DiscoveryClient:
         Returns:
             GenericResponse indicating success or failure
         """
-        json_data = {
-            "account_id": account_id,
-            "address": address,
-            "id": service_id,
-        }
-        data = self._request("POST", "/api/v1/discovery/tei/register", json_data=json_data)
-        return GenericResponse(**data)
+        json_data = self._tei_service_to_dict(account_id, address, service_id)
+        return self._write("POST", "tei_register", json_data)
 
     def unregister_tei_service(
         self, account_id: str, address: str, service_id: str
@@ -215,10 +425,5 @@ class DiscoveryClient:
         Returns:
             GenericResponse indicating success or failure
         """
-        json_data = {
-            "account_id": account_id,
-            "address": address,
-            "id": service_id,
-        }
-        data = self._request("DELETE", "/api/v1/discovery/tei/unregister", json_data=json_data)
-        return GenericResponse(**data)
+        json_data = self._tei_service_to_dict(account_id, address, service_id)
+        return self._write("DELETE", "tei_unregister", json_data)
@@ -0,0 +1,38 @@
+"""Exceptions raised by the Shilp SDK."""
+
+from typing import Any
+
+import requests
+
+
+class ShilpError(requests.HTTPError):
+    """Error response returned by a Shilp API."""
+
+
+class NotFoundError(ShilpError):
+    """The requested resource does not exist (HTTP 404)."""
+
+
+# Longest error body quoted in an exception message; the whole body stays
+# available as exc.response.content
+_MAX_ERROR_BODY = 512
+
+
+def _api_error(response: Any) -> ShilpError:
+    """Build the exception raised for an error response.
+
+    Works for requests and httpx responses alike, so the sync and async
+    clients raise the same exception types.
+    """
+    error_class = NotFoundError if response.status_code == 404 else ShilpError
+    # Decode only the quoted prefix, as UTF-8 (the API returns JSON), rather
+    # than response.text, which decodes the whole body and may first guess
+    # its charset
+    content = response.content
+    body = content[:_MAX_ERROR_BODY].decode("utf-8", errors="replace")
+    if len(content) > _MAX_ERROR_BODY:
+        body += "..."
+    return error_class(
+        f"API error: {body} (status: {response.status_code})",
+        response=response,
+    )
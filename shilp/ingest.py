@@ -0,0 +1,114 @@
+"""Parallel ingestion helpers for large record sets."""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from shilp.client import Client
+from shilp.models import AttrType, BulkInsertResponse, InsertRecordRequest
+
+Record = Union[InsertRecordRequest, Dict[str, Any]]
+
+
+def _shard(records: List[Record], shards: int) -> List[List[Record]]:
+    """Split records into at most `shards` contiguous, near-equal slices."""
+    size, extra = divmod(len(records), shards)
+    result = []
+    start = 0
+    for i in range(shards):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            result.append(records[start:end])
+        start = end
+    return result
+
+
+def _insert_shard(
+    url: str,
+    collection: str,
+    records: List[Record],
+    batch_size: int,
+    metadata_fields: Optional[Dict[str, AttrType]],
+    auth_token: Optional[str],
+    timeout: int,
+) -> BulkInsertResponse:
+    """Insert one shard from a worker process with its own client."""
+    with Client(url, timeout=timeout, auth_token=auth_token) as client:
+        return client.insert_records(
+            collection,
+            records,
+            batch_size=batch_size,
+            metadata_fields=metadata_fields,
+        )
+
+
+def parallel_insert(
+    url: str,
+    collection: str,
+    records: List[Record],
+    workers: int = 4,
+    batch_size: int = 500,
+    metadata_fields: Optional[Dict[str, AttrType]] = None,
+    auth_token: Optional[str] = None,
+    timeout: int = 30,
+) -> BulkInsertResponse:
+    """
+    Insert records using several worker processes.
+
+    Records are split into one contiguous shard per worker. Each worker opens
+    its own Client, and so its own connection pool, and calls
+    `Client.insert_records` on its shard. This helps when a single process
+    cannot serialize and send records fast enough to keep the server busy.
+    Throughput stops improving once workers exceeds the number of physical
+    cores, or once the server itself is saturated.
+
+    Records must be picklable, since they are sent to the worker processes.
+    On platforms that spawn workers (Windows, macOS), call this from under
+    an ``if __name__ == "__main__":`` guard.
+
+    Args:
+        url: Base URL of the Shilp server (e.g., "http://localhost:3000")
+        collection: Name of the collection
+        records: Records to insert, as InsertRecordRequest or wire-format dicts
+        workers: Number of worker processes (default: 4)
+        batch_size: Maximum number of records sent per request (default: 500)
+        metadata_fields: Metadata schema shared by all records (optional)
+        auth_token: Optional auth token to send as Bearer token
+        timeout: Request timeout in seconds (default: 30)
+
+    Returns:
+        BulkInsertResponse with the total number of inserted records
+
+    Raises:
+        ValueError: If workers or batch_size is not positive
+    """
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    shards = _shard(records, workers)
+    if not shards:
+        return BulkInsertResponse(success=True, message="Inserted 0 records")
+
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        futures = [
+            executor.submit(
+                _insert_shard,
+                url,
+                collection,
+                shard,
+                batch_size,
+                metadata_fields,
+                auth_token,
+                timeout,
+            )
+            for shard in shards
+        ]
+        responses = [future.result() for future in futures]
+
+    inserted = sum(r.inserted for r in responses)
+    return BulkInsertResponse(
+        success=all(r.success for r in responses),
+        message=f"Inserted {inserted} records",
+        inserted=inserted,
+    )
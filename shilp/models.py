@@ -1,19 +1,42 @@
 """Data models for Shilp SDK."""
 
+import sys
 from enum import IntEnum, Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+from operator import itemgetter
 from datetime import datetime
 from dataclasses import dataclass, field
 
+# Models declare __slots__ where dataclasses support it (Python 3.10+), so
+# large responses such as oplog entries and search results build smaller
+# instances with faster attribute access. Responses that clients cache or
+# share between callers are frozen as well.
+if sys.version_info >= (3, 10):
+    _model = dataclass(slots=True)
+    _frozen_model = dataclass(slots=True, frozen=True)
+else:
+    _model = dataclass
+    _frozen_model = dataclass(frozen=True)
+
 
 class AttrType(IntEnum):
-    """Type of a metadata attribute."""
+    """Type of a metadata attribute.
+
+    Sent on the wire as its integer value. AttrType("string") and other
+    member names are also accepted for payloads that use the legacy names.
+    """
 
     INT64 = 0
     FLOAT64 = 1
     STRING = 2
     BOOL = 3
 
+    @classmethod
+    def _missing_(cls, value: Any) -> Optional["AttrType"]:
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
 
 class FilterOp(IntEnum):
     """Filter operation types."""
@@ -76,7 +99,7 @@ class OpType:
     RENAME_COLLECTION = "rename_collection"
 
 
-@dataclass
+@_frozen_model
 class GenericResponse:
     """Standard response structure."""
 
@@ -84,7 +107,7 @@ class GenericResponse:
     message: str
 
 
-@dataclass
+@_model
 class MetadataColumnSchema:
     """Metadata column schema."""
 
@@ -92,7 +115,7 @@ class MetadataColumnSchema:
     type: AttrType
 
 
-@dataclass
+@_model
 class Collection:
     """Represents a collection in the database."""
 
@@ -112,14 +135,14 @@ class Collection:
     total_no_of_documents: int = 0
 
 
-@dataclass
+@_model
 class EnableMetadataStoreRequest:
     """Request to enable metadata store for a collection."""
 
     fields: Optional[List[MetadataColumnSchema]] = None
 
 
-@dataclass
+@_model
 class EnableMetadataStoreResponse:
     """Response for metadata store enablement."""
 
@@ -128,7 +151,7 @@ class EnableMetadataStoreResponse:
     records_indexed: Optional[int] = None
 
 
-@dataclass
+@_model
 class MetadataSupportInfo:
     """Metadata support information."""
 
@@ -138,7 +161,7 @@ class MetadataSupportInfo:
     is_default: bool
 
 
-@dataclass
+@_model
 class ListCollectionsResponse:
     """Response for listing collections."""
 
@@ -147,9 +170,10 @@ class ListCollectionsResponse:
     data: List[Collection]
     metadata_info: Optional[List[MetadataSupportInfo]] = None
     is_nli_supported: bool = False
+    next_cursor: Optional[str] = None  # Set when more pages are available
 
 
-@dataclass
+@_model
 class AddCollectionRequest:
     """Request to add a new collection."""
 
@@ -161,7 +185,7 @@ class AddCollectionRequest:
     enable_pq: bool = False
 
 
-@dataclass
+@_model
 class CollectionDataRecord:
     """A single record returned from get_collection_data."""
 
@@ -170,7 +194,7 @@ class CollectionDataRecord:
     vectors: Optional[Dict[str, List[float]]] = None
 
 
-@dataclass
+@_model
 class GetCollectionDataResponse:
     """Response for paginated collection data."""
 
@@ -180,7 +204,7 @@ class GetCollectionDataResponse:
     total: int = 0
 
 
-@dataclass
+@_model
 class Attribute:
     """An attribute in a collection schema."""
 
@@ -190,7 +214,7 @@ class Attribute:
     is_metadata: Optional[bool] = None
 
 
-@dataclass
+@_model
 class CategoryValue:
     """A value in a category schema."""
 
@@ -198,7 +222,7 @@ class CategoryValue:
     count: Optional[int] = None
 
 
-@dataclass
+@_model
 class CategorySchema:
     """Category schema for inverted-index fields."""
 
@@ -208,7 +232,7 @@ class CategorySchema:
     synonyms: Optional[List[str]] = None
 
 
-@dataclass
+@_model
 class CollectionSchema:
     """Schema of a collection."""
 
@@ -216,7 +240,7 @@ class CollectionSchema:
     value_schema: Optional[List[CategorySchema]] = None
 
 
-@dataclass
+@_model
 class GetCollectionSchemaResponse:
     """Response for getting a collection schema."""
 
@@ -225,7 +249,7 @@ class GetCollectionSchemaResponse:
     data: Optional[CollectionSchema] = None
 
 
-@dataclass
+@_model
 class NLIModelInfo:
     """Information about an NLI model."""
 
@@ -233,7 +257,7 @@ class NLIModelInfo:
     version: Optional[str] = None
 
 
-@dataclass
+@_model
 class VerticalInfo:
     """Information about an NLI vertical."""
 
@@ -244,7 +268,7 @@ class VerticalInfo:
     version: Optional[str] = None
 
 
-@dataclass
+@_model
 class ListNLIVerticalsResponse:
     """Response for listing NLI verticals."""
 
@@ -253,7 +277,7 @@ class ListNLIVerticalsResponse:
     message: Optional[str] = None
 
 
-@dataclass
+@_model
 class RecordData:
     """Record data in the response."""
 
@@ -264,14 +288,14 @@ class RecordData:
     metadata_fields: Optional[Dict[str, int]] = None
 
 
-@dataclass
+@_model
 class VectorCreateConfig:
     """Configuration for creating vectors."""
 
     ef_construction: Optional[int] = None
 
 
-@dataclass
+@_model
 class InsertRecordRequest:
     """Request to insert a record."""
 
@@ -290,7 +314,7 @@ class InsertRecordRequest:
     vector_config: Optional[Dict[str, VectorCreateConfig]] = None
 
 
-@dataclass
+@_model
 class InsertRecordResponse:
     """Response for inserting a record."""
 
@@ -300,7 +324,27 @@ class InsertRecordResponse:
     remaining_records: Optional[int] = None
 
 
-@dataclass
+@_model
+class BulkInsertRequest:
+    """Request to insert a batch of records into a single collection."""
+
+    collection: str
+    # InsertRecordRequest instances or dicts already in the wire format
+    records: List[Union[InsertRecordRequest, Dict[str, Any]]]
+    # Shared metadata schema, sent once per batch instead of once per record
+    metadata_fields: Optional[Dict[str, AttrType]] = None
+
+
+@_model
+class BulkInsertResponse:
+    """Response for inserting a batch of records."""
+
+    success: bool
+    message: str
+    inserted: int = 0
+
+
+@_model
 class IngestRequest:
     """Request to ingest data."""
 
@@ -327,7 +371,7 @@ class IngestRequest:
     ingestion_batch_size: Optional[int] = None
 
 
-@dataclass
+@_model
 class IngestResponse:
     """Response for data ingestion."""
 
@@ -336,7 +380,7 @@ class IngestResponse:
     details: Optional[List[str]] = None
 
 
-@dataclass
+@_model
 class FileReaderOptions:
     """Options for reading files."""
 
@@ -346,7 +390,7 @@ class FileReaderOptions:
     limit: int = 0
 
 
-@dataclass
+@_model
 class ListIngestionSourcesResponse:
     """Response for listing ingestion sources."""
 
@@ -355,7 +399,12 @@ class ListIngestionSourcesResponse:
     data: Optional[List[str]] = None
 
 
-@dataclass
+# Enum members resolved once at import rather than on every validate() call
+_SET_OPS = frozenset((FilterOp.IN, FilterOp.NOT_IN))
+_SORT_ORDERS = frozenset(SortOrder)
+
+
+@_model
 class FilterExpression:
     """Single filter condition."""
 
@@ -370,7 +419,7 @@ class FilterExpression:
         if not self.attribute:
             raise ValueError("attribute name cannot be empty")
 
-        if self.op in (FilterOp.IN, FilterOp.NOT_IN):
+        if self.op in _SET_OPS:
             if not self.values or len(self.values) == 0:
                 raise ValueError("IN/NOT IN operations require at least one value")
         else:
@@ -378,39 +427,69 @@ class FilterExpression:
                 raise ValueError(f"value cannot be None for operation {self.op}")
 
 
-@dataclass
+# Expected selectivity rank per filter operation, lowest is most selective.
+# Used to order AND filters so the cheapest-to-satisfy predicates run first.
+_SELECTIVITY = {
+    FilterOp.EQUALS: 0,
+    FilterOp.IN: 1,
+    FilterOp.GREATER_THAN: 3,
+    FilterOp.GREATER_THAN_OR_EQUAL: 3,
+    FilterOp.LESS_THAN: 3,
+    FilterOp.LESS_THAN_OR_EQUAL: 3,
+    FilterOp.NOT_IN: 5,
+    FilterOp.NOT_EQUALS: 5,
+}
+
+
+def _selectivity(f: FilterExpression) -> int:
+    """Selectivity rank of a filter expression."""
+    return _SELECTIVITY.get(f.op, 10)
+
+
+def _filter_to_dict(f: FilterExpression) -> Dict[str, Any]:
+    """Convert a FilterExpression to dict."""
+    # Plain ints encode faster than IntEnum members in orjson
+    result = {
+        "attribute": f.attribute,
+        "op": int(f.op),
+    }
+    if f.value is not None:
+        result["value"] = f.value
+    if f.values is not None:
+        result["values"] = f.values
+    if f.filters is not None:
+        result["filters"] = f.filters.to_dict()
+    return result
+
+
+@_model
 class CompoundFilter:
     """Combination of filter expressions."""
 
     and_: Optional[List[FilterExpression]] = field(default_factory=list)
     or_: Optional[List[FilterExpression]] = field(default_factory=list)
+    # Reorder filters by expected selectivity on serialization: AND filters
+    # most selective first, OR filters most selective last. Set to False to
+    # send filters in the order given.
+    reorder: bool = True
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-
-        def filter_to_dict(f: FilterExpression) -> Dict[str, Any]:
-            """Convert a FilterExpression to dict."""
-            result = {
-                "attribute": f.attribute,
-                "op": f.op,
-            }
-            if f.value is not None:
-                result["value"] = f.value
-            if f.values is not None:
-                result["values"] = f.values
-            if f.filters is not None:
-                result["filters"] = f.filters.to_dict()
-            return result
-
         result = {}
         if self.and_:
-            result["and"] = [filter_to_dict(f) for f in self.and_]
+            and_ = self.and_
+            if self.reorder:
+                and_ = sorted(and_, key=_selectivity)
+            result["and"] = [_filter_to_dict(f) for f in and_]
         if self.or_:
-            result["or"] = [filter_to_dict(f) for f in self.or_]
+            or_ = self.or_
+            if self.reorder:
+                or_ = sorted(or_, key=_selectivity, reverse=True)
+            result["or"] = [_filter_to_dict(f) for f in or_]
         return result
 
 
-@dataclass
+@_model
 class SortExpression:
     """Sort criterion."""
 
@@ -421,11 +500,11 @@ class SortExpression:
         """Validate the sort expression."""
         if not self.attribute:
             raise ValueError("sort attribute cannot be empty")
-        if self.order not in (SortOrder.ASCENDING, SortOrder.DESCENDING):
+        if self.order not in _SORT_ORDERS:
             raise ValueError(f"invalid sort order: {self.order}")
 
 
-@dataclass
+@_model
 class CompoundSort:
     """Combination of sort expressions."""
 
@@ -436,19 +515,19 @@ class CompoundSort:
         result = {}
         if self.sorts:
             result["sorts"] = [
-                {"attribute": s.attribute, "order": s.order} for s in self.sorts
+                {"attribute": s.attribute, "order": int(s.order)} for s in self.sorts
             ]
         return result
 
 
-@dataclass
+@_model
 class VectorSearchConfig:
     """Configuration for vector search."""
 
     ef_search: int = 200
 
 
-@dataclass
+@_model
 class SearchRequest:
     """Request body for POST search."""
 
@@ -479,7 +558,7 @@ class FuzzyAlgo:
     JARO_WINKLER = "jaro_winkler"
 
 
-@dataclass
+@_model
 class Token:
     """Token in the query interpretation."""
 
@@ -488,7 +567,7 @@ class Token:
     label: Optional[str] = None
 
 
-@dataclass
+@_model
 class NumericalValue:
     """Numerical value with unit and multiplier."""
 
@@ -512,7 +591,7 @@ class FilterOperator:
     NOT_IN = "NOT IN"
 
 
-@dataclass
+@_model
 class Filter:
     """Filter in the query interpretation."""
 
@@ -526,7 +605,7 @@ class Filter:
     numerical_value: Optional[NumericalValue] = None
 
 
-@dataclass
+@_model
 class ValueFilter:
     """Value filter in the query interpretation."""
 
@@ -537,7 +616,7 @@ class ValueFilter:
     operator: Optional[str] = None
 
 
-@dataclass
+@_model
 class VectorQuery:
     """Vector query in the query interpretation."""
 
@@ -547,7 +626,7 @@ class VectorQuery:
     vector_confidences: Optional[Dict[str, float]] = None
 
 
-@dataclass
+@_model
 class Query:
     """Query interpretation from NLI."""
 
@@ -556,7 +635,7 @@ class Query:
     value_filters: Optional[List[ValueFilter]] = None
 
 
-@dataclass
+@_model
 class SearchResponse:
     """Response for searching data."""
 
@@ -566,8 +645,29 @@ class SearchResponse:
     message: Optional[str] = None
     timing: Optional[Dict[str, int]] = None
 
-
-@dataclass
+    def as_records(
+        self, columns: List[str], default: Any = None
+    ) -> List[Tuple[Any, ...]]:
+        """Return the given columns of each result row as a tuple.
+
+        Missing columns are filled with default.
+        """
+        if not columns:
+            return [() for _ in self.data]
+        get = itemgetter(*columns)
+        single = len(columns) == 1
+        records = []
+        for row in self.data:
+            try:
+                values = get(row)
+            except KeyError:
+                records.append(tuple(row.get(c, default) for c in columns))
+                continue
+            records.append((values,) if single else values)
+        return records
+
+
+@_model
 class APIAuthConfig:
     """API auth configuration for settings."""
 
@@ -578,7 +678,7 @@ class APIAuthConfig:
     oplog: bool = False
 
 
-@dataclass
+@_model
 class ProviderArgumentValue:
     """Provider argument key-value entry."""
 
@@ -587,7 +687,7 @@ class ProviderArgumentValue:
     is_secret: Optional[bool] = None
 
 
-@dataclass
+@_model
 class SettingsAuth:
     """Authentication settings."""
 
@@ -598,7 +698,7 @@ class SettingsAuth:
     api_auth_config: Optional[APIAuthConfig] = None
 
 
-@dataclass
+@_model
 class SettingsIntegration:
     """Integration provider settings."""
 
@@ -607,7 +707,7 @@ class SettingsIntegration:
     arguments: Optional[List[ProviderArgumentValue]] = None
 
 
-@dataclass
+@_model
 class Settings:
     """Server settings payload."""
 
@@ -616,7 +716,7 @@ class Settings:
     integrations: Optional[List[SettingsIntegration]] = None
 
 
-@dataclass
+@_model
 class GetSettingsResponse:
     """Response for get settings endpoint."""
 
@@ -625,7 +725,7 @@ class GetSettingsResponse:
     data: Optional[Settings] = None
 
 
-@dataclass
+@_model
 class SettingsUpdateRequest:
     """Request to update settings."""
 
@@ -636,7 +736,7 @@ class SettingsUpdateRequest:
     integration: Optional[Dict[str, SettingsIntegration]] = None
 
 
-@dataclass
+@_model
 class SettingsProviderArguments:
     """Provider argument specification."""
 
@@ -652,7 +752,7 @@ class SettingsProviderType:
     DATA_SOURCE = "data-source"
 
 
-@dataclass
+@_model
 class SettingsProviderInfo:
     """Provider metadata."""
 
@@ -661,7 +761,7 @@ class SettingsProviderInfo:
     arguments: Optional[List[SettingsProviderArguments]] = None
 
 
-@dataclass
+@_model
 class SettingsAvailableProvidersData:
     """Providers grouped by type."""
 
@@ -669,7 +769,7 @@ class SettingsAvailableProvidersData:
     integrations: Optional[List[SettingsProviderInfo]] = None
 
 
-@dataclass
+@_model
 class SettingsAvailableProvidersResponse:
     """Response for listing settings providers."""
 
@@ -678,7 +778,7 @@ class SettingsAvailableProvidersResponse:
     data: Optional[SettingsAvailableProvidersData] = None
 
 
-@dataclass
+@_model
 class StorageItem:
     """Item in the storage list."""
 
@@ -686,7 +786,7 @@ class StorageItem:
     is_dir: bool
 
 
-@dataclass
+@_model
 class ListStorageResponse:
     """Response for listing storage."""
 
@@ -695,7 +795,7 @@ class ListStorageResponse:
     data: Dict[str, List[StorageItem]]
 
 
-@dataclass
+@_model
 class ReadDocumentResponse:
     """Response for reading document contents."""
 
@@ -704,7 +804,7 @@ class ReadDocumentResponse:
     data: List[Dict[str, str]]
 
 
-@dataclass
+@_model
 class HealthResponse:
     """Response for health check."""
 
@@ -712,7 +812,7 @@ class HealthResponse:
     version: str
 
 
-@dataclass
+@_model
 class DebugDistanceData:
     """Data returned from debug distance endpoint."""
 
@@ -722,7 +822,7 @@ class DebugDistanceData:
     custom_matcher_vector: Optional[List[float]] = None
 
 
-@dataclass
+@_model
 class DebugDistanceResponse:
     """Response for debug distance endpoint."""
 
@@ -731,7 +831,7 @@ class DebugDistanceResponse:
     data: Optional[DebugDistanceData] = None
 
 
-@dataclass
+@_model
 class DebugNeighbor:
     """Neighbor node in the graph."""
 
@@ -742,7 +842,7 @@ class DebugNeighbor:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@_model
 class DebugNodeInfo:
     """Detailed information about a node."""
 
@@ -754,7 +854,7 @@ class DebugNodeInfo:
     neighbors: List[DebugNeighbor]
 
 
-@dataclass
+@_model
 class DebugNodeInfoResponse:
     """Response for debug node info endpoint."""
 
@@ -763,7 +863,7 @@ class DebugNodeInfoResponse:
     data: Optional[DebugNodeInfo] = None
 
 
-@dataclass
+@_model
 class DebugLevelInfo:
     """Level information."""
 
@@ -771,7 +871,7 @@ class DebugLevelInfo:
     node_count: int
 
 
-@dataclass
+@_model
 class DebugLevelsResponse:
     """Response for debug levels endpoint."""
 
@@ -780,7 +880,7 @@ class DebugLevelsResponse:
     data: Dict[str, List[DebugLevelInfo]]
 
 
-@dataclass
+@_model
 class DebugNodesAtLevelResponse:
     """Response for debug nodes at level endpoint."""
 
@@ -789,7 +889,7 @@ class DebugNodesAtLevelResponse:
     data: Dict[str, List[int]]
 
 
-@dataclass
+@_model
 class DebugVectorNode:
     """Vector node in the reference node response."""
 
@@ -798,7 +898,7 @@ class DebugVectorNode:
     vector: List[float]
 
 
-@dataclass
+@_model
 class DebugReferenceNode:
     """Reference node with its metadata and vector nodes."""
 
@@ -807,7 +907,7 @@ class DebugReferenceNode:
     nodes: List[DebugVectorNode]
 
 
-@dataclass
+@_model
 class DebugReferenceNodeResponse:
     """Response for debug reference node endpoint."""
 
@@ -816,14 +916,14 @@ class DebugReferenceNodeResponse:
     data: Optional[DebugReferenceNode] = None
 
 
-@dataclass
+@_model
 class DebugGetEmbeddingsRequest:
     """Request to get embeddings for debug purposes."""
 
     texts: List[str]
 
 
-@dataclass
+@_model
 class DebugGetEmbeddingsResponse:
     """Response for getting debug embeddings."""
 
@@ -832,7 +932,7 @@ class DebugGetEmbeddingsResponse:
     data: Optional[List[List[float]]] = None
 
 
-@dataclass
+@_model
 class EmbeddingModel:
     """Embedding model."""
 
@@ -840,7 +940,7 @@ class EmbeddingModel:
     is_default: bool
 
 
-@dataclass
+@_model
 class EmbeddingProvider:
     """Embedding provider with its models."""
 
@@ -849,7 +949,7 @@ class EmbeddingProvider:
     models: List[EmbeddingModel]
 
 
-@dataclass
+@_model
 class ListEmbeddingModelsResponse:
     """Response for listing embedding models."""
 
@@ -859,7 +959,7 @@ class ListEmbeddingModelsResponse:
     supports_distributed_embedding: bool = False
 
 
-@dataclass
+@_model
 class OplogStatusResponse:
     """Oplog status response."""
 
@@ -870,7 +970,7 @@ class OplogStatusResponse:
     replica_count: int
 
 
-@dataclass
+@_model
 class UpdateReplicaLSNRequest:
     """Replica LSN update request."""
 
@@ -879,7 +979,7 @@ class UpdateReplicaLSNRequest:
     lsn: int
 
 
-@dataclass
+@_model
 class UpdateReplicaLSNResponse:
     """Update response."""
 
@@ -887,21 +987,21 @@ class UpdateReplicaLSNResponse:
     message: str
 
 
-@dataclass
+@_model
 class RegisterReplicaRequest:
     """Replica registration request."""
 
     replica_id: str
 
 
-@dataclass
+@_model
 class UnRegisterReplicaRequest:
     """Replica unregistration request."""
 
     replica_id: str
 
 
-@dataclass
+@_model
 class Record:
     """Record structure."""
 
@@ -915,7 +1015,7 @@ class Record:
     expiry: Optional[int] = None
 
 
-@dataclass
+@_model
 class OplogEntry:
     """Single entry in the operation log."""
 
@@ -936,7 +1036,7 @@ class OplogEntry:
     new_name: Optional[str] = None
 
 
-@dataclass
+@_model
 class GetOplogResponse:
     """Oplog response."""
 
@@ -946,6 +1046,22 @@ class GetOplogResponse:
     last_lsn: int
     count: int
 
+    def as_columns(
+        self, columns: List[str], default: Any = None
+    ) -> Dict[str, List[Any]]:
+        """Return the given fields of all entries as one list per field.
+
+        Each list can be handed to an array library, e.g.
+        ``numpy.asarray(cols["lsn"])``, to filter a large page in bulk.
+        Missing fields are filled with default.
+        """
+        rows = [
+            e if isinstance(e, dict)
+            else {c: getattr(e, c, default) for c in columns}
+            for e in self.entries
+        ]
+        return {c: [row.get(c, default) for row in rows] for c in columns}
+
 
 class SyncStatus:
     """Sync status for replicas."""
@@ -962,7 +1078,7 @@ class ReplicaType(IntEnum):
     SINGLE_NODE = 2
 
 
-@dataclass
+@_frozen_model
 class Replica:
     """Replica information."""
 
@@ -972,25 +1088,25 @@ class Replica:
     is_syncing: bool  # Traffic gate - if true, no traffic sent
 
 
-@dataclass
+@_frozen_model
 class Status:
     """Overall status of the registry."""
 
     write_replica: Replica
-    read_replicas: List[Replica]
+    read_replicas: Tuple[Replica, ...]
     available: int
     total: int
 
 
-@dataclass
+@_frozen_model
 class ProxyStats:
     """Proxy statistics."""
 
     active_proxies: int
-    targets: List[str]
+    targets: Tuple[str, ...]
 
 
-@dataclass
+@_frozen_model
 class DiscoveryStats:
     """Discovery statistics."""
 
@@ -998,7 +1114,7 @@ class DiscoveryStats:
     proxy: ProxyStats
 
 
-@dataclass
+@_model
 class UpdateSyncStatusRequest:
     """Request to update sync status."""
 
@@ -1007,7 +1123,7 @@ class UpdateSyncStatusRequest:
     status: str  # SyncStatus
 
 
-@dataclass
+@_model
 class RegisterToDiscoveryRequest:
     """Request to register to discovery service."""
 
@@ -1025,7 +1141,7 @@ class ModelType(str, Enum):
     VERTICAL = "vertical"
 
 
-@dataclass
+@_model
 class Model:
     """Information about a model."""
 
@@ -1054,7 +1170,7 @@ class Model:
     deleted_at: Optional[Any] = None
 
 
-@dataclass
+@_model
 class CollectionModel:
     """Collection model information."""
 
@@ -1063,7 +1179,7 @@ class CollectionModel:
     upgrade_available: bool
 
 
-@dataclass
+@_model
 class ListCollectionsModelsResponse:
     """Response for listing collection models."""
 
@@ -1072,7 +1188,7 @@ class ListCollectionsModelsResponse:
     message: str
 
 
-@dataclass
+@_model
 class GetCollectionModelResponse:
     """Response for getting a collection model."""
 
@@ -1090,7 +1206,7 @@ class UpdateModelsEventStatus(str, Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+@_model
 class UpdateModelsEvent:
     """Event for model update progress."""
 
@@ -1102,7 +1218,7 @@ class UpdateModelsEvent:
     error: Optional[str] = None  # Error message if status is "error"
 
 
-@dataclass
+@_model
 class GetModelResponse:
     """Response for getting a model."""
 
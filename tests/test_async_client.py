@@ -0,0 +1,225 @@
+"""
+Unit tests for Shilp SDK AsyncClient.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+import shilp.client
+from shilp.async_client import AsyncClient
+from shilp.client import Client
+from shilp.exceptions import NotFoundError, ShilpError
+from shilp.models import (
+    GenericResponse,
+    HealthResponse,
+    InsertRecordRequest,
+    OplogStatusResponse,
+    SearchRequest,
+    SearchResponse,
+)
+
+
+def make_client(handler):
+    """Create an AsyncClient whose requests are served by handler."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncClient("http://localhost:3000", http_client=http_client)
+
+
+class TestAsyncClient:
+    """Test AsyncClient request handling."""
+
+    def test_health_check(self):
+        """Test async health check."""
+
+        def handler(request):
+            assert request.url.path == "/health"
+            return httpx.Response(200, json={"success": True, "version": "1.0.0"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.ahealth_check()
+
+        result = asyncio.run(run())
+        assert isinstance(result, HealthResponse)
+        assert result.version == "1.0.0"
+
+    @pytest.mark.parametrize(
+        "status_code, error_class", [(500, ShilpError), (404, NotFoundError)]
+    )
+    def test_request_error_handling(self, status_code, error_class):
+        """Test error responses raise the same exceptions as Client."""
+
+        def handler(request):
+            return httpx.Response(status_code, text="Internal Server Error")
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.ahealth_check()
+
+        with pytest.raises(error_class) as exc_info:
+            asyncio.run(run())
+        assert type(exc_info.value) is error_class
+        assert exc_info.value.response.status_code == status_code
+        assert "Internal Server Error" in str(exc_info.value)
+
+    def test_error_message_quotes_body_prefix(self):
+        """Test long error bodies are cut short in the exception message."""
+
+        def handler(request):
+            return httpx.Response(500, content=b"x" * 10000)
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.ahealth_check()
+
+        with pytest.raises(ShilpError) as exc_info:
+            asyncio.run(run())
+        assert str(exc_info.value) == f"API error: {'x' * 512}... (status: 500)"
+        assert len(exc_info.value.response.content) == 10000
+
+    @pytest.mark.parametrize("typed", [True, False])
+    def test_responses_ignore_unknown_keys(self, typed):
+        """Test flat responses drop undeclared keys, with and without msgspec."""
+        if typed:
+            pytest.importorskip("msgspec")
+
+        def handler(request):
+            if request.url.path == "/health":
+                body = {"success": True, "version": "1.0.0", "uptime": 5}
+            else:
+                body = {"success": True, "message": "OK", "request_id": "r1"}
+            return httpx.Response(200, json=body)
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.ahealth_check(), await client.adrop_collection("c")
+
+        with patch("shilp.client.msgspec", shilp.client.msgspec if typed else None):
+            health, dropped = asyncio.run(run())
+        assert health == HealthResponse(success=True, version="1.0.0")
+        assert dropped == GenericResponse(success=True, message="OK")
+
+    def test_search_data(self):
+        """Test async search serializes the request body."""
+
+        def handler(request):
+            body = json.loads(request.content)
+            assert body["collection"] == "my-collection"
+            assert body["query"] == "hello"
+            return httpx.Response(200, json={"success": True, "data": []})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.asearch_data(
+                    SearchRequest(collection="my-collection", query="hello")
+                )
+
+        result = asyncio.run(run())
+        assert isinstance(result, SearchResponse)
+
+    def test_insert_records_concurrent(self):
+        """Test concurrent inserts respect the concurrency limit."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"success": True, "message": "OK"})
+
+        async def run():
+            async with make_client(handler) as client:
+                records = [
+                    InsertRecordRequest(collection="c", id=str(i), record={})
+                    for i in range(10)
+                ]
+                return await client.ainsert_records_concurrent(
+                    records, concurrency=3
+                )
+
+        results = asyncio.run(run())
+        assert len(results) == 10
+        assert all(r.success for r in results)
+        assert peak <= 3
+
+    def test_search_data_many(self):
+        """Test concurrent searches return results in input order."""
+
+        def handler(request):
+            query = json.loads(request.content)["query"]
+            return httpx.Response(
+                200, json={"success": True, "data": [{"id": query}]}
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.asearch_data_many(
+                    [SearchRequest(collection="c", query=q) for q in ("a", "b")]
+                )
+
+        results = asyncio.run(run())
+        assert [r.data[0]["id"] for r in results] == ["a", "b"]
+
+    def test_get_oplog_status(self):
+        """Test async oplog status passes the collection as a query param."""
+
+        def handler(request):
+            assert request.url.path == "/api/oplog/v1/status"
+            assert request.url.params["collection"] == "c"
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "message": "OK",
+                    "last_lsn": 5,
+                    "retention_lsn": 1,
+                    "replica_count": 2,
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.aget_oplog_status("c")
+
+        result = asyncio.run(run())
+        assert isinstance(result, OplogStatusResponse)
+        assert result.last_lsn == 5
+
+    def test_get_oplog_entries_params(self):
+        """Test async oplog reads send the same query params as Client."""
+        sent = []
+
+        def handler(request):
+            sent.append(dict(request.url.params))
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "message": "OK",
+                    "entries": [],
+                    "last_lsn": 7,
+                    "count": 0,
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.aget_oplog_entries("c", 7, limit=10, wait_ms=500)
+
+        assert asyncio.run(run()).last_lsn == 7
+        assert sent == [Client._oplog_params("c", 7, 10, 500)]
+        assert sent[0] == {
+            "after_lsn": "7", "collection": "c", "limit": "10", "wait_ms": "500"
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
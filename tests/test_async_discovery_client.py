@@ -0,0 +1,142 @@
+"""
+Unit tests for Shilp SDK AsyncDiscoveryClient.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from shilp.async_discovery_client import AsyncDiscoveryClient
+from shilp.exceptions import NotFoundError, ShilpError
+from shilp.models import DiscoveryStats, ReplicaType
+
+
+def make_client(handler):
+    """Create an AsyncDiscoveryClient whose requests are served by handler."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncDiscoveryClient("http://localhost:8080", http_client=http_client)
+
+
+class TestAsyncDiscoveryClient:
+    """Test AsyncDiscoveryClient request handling."""
+
+    def test_get_shilp_stats(self):
+        """Test stats are fetched per account and parsed."""
+        replica = {"id": "w", "address": "a:1", "is_healthy": True, "is_syncing": False}
+
+        def handler(request):
+            assert request.url.path == "/api/v1/discovery/shilp/stats"
+            assert request.url.params["account_id"] == "acct"
+            return httpx.Response(200, json={
+                "registry": {"write_replica": replica, "read_replicas": [replica],
+                             "available": 1, "total": 2},
+                "proxy": {"active_proxies": 1, "targets": ["a:1"]},
+            })
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.aget_shilp_stats("acct")
+
+        result = asyncio.run(run())
+        assert isinstance(result, DiscoveryStats)
+        assert result.registry.write_replica.id == "w"
+        assert result.registry.total == 2
+        assert result.proxy.targets == ("a:1",)
+
+    def test_register_shilp_services(self):
+        """Test each service is registered and results keep input order."""
+        bodies = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            bodies.append(body)
+            return httpx.Response(200, json={"success": True, "message": body["id"]})
+
+        services = [
+            {"account_id": "acct", "address": f"a:{i}", "service_id": f"s{i}",
+             "replica_type": ReplicaType.SINGLE_NODE}
+            for i in range(5)
+        ]
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.aregister_shilp_services(services, concurrency=2)
+
+        results = asyncio.run(run())
+        assert [r.message for r in results] == ["s0", "s1", "s2", "s3", "s4"]
+        assert len(bodies) == 5
+        assert all(b["is_read"] and b["is_write"] for b in bodies)
+
+    def test_register_no_content(self):
+        """Test a 204 from register maps to a success response."""
+
+        def handler(request):
+            return httpx.Response(204)
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.aregister_shilp_service(
+                    "acct", "a:1", "s1", ReplicaType.SINGLE_NODE
+                )
+
+        assert asyncio.run(run()).success is True
+
+    def test_write_requires_success_field(self):
+        """Test a non-empty write reply without success raises ShilpError."""
+
+        def handler(request):
+            return httpx.Response(200, json={"message": "OK"})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.aregister_tei_service("acct", "a:1", "tei")
+
+        with pytest.raises(ShilpError, match="no success field"):
+            asyncio.run(run())
+
+    @pytest.mark.parametrize(
+        "status_code, error_class", [(500, ShilpError), (404, NotFoundError)]
+    )
+    def test_request_error_handling(self, status_code, error_class):
+        """Test error responses raise the same exceptions as DiscoveryClient."""
+
+        def handler(request):
+            return httpx.Response(status_code, text="Internal Server Error")
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.aregister_tei_service("acct", "a:1", "tei")
+
+        with pytest.raises(error_class) as exc_info:
+            asyncio.run(run())
+        assert type(exc_info.value) is error_class
+        assert exc_info.value.response.status_code == status_code
+        assert "Internal Server Error" in str(exc_info.value)
+
+    def test_error_message_quotes_body_prefix(self):
+        """Test long error bodies are cut short in the exception message."""
+
+        def handler(request):
+            return httpx.Response(500, content=b"x" * 10000)
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.aregister_tei_service("acct", "a:1", "tei")
+
+        with pytest.raises(ShilpError) as exc_info:
+            asyncio.run(run())
+        assert str(exc_info.value) == f"API error: {'x' * 512}... (status: 500)"
+        assert len(exc_info.value.response.content) == 10000
+
+    def test_http2_enabled_by_default(self):
+        """Test the default HTTP client is created with HTTP/2 enabled."""
+        with patch("shilp.async_discovery_client.httpx.AsyncClient") as mock_client:
+            AsyncDiscoveryClient("http://localhost:8080")
+            assert mock_client.call_args[1]["http2"] is True
+
+            AsyncDiscoveryClient("http://localhost:8080", http2=False)
+            assert mock_client.call_args[1]["http2"] is False
@@ -2,12 +2,21 @@
 Unit tests for Shilp SDK Client.
 """
 
+import array
+import gzip
+import io
+import json
+
 import pytest
+import requests
+import shilp.client
 from unittest.mock import Mock, patch, MagicMock
-from shilp.client import Client
+from shilp.client import Client, _decode_model, _dumps, _model_from_dict
+from shilp.exceptions import NotFoundError, ShilpError
 from shilp.models import (
     AddCollectionRequest,
     FileReaderOptions,
+    IngestRequest,
     InsertRecordRequest,
     SearchRequest,
     HealthResponse,
@@ -30,9 +39,24 @@ from shilp.models import (
     SettingsUpdateRequest,
     SettingsAuth,
     SettingsAvailableProvidersResponse,
+    BulkInsertResponse,
 )
 
 
+def mock_json_response(payload, status_code=200):
+    """Build a mock response whose body is payload encoded as JSON."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.content = json.dumps(payload).encode("utf-8")
+    mock_response.headers = {}
+    return mock_response
+
+
+def sent_json(call_args):
+    """Decode the JSON body of a recorded session.request call."""
+    return json.loads(call_args[1]["data"])
+
+
 class TestClient:
     """Test Client initialization and basic methods."""
 
@@ -47,20 +71,63 @@ class TestClient:
         client = Client("http://localhost:3000/")
         assert client.base_url == "http://localhost:3000"
 
+    def test_client_keeps_base_url_path_prefix(self):
+        """Test API paths are appended to a base URL that has a path."""
+        client = Client("http://localhost:3000/shilp/")
+        assert client._url("/health") == "http://localhost:3000/shilp/health"
+        assert client._url("health") == "http://localhost:3000/shilp/health"
+
+    def test_client_uses_slots(self):
+        """Test Client instances have no per-instance __dict__."""
+        client = Client("http://localhost:3000")
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = 1
+
     def test_client_custom_timeout(self):
         """Test client initialization with custom timeout."""
         client = Client("http://localhost:3000", timeout=60)
         assert client.timeout == 60
 
+    def test_client_mounts_pooled_adapter(self):
+        """Test the default session uses a pooled, retrying adapter."""
+        client = Client("http://localhost:3000")
+        adapter = client.session.get_adapter("http://localhost:3000")
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 3
+        client.close()
+
+    def test_client_advertises_decodable_encodings(self):
+        """Test the default session accepts every encoding urllib3 decodes."""
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        client = Client("http://localhost:3000")
+        assert client.session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        client.close()
+
+    @patch("shilp.client.requests.Session")
+    def test_client_context_manager_closes_session(self, mock_session_class):
+        """Test leaving the context manager closes the owned session."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        with Client("http://localhost:3000") as client:
+            assert client.session is mock_session
+        mock_session.close.assert_called_once()
+
+    def test_client_does_not_close_custom_session(self):
+        """Test a caller-provided session is left open."""
+        session = Mock()
+        with Client("http://localhost:3000", session=session):
+            pass
+        session.close.assert_not_called()
+
     @patch("shilp.client.requests.Session")
     def test_client_auth_header(self, mock_session_class):
         """Test Authorization header when auth token is configured."""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "version": "1.0.0"}
-        mock_response.content = b'{"success": true, "version": "1.0.0"}'
+        mock_response = mock_json_response({"success": True, "version": "1.0.0"})
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000", auth_token="token-123")
@@ -76,10 +143,7 @@ class TestClient:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "version": "1.0.0"}
-        mock_response.content = b'{"success": true, "version": "1.0.0"}'
+        mock_response = mock_json_response({"success": True, "version": "1.0.0"})
         mock_session.request.return_value = mock_response
 
         # Create client and call health_check
@@ -92,6 +156,47 @@ class TestClient:
         assert result.version == "1.0.0"
         mock_session.request.assert_called_once()
 
+    @patch("shilp.client.requests.Session")
+    def test_health_check_not_modified(self, mock_session_class):
+        """Test a 304 reply to If-None-Match returns the cached response."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        first = mock_json_response({"success": True, "version": "1.0.0"})
+        first.headers = {"ETag": '"v1"'}
+        not_modified = Mock(status_code=304, content=b"", headers={})
+        mock_session.request.side_effect = [first, not_modified]
+
+        client = Client("http://localhost:3000")
+        result = client.health_check()
+        cached = client.health_check()
+
+        assert cached is result
+        assert "If-None-Match" not in (
+            mock_session.request.call_args_list[0][1]["headers"] or {}
+        )
+        second_headers = mock_session.request.call_args_list[1][1]["headers"]
+        assert second_headers["If-None-Match"] == '"v1"'
+
+    @patch("shilp.client.requests.Session")
+    def test_list_ingest_sources_not_modified(self, mock_session_class):
+        """Test list endpoints share the conditional GET cache per path."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        first = mock_json_response({"success": True, "message": "OK", "data": []})
+        first.headers = {"ETag": '"s1"'}
+        health = mock_json_response({"success": True, "version": "1.0.0"})
+        not_modified = Mock(status_code=304, content=b"", headers={})
+        mock_session.request.side_effect = [first, health, not_modified]
+
+        client = Client("http://localhost:3000")
+        sources = client.list_ingest_sources()
+        client.health_check()
+        assert client.list_ingest_sources() is sources
+
+        calls = mock_session.request.call_args_list
+        assert calls[1][1]["headers"] is None
+        assert calls[2][1]["headers"]["If-None-Match"] == '"s1"'
+
     @patch("shilp.client.requests.Session")
     def test_add_collection(self, mock_session_class):
         """Test add collection method."""
@@ -99,13 +204,12 @@ class TestClient:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "Collection created",
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "Collection created",
+            }
+        )
         mock_session.request.return_value = mock_response
 
         # Create client and call add_collection
@@ -136,7 +240,7 @@ class TestClient:
 
         mock_response = Mock()
         mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
+        mock_response.content = b"Internal Server Error"
         mock_session.request.return_value = mock_response
 
         # Create client and expect error
@@ -145,6 +249,67 @@ class TestClient:
         with pytest.raises(Exception):  # Should raise HTTPError
             client.health_check()
 
+    @patch("shilp.client.requests.Session")
+    def test_not_found_error(self, mock_session_class):
+        """Test HTTP 404 raises NotFoundError, a requests.HTTPError."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.content = b"collection not found"
+        mock_session.request.return_value = mock_response
+
+        client = Client("http://localhost:3000")
+
+        with pytest.raises(NotFoundError) as exc_info:
+            client.drop_collection("missing")
+        assert isinstance(exc_info.value, requests.HTTPError)
+        assert exc_info.value.response is mock_response
+        assert str(exc_info.value) == "API error: collection not found (status: 404)"
+
+    @patch("shilp.client.requests.Session")
+    def test_error_message_quotes_body_prefix(self, mock_session_class):
+        """Test long error bodies are cut short in the exception message."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = Mock(
+            status_code=500, content=b"x" * 10000
+        )
+
+        client = Client("http://localhost:3000")
+
+        with pytest.raises(ShilpError) as exc_info:
+            client.health_check()
+        assert str(exc_info.value) == f"API error: {'x' * 512}... (status: 500)"
+        assert len(exc_info.value.response.content) == 10000
+
+    @patch("shilp.client.requests.Session")
+    def test_collection_exists(self, mock_session_class):
+        """Test collection_exists checks the listed collection names."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": [
+                    {
+                        "name": "my-collection",
+                        "is_loaded": True,
+                        "fields": [],
+                        "searchable_fields": [],
+                        "storage_type": 1,
+                        "reference_storage_type": 1,
+                    }
+                ],
+            }
+        )
+
+        client = Client("http://localhost:3000")
+
+        assert client.collection_exists("my-collection") is True
+        assert client.collection_exists("other") is False
+
     def test_read_document_validation(self):
         """Test read_document parameter validation."""
         client = Client("http://localhost:3000")
@@ -177,14 +342,13 @@ class TestClientRequestBuilding:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": {"items": []},
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": {"items": []},
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -200,10 +364,7 @@ class TestClientRequestBuilding:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "message": "OK"}
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response({"success": True, "message": "OK"})
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -214,8 +375,67 @@ class TestClientRequestBuilding:
 
         # Verify JSON data was sent
         call_args = mock_session.request.call_args
-        assert call_args[1]["json"]["name"] == "test-collection"
-        assert call_args[1]["json"]["has_metadata_storage"] is True
+        assert sent_json(call_args)["name"] == "test-collection"
+        assert sent_json(call_args)["has_metadata_storage"] is True
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
+
+    @patch("shilp.client.requests.Session")
+    def test_request_without_body(self, mock_session_class):
+        """Test body-less requests send no data or Content-Type."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000")
+        client.flush_collection("test-collection")
+
+        call_args = mock_session.request.call_args
+        assert call_args[1]["data"] is None
+        assert call_args[1]["headers"] is None
+
+    @patch("shilp.client.requests.Session")
+    def test_request_with_serialized_body(self, mock_session_class):
+        """Test pre-serialized bytes are sent as-is with a JSON Content-Type."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000")
+        client._request("POST", "/api/data/v1/search", json_data=b'{"q":1}')
+
+        call_args = mock_session.request.call_args
+        assert call_args[1]["data"] == b'{"q":1}'
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
+
+    @patch("shilp.client.requests.Session")
+    def test_ingest_data_sends_only_set_fields(self, mock_session_class):
+        """Test unset optional ingest fields are left out of the body."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000")
+        client.ingest_data(
+            IngestRequest(
+                collection_name="c",
+                file_path="data.csv",
+                fields=["title"],
+                metadata_fields={"rating": AttrType.FLOAT64},
+            )
+        )
+
+        assert sent_json(mock_session.request.call_args) == {
+            "collection_name": "c",
+            "file_path": "data.csv",
+            "fields": ["title"],
+            "metadata_fields": {"rating": AttrType.FLOAT64},
+        }
 
 
 class TestNewV013Methods:
@@ -227,18 +447,17 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": {
-                "distance": 0.5,
-                "vector": [0.1, 0.2, 0.3],
-                "custom_matcher_distance": 0.3,
-            },
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": {
+                    "distance": 0.5,
+                    "vector": [0.1, 0.2, 0.3],
+                    "custom_matcher_distance": 0.3,
+                },
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -268,18 +487,17 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": {
-                "distance": 0.7,
-                "vector": [0.4, 0.5],
-                "custom_matcher_distance": None,
-            },
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": {
+                    "distance": 0.7,
+                    "vector": [0.4, 0.5],
+                    "custom_matcher_distance": None,
+                },
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -294,14 +512,13 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -316,7 +533,7 @@ class TestNewV013Methods:
         assert (
             "/api/collections/v1/debug/my-collection/embedding" in call_args[1]["url"]
         )
-        assert call_args[1]["json"]["texts"] == ["hello", "world"]
+        assert sent_json(call_args)["texts"] == ["hello", "world"]
 
     @patch("shilp.client.requests.Session")
     def test_get_collection_data(self, mock_session_class):
@@ -324,18 +541,17 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": [
-                {"id": "1", "data": {"field": "value"}, "vectors": None},
-                {"id": "2", "data": {"field": "value2"}},
-            ],
-            "total": 2,
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": [
+                    {"id": "1", "data": {"field": "value"}, "vectors": None},
+                    {"id": "2", "data": {"field": "value2"}},
+                ],
+                "total": 2,
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -357,31 +573,30 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": {
-                "attributes": [
-                    {
-                        "name": "color",
-                        "type": 2,
-                        "index_type": "inverted",
-                        "is_metadata": False,
-                    }
-                ],
-                "value_schema": [
-                    {
-                        "name": "color",
-                        "index_type": "inverted",
-                        "values": [{"value": "red", "count": 10}],
-                        "synonyms": ["hue"],
-                    }
-                ],
-            },
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": {
+                    "attributes": [
+                        {
+                            "name": "color",
+                            "type": 2,
+                            "index_type": "inverted",
+                            "is_metadata": False,
+                        }
+                    ],
+                    "value_schema": [
+                        {
+                            "name": "color",
+                            "index_type": "inverted",
+                            "values": [{"value": "red", "count": 10}],
+                            "synonyms": ["hue"],
+                        }
+                    ],
+                },
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -400,17 +615,16 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": [
-                {"name": "ecommerce", "label": "E-Commerce", "is_native": True},
-                {"name": "custom", "label": "Custom", "is_native": False},
-            ],
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": [
+                    {"name": "ecommerce", "label": "E-Commerce", "is_native": True},
+                    {"name": "custom", "label": "Custom", "is_native": False},
+                ],
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -432,10 +646,7 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "data": [], "message": "OK"}
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response({"success": True, "data": [], "message": "OK"})
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -445,7 +656,7 @@ class TestNewV013Methods:
         client.search_data(request)
 
         call_args = mock_session.request.call_args
-        assert call_args[1]["json"]["use_nli"] is True
+        assert sent_json(call_args)["use_nli"] is True
 
     @patch("shilp.client.requests.Session")
     def test_list_collections_with_nli_fields(self, mock_session_class):
@@ -453,28 +664,27 @@ class TestNewV013Methods:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "OK",
-            "data": [
-                {
-                    "name": "test",
-                    "is_loaded": True,
-                    "fields": ["f1"],
-                    "searchable_fields": ["f1"],
-                    "storage_type": 1,
-                    "reference_storage_type": 1,
-                    "field_config": {"f1": "hnsw"},
-                    "is_nli_enabled": True,
-                    "nli_domain": "ecommerce",
-                    "total_no_of_documents": 25,
-                }
-            ],
-            "is_nli_supported": True,
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "OK",
+                "data": [
+                    {
+                        "name": "test",
+                        "is_loaded": True,
+                        "fields": ["f1"],
+                        "searchable_fields": ["f1"],
+                        "storage_type": 1,
+                        "reference_storage_type": 1,
+                        "field_config": {"f1": "hnsw"},
+                        "is_nli_enabled": True,
+                        "nli_domain": "ecommerce",
+                        "total_no_of_documents": 25,
+                    }
+                ],
+                "is_nli_supported": True,
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -504,10 +714,7 @@ class TestNewV013Methods:
         """Test search_data includes fuzzy_algo when valid."""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "data": [], "message": "OK"}
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response({"success": True, "data": [], "message": "OK"})
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -519,21 +726,20 @@ class TestNewV013Methods:
         client.search_data(request)
 
         call_args = mock_session.request.call_args
-        assert call_args[1]["json"]["fuzzy_algo"] == FuzzyAlgo.LEVENSHTEIN
+        assert sent_json(call_args)["fuzzy_algo"] == FuzzyAlgo.LEVENSHTEIN
 
     @patch("shilp.client.requests.Session")
     def test_enable_metadata_store(self, mock_session_class):
         """Test enable_metadata_store endpoint."""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "enabled",
-            "records_indexed": 3,
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "enabled",
+                "records_indexed": 3,
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -555,18 +761,17 @@ class TestNewV013Methods:
         """Test get_settings endpoint parsing."""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "ok",
-            "data": {
-                "auth": {"enable": True, "tested": True, "name": "jwt"},
-                "allowedOrigins": ["*"],
-                "integrations": [],
-            },
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "ok",
+                "data": {
+                    "auth": {"enable": True, "tested": True, "name": "jwt"},
+                    "allowedOrigins": ["*"],
+                    "integrations": [],
+                },
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -581,10 +786,7 @@ class TestNewV013Methods:
         """Test update_settings endpoint."""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "message": "updated"}
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response({"success": True, "message": "updated"})
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -597,24 +799,23 @@ class TestNewV013Methods:
         call_args = mock_session.request.call_args
         assert call_args[1]["method"] == "PUT"
         assert "/api/settings/v1/" in call_args[1]["url"]
-        assert call_args[1]["json"]["auth"]["name"] == "jwt"
+        assert sent_json(call_args)["auth"]["name"] == "jwt"
 
     @patch("shilp.client.requests.Session")
     def test_list_providers(self, mock_session_class):
         """Test list_providers endpoint parsing."""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "ok",
-            "data": {
-                "auth": [{"name": "jwt", "type": "auth", "arguments": []}],
-                "integrations": [{"name": "x", "type": "data-source", "arguments": []}],
-            },
-        }
-        mock_response.content = b'{"success": true}'
+        mock_response = mock_json_response(
+            {
+                "success": True,
+                "message": "ok",
+                "data": {
+                    "auth": [{"name": "jwt", "type": "auth", "arguments": []}],
+                    "integrations": [{"name": "x", "type": "data-source", "arguments": []}],
+                },
+            }
+        )
         mock_session.request.return_value = mock_response
 
         client = Client("http://localhost:3000")
@@ -625,5 +826,889 @@ class TestNewV013Methods:
         assert result.data.auth[0].name == "jwt"
 
 
+class TestInsertRecords:
+    """Test batched record insertion."""
+
+    @patch("shilp.client.requests.Session")
+    def test_insert_records_batches(self, mock_session_class):
+        """Test records are chunked into batch_size records per request."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_response = mock_json_response({"success": True, "message": "OK"})
+        mock_session.request.return_value = mock_response
+
+        client = Client("http://localhost:3000", cache_schemas=True)
+        records = [
+            InsertRecordRequest(collection="c", id=f"doc-{i}", record={"title": "t"})
+            for i in range(5)
+        ]
+        result = client.insert_records(
+            "my-collection",
+            records,
+            batch_size=2,
+            metadata_fields={"rating": AttrType.FLOAT64},
+        )
+
+        assert isinstance(result, BulkInsertResponse)
+        assert result.inserted == 5
+        assert mock_session.request.call_count == 3
+        call_args = mock_session.request.call_args_list[0]
+        assert "/api/collections/v1/my-collection/records:batch" in call_args[1]["url"]
+        body = sent_json(call_args)
+        assert body["collection"] == "my-collection"
+        assert body["metadata_fields"] == {"rating": AttrType.FLOAT64}
+        assert [r["id"] for r in body["records"]] == ["doc-0", "doc-1"]
+        assert "collection" not in body["records"][0]
+        later_batch = sent_json(mock_session.request.call_args_list[1])
+        assert "metadata_fields" not in later_batch
+
+    @patch("shilp.client.requests.Session")
+    def test_insert_records_parallel(self, mock_session_class):
+        """Test batches after the first are sent concurrently and all counted."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        def respond(**kwargs):
+            inserted = len(sent_json((None, kwargs))["records"])
+            return mock_json_response(
+                {"success": True, "message": "OK", "inserted": inserted}
+            )
+
+        mock_session.request.side_effect = respond
+
+        client = Client("http://localhost:3000", cache_schemas=True)
+        records = [{"id": f"doc-{i}", "record": {}} for i in range(7)]
+        result = client.insert_records(
+            "my-collection",
+            records,
+            batch_size=2,
+            metadata_fields={"rating": AttrType.FLOAT64},
+            max_workers=3,
+        )
+
+        assert result.inserted == 7
+        assert mock_session.request.call_count == 4
+        bodies = [sent_json(c) for c in mock_session.request.call_args_list]
+        assert sum("metadata_fields" in b for b in bodies) == 1
+        assert sorted(r["id"] for b in bodies for r in b["records"]) == sorted(
+            r["id"] for r in records
+        )
+
+    def test_insert_records_invalid_max_workers(self):
+        """Test non-positive max_workers is rejected."""
+        client = Client("http://localhost:3000")
+        with pytest.raises(ValueError):
+            client.insert_records("c", [], max_workers=0)
+
+    @patch("shilp.client.requests.Session")
+    def test_insert_record_sends_schema_once(self, mock_session_class):
+        """Test an unchanged metadata schema is only sent until it is accepted."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000", cache_schemas=True)
+        schema = {"rating": AttrType.FLOAT64}
+        for i in range(2):
+            client.insert_record(
+                InsertRecordRequest(
+                    collection="c", id=f"doc-{i}", record={}, metadata_fields=schema
+                )
+            )
+        client.insert_record(
+            InsertRecordRequest(
+                collection="c", record={}, metadata_fields={"views": AttrType.INT64}
+            )
+        )
+        client.drop_collection("c")
+        client.insert_record(
+            InsertRecordRequest(collection="c", record={}, metadata_fields=schema)
+        )
+
+        bodies = [sent_json(c) for c in mock_session.request.call_args_list if c[1]["data"]]
+        assert bodies[0]["metadata_fields"] == schema
+        assert "metadata_fields" not in bodies[1]
+        assert bodies[2]["metadata_fields"] == {"views": AttrType.INT64}
+        assert bodies[3]["metadata_fields"] == schema
+
+    @patch("shilp.client.requests.Session")
+    def test_insert_record_sends_schema_by_default(self, mock_session_class):
+        """Test metadata_fields is sent on every insert unless cache_schemas is set."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000")
+        schema = {"rating": AttrType.FLOAT64}
+        for _ in range(2):
+            client.insert_record(
+                InsertRecordRequest(collection="c", record={}, metadata_fields=schema)
+            )
+
+        bodies = [sent_json(c) for c in mock_session.request.call_args_list]
+        assert all(b["metadata_fields"] == schema for b in bodies)
+
+    @pytest.mark.parametrize(
+        "replace",
+        [
+            lambda client: client.rename_collection("c", "d"),
+            lambda client: client.rename_collection("b", "c"),
+            lambda client: client.enable_metadata_store(
+                "c", EnableMetadataStoreRequest()
+            ),
+        ],
+    )
+    @patch("shilp.client.requests.Session")
+    def test_collection_changes_forget_schema(self, mock_session_class, replace):
+        """Test renaming or re-enabling metadata resends the schema."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000", cache_schemas=True)
+        insert = InsertRecordRequest(
+            collection="c", record={}, metadata_fields={"rating": AttrType.FLOAT64}
+        )
+        client.insert_record(insert)
+        replace(client)
+        client.insert_record(insert)
+
+        assert "metadata_fields" in sent_json(mock_session.request.call_args)
+
+    @patch("shilp.client.requests.Session")
+    def test_flush_keeps_schema(self, mock_session_class):
+        """Test flushing a collection does not resend its schema."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000", cache_schemas=True)
+        insert = InsertRecordRequest(
+            collection="c", record={}, metadata_fields={"rating": AttrType.FLOAT64}
+        )
+        client.insert_record(insert)
+        client.flush_collection("c")
+        client.insert_record(insert)
+
+        assert "metadata_fields" not in sent_json(mock_session.request.call_args)
+
+    @patch("shilp.client.requests.Session")
+    def test_import_forgets_all_schemas(self, mock_session_class, tmp_path):
+        """Test an import drops every remembered schema."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        mock_session.post.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        export = tmp_path / "c.shilp"
+        export.write_bytes(b"data")
+
+        client = Client("http://localhost:3000", cache_schemas=True)
+        client.insert_record(
+            InsertRecordRequest(
+                collection="c", record={}, metadata_fields={"rating": AttrType.FLOAT64}
+            )
+        )
+        client.import_collection(str(export))
+
+        assert client._schema_cache == {}
+
+    @patch("shilp.client.requests.Session")
+    def test_insert_records_falls_back_without_batch_endpoint(
+        self, mock_session_class
+    ):
+        """Test per-record inserts are used when the batch endpoint is missing."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        not_found = Mock()
+        not_found.status_code = 404
+        not_found.content = b"Not Found"
+        ok = mock_json_response({"success": True, "message": "OK"})
+        mock_session.request.side_effect = [not_found, ok, ok, ok]
+
+        client = Client("http://localhost:3000")
+        records = [
+            InsertRecordRequest(collection="c", id=f"doc-{i}", record={"title": "t"})
+            for i in range(3)
+        ]
+        result = client.insert_records("my-collection", records)
+
+        assert result.inserted == 3
+        assert mock_session.request.call_count == 4
+        call_args = mock_session.request.call_args
+        assert "/api/collections/v1/record" in call_args[1]["url"]
+        assert sent_json(call_args)["collection"] == "my-collection"
+
+    @patch("shilp.client.requests.Session")
+    def test_insert_record_accepts_wire_dict(self, mock_session_class):
+        """Test a wire-format dict is sent as-is and left unmodified."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+
+        client = Client("http://localhost:3000")
+        record = {"collection": "my-collection", "id": "doc-1", "record": {"a": 1}}
+        client.insert_record(record)
+        client.insert_records("other-collection", [record])
+
+        calls = mock_session.request.call_args_list
+        assert sent_json(calls[0]) == record
+        assert sent_json(calls[1])["records"] == [{"id": "doc-1", "record": {"a": 1}}]
+        assert record["collection"] == "my-collection"
+
+    def test_insert_records_invalid_batch_size(self):
+        """Test that a non-positive batch size is rejected."""
+        client = Client("http://localhost:3000")
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            client.insert_records("my-collection", [], batch_size=0)
+
+
+class TestIterCollections:
+    """Test paginated collection listing."""
+
+    @staticmethod
+    def page(names, next_cursor=None):
+        """Build a list collections payload."""
+        payload = {
+            "success": True,
+            "message": "OK",
+            "data": [
+                {
+                    "name": name,
+                    "is_loaded": True,
+                    "fields": [],
+                    "searchable_fields": [],
+                    "storage_type": 1,
+                    "reference_storage_type": 1,
+                }
+                for name in names
+            ],
+        }
+        if next_cursor:
+            payload["next_cursor"] = next_cursor
+        return mock_json_response(payload)
+
+    @patch("shilp.client.requests.Session")
+    def test_iter_collections_follows_cursor(self, mock_session_class):
+        """Test pages are fetched lazily by following next_cursor."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.side_effect = [
+            self.page(["a", "b"], next_cursor="c1"),
+            self.page(["c"]),
+        ]
+
+        client = Client("http://localhost:3000")
+        collections = client.iter_collections(page_size=2)
+
+        assert next(collections).name == "a"
+        assert mock_session.request.call_count == 1
+        assert [c.name for c in collections] == ["b", "c"]
+        calls = mock_session.request.call_args_list
+        assert calls[0][1]["params"] == {"limit": 2}
+        assert calls[1][1]["params"] == {"limit": 2, "cursor": "c1"}
+
+
+class TestDecodeListCollections:
+    """Test typed decoding of list collections responses."""
+
+    PAYLOAD = {
+        "success": True,
+        "message": "OK",
+        "data": [
+            {
+                "name": "c",
+                "is_loaded": True,
+                "fields": ["title"],
+                "searchable_fields": ["title"],
+                "metadata": [{"name": "rating", "type": 1}],
+                "storage_type": 2,
+                "unknown_field": "ignored",
+            }
+        ],
+        "metadata_info": [
+            {"support_metadata": True, "name": "file", "type": 1, "is_default": True}
+        ],
+    }
+
+    def check(self, result):
+        """Assert result matches PAYLOAD."""
+        collection = result.data[0]
+        assert collection.name == "c"
+        assert collection.metadata == [
+            MetadataColumnSchema(name="rating", type=AttrType.FLOAT64)
+        ]
+        assert collection.storage_type is StorageBackendType.S3
+        assert collection.reference_storage_type is StorageBackendType.FILE
+        assert result.metadata_info[0].type is StorageBackendType.FILE
+
+    def test_decode_with_msgspec(self):
+        """Test the msgspec decoder builds the same models."""
+        pytest.importorskip("msgspec")
+        content = json.dumps(self.PAYLOAD).encode("utf-8")
+        self.check(Client._decode_list_collections(content))
+
+    @patch("shilp.client._LIST_COLLECTIONS_DECODER", None)
+    def test_decode_without_msgspec(self):
+        """Test the dict-based parser builds the same models."""
+        content = json.dumps(self.PAYLOAD).encode("utf-8")
+        self.check(Client._decode_list_collections(content))
+
+    def test_parse_leaves_payload_untouched(self):
+        """Test the dict parser does not rewrite the payload in place."""
+        payload = json.loads(json.dumps(self.PAYLOAD))
+        payload["added_later"] = True
+        self.check(Client._parse_list_collections(payload))
+        assert payload["data"][0]["name"] == "c"
+
+    def test_members_by_value(self):
+        """Test value lookups return members and reject unknown values."""
+        from shilp.client import _ATTR_TYPE_BY_VALUE, _STORAGE_BACKEND_BY_VALUE
+
+        assert _STORAGE_BACKEND_BY_VALUE[2] is StorageBackendType.S3
+        assert _ATTR_TYPE_BY_VALUE["string"] is AttrType.STRING
+        with pytest.raises(ValueError):
+            _STORAGE_BACKEND_BY_VALUE[0]
+
+    def test_decode_falls_back_on_type_mismatch(self):
+        """Test payloads that fail typed validation still parse."""
+        payload = dict(self.PAYLOAD, metadata_info=None)
+        payload["data"] = [dict(self.PAYLOAD["data"][0], fields=None)]
+        result = Client._decode_list_collections(json.dumps(payload).encode("utf-8"))
+        assert result.data[0].fields is None
+
+
+class TestDecodeModel:
+    """Test typed decoding of flat response models."""
+
+    def test_decode_ignores_unknown_keys(self):
+        """Test the typed decoder builds the model and ignores extra keys."""
+        pytest.importorskip("msgspec")
+        content = b'{"success": true, "message": "OK", "request_id": "r1"}'
+        assert _decode_model(GenericResponse, content) == GenericResponse(
+            success=True, message="OK"
+        )
+
+    def test_decode_falls_back_on_type_mismatch(self):
+        """Test bodies that fail typed validation build the model from the dict."""
+        result = _decode_model(GenericResponse, b'{"success": false, "message": null}')
+        assert result == GenericResponse(success=False, message=None)
+
+    @pytest.mark.parametrize("typed", [True, False])
+    def test_unknown_keys_ignored_on_both_paths(self, typed):
+        """Test extra keys are dropped with and without msgspec."""
+        if typed:
+            pytest.importorskip("msgspec")
+        content = b'{"success": true, "message": "OK", "request_id": "r1"}'
+        with patch("shilp.client.msgspec", shilp.client.msgspec if typed else None):
+            result = _decode_model(GenericResponse, content)
+        assert result == GenericResponse(success=True, message="OK")
+
+    def test_model_from_dict_ignores_unknown_keys(self):
+        """Test dict-based construction (e.g. health_check) drops extra keys."""
+        data = {"success": True, "version": "1.0.0", "uptime": 5}
+        assert _model_from_dict(HealthResponse, data) == HealthResponse(
+            success=True, version="1.0.0"
+        )
+
+    @patch("shilp.client.msgspec", None)
+    def test_decode_without_msgspec(self):
+        """Test the model is built from the decoded dict without msgspec."""
+        result = _decode_model(GenericResponse, b'{"success": true, "message": "OK"}')
+        assert result == GenericResponse(success=True, message="OK")
+
+
+class TestSearchDataMany:
+    """Test batched multi-query search."""
+
+    @patch("shilp.client.requests.Session")
+    def test_search_data_many_batch_endpoint(self, mock_session_class):
+        """Test all queries are sent in a single batch request."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {
+                "success": True,
+                "data": [
+                    {"success": True, "data": [{"id": "1"}]},
+                    {"success": True, "data": []},
+                ],
+            }
+        )
+
+        client = Client("http://localhost:3000")
+        results = client.search_data_many(
+            [
+                SearchRequest(collection="c", query="a"),
+                SearchRequest(collection="c", query="b"),
+            ]
+        )
+
+        assert [len(r.data) for r in results] == [1, 0]
+        mock_session.request.assert_called_once()
+        call_args = mock_session.request.call_args
+        assert "/api/data/v1/search:batch" in call_args[1]["url"]
+        assert [q["query"] for q in sent_json(call_args)["queries"]] == ["a", "b"]
+
+    @patch("shilp.client.requests.Session")
+    def test_search_data_many_falls_back_to_threads(self, mock_session_class):
+        """Test searches fan out individually when the batch endpoint is missing."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        not_found = Mock()
+        not_found.status_code = 404
+        not_found.content = b"Not Found"
+        ok = mock_json_response({"success": True, "data": [{"id": "1"}]})
+        mock_session.request.side_effect = [not_found, ok, ok]
+
+        with Client("http://localhost:3000") as client:
+            results = client.search_data_many(
+                [
+                    SearchRequest(collection="c", query="a"),
+                    SearchRequest(collection="c", query="b"),
+                ]
+            )
+            assert client._batch_search_supported is False
+
+        assert len(results) == 2
+        assert mock_session.request.call_count == 3
+        assert client._executors == {}
+
+    @patch("shilp.client.requests.Session")
+    def test_search_data_many_honours_max_workers(self, mock_session_class):
+        """Test each max_workers value gets its own pool, reused across calls."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        not_found = Mock()
+        not_found.status_code = 404
+        not_found.content = b"Not Found"
+        ok = mock_json_response({"success": True, "data": []})
+        mock_session.request.side_effect = [not_found] + [ok] * 3
+        search = [SearchRequest(collection="c", query="a")]
+
+        with Client("http://localhost:3000") as client:
+            client.search_data_many(search, max_workers=2)
+            pool = client._executors[2]
+            client.search_data_many(search, max_workers=2)
+            client.search_data_many(search, max_workers=5)
+            assert client._executors[2] is pool
+            assert client._executors[5]._max_workers == 5
+
+        assert client._executors == {}
+
+    @pytest.mark.parametrize("data", [[], [{"success": True, "data": []}], None])
+    @patch("shilp.client.requests.Session")
+    def test_search_data_many_rejects_short_batch(self, mock_session_class, data):
+        """Test a batch reply without one result per query raises ShilpError."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "data": data}
+        )
+
+        client = Client("http://localhost:3000")
+        with pytest.raises(ShilpError, match="returned .* results for 2 queries"):
+            client.search_data_many(
+                [
+                    SearchRequest(collection="c", query="a"),
+                    SearchRequest(collection="c", query="b"),
+                ]
+            )
+
+    def test_search_data_many_validates_requests(self):
+        """Test invalid requests are rejected before any request is sent."""
+        client = Client("http://localhost:3000")
+        with pytest.raises(ValueError, match="Collection name cannot be empty"):
+            client.search_data_many([SearchRequest(collection="", query="a")])
+
+
+class TestUploadFile:
+    """Test multipart file uploads."""
+
+    @patch("shilp.client.requests.Session")
+    def test_upload_streams_with_multipart_encoder(self, mock_session_class, tmp_path):
+        """Test uploads stream through MultipartEncoder when it is installed."""
+        pytest.importorskip("requests_toolbelt")
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.post.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        file_path = tmp_path / "export.bin"
+        file_path.write_bytes(b"payload")
+
+        client = Client("http://localhost:3000", auth_token="token-123")
+        result = client.import_collection(str(file_path))
+
+        assert result.success is True
+        call_args = mock_session.post.call_args
+        encoder = call_args[1]["data"]
+        assert call_args[1]["headers"]["Content-Type"] == encoder.content_type
+        assert call_args[1]["headers"]["Authorization"] == "Bearer token-123"
+        assert encoder.len > len(b"payload")
+        assert "files" not in call_args[1]
+
+    @patch("shilp.client.MultipartEncoder", None)
+    @patch("shilp.client.requests.Session")
+    def test_upload_falls_back_to_files(self, mock_session_class, tmp_path):
+        """Test uploads use requests' files= without requests-toolbelt."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.post.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        file_path = tmp_path / "data.csv"
+        file_path.write_bytes(b"a,b\n")
+
+        client = Client("http://localhost:3000")
+        client.upload_data_file(str(file_path))
+
+        call_args = mock_session.post.call_args
+        assert "file" in call_args[1]["files"]
+        assert "/api/data/v1/storage/upload" in call_args[1]["url"]
+
+
+class TestImportCollectionChunked:
+    """Test chunked, resumable collection import."""
+
+    @patch("shilp.client.requests.Session")
+    def test_chunks_uploaded_and_retried(self, mock_session_class, tmp_path):
+        """Test each chunk is sent at its offset and failed chunks are retried."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        file_path = tmp_path / "export.bin"
+        file_path.write_bytes(b"x" * (2 * 1024 * 1024 + 5))
+        chunks = {}
+        failures = {"count": 0}
+
+        def respond(**kwargs):
+            url = kwargs["url"]
+            if url.endswith("/import/init"):
+                return mock_json_response({"success": True, "upload_id": "u1"})
+            if "/import/chunk/u1" in url:
+                offset = int(kwargs["params"]["offset"])
+                if offset == 1024 * 1024 and failures["count"] == 0:
+                    failures["count"] += 1
+                    return Mock(status_code=503, content=b"busy")
+                chunks[offset] = len(kwargs["data"])
+                return mock_json_response({"success": True})
+            assert url.endswith("/import/complete/u1")
+            return mock_json_response({"success": True, "message": "Imported"})
+
+        mock_session.request.side_effect = respond
+
+        client = Client("http://localhost:3000")
+        result = client.import_collection_chunked(
+            str(file_path), chunk_size_mb=1, parallel=2
+        )
+
+        assert result.message == "Imported"
+        assert chunks == {0: 1024 * 1024, 1024 * 1024: 1024 * 1024, 2 * 1024 * 1024: 5}
+        assert failures["count"] == 1
+
+    @pytest.mark.parametrize(
+        "failure, attempts",
+        [
+            (Mock(status_code=400, content=b"bad offset"), 1),
+            (requests.ConnectionError("reset"), 3),
+        ],
+    )
+    @patch("shilp.client.requests.Session")
+    def test_only_transient_chunk_errors_retried(
+        self, mock_session_class, tmp_path, failure, attempts
+    ):
+        """Test 4xx chunk errors fail at once and connection errors are retried."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        file_path = tmp_path / "export.bin"
+        file_path.write_bytes(b"payload")
+        puts = []
+
+        def respond(**kwargs):
+            if kwargs["url"].endswith("/import/init"):
+                return mock_json_response({"success": True, "upload_id": "u1"})
+            puts.append(kwargs["params"]["offset"])
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+
+        mock_session.request.side_effect = respond
+
+        client = Client("http://localhost:3000")
+        with pytest.raises(requests.RequestException):
+            client.import_collection_chunked(str(file_path), max_retries=3)
+        assert len(puts) == attempts
+
+    @patch("shilp.client.requests.Session")
+    def test_init_without_upload_id(self, mock_session_class, tmp_path):
+        """Test an init reply without upload_id raises ShilpError naming it."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response({"success": True})
+        file_path = tmp_path / "export.bin"
+        file_path.write_bytes(b"payload")
+
+        client = Client("http://localhost:3000")
+        with pytest.raises(ShilpError, match="upload_id"):
+            client.import_collection_chunked(str(file_path))
+        mock_session.request.assert_called_once()
+
+    @patch("shilp.client.requests.Session")
+    def test_falls_back_without_chunked_endpoint(self, mock_session_class, tmp_path):
+        """Test a 404 from the init endpoint falls back to import_collection."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = Mock(status_code=404, content=b"not found")
+        mock_session.post.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        file_path = tmp_path / "export.bin"
+        file_path.write_bytes(b"payload")
+
+        client = Client("http://localhost:3000")
+        result = client.import_collection_chunked(str(file_path))
+
+        assert result.success is True
+        assert "/api/collections/v1/import" in mock_session.post.call_args[1]["url"]
+
+
+class TestOplog:
+    """Test oplog polling."""
+
+    @patch("shilp.client.requests.Session")
+    def test_get_oplog_entries_long_poll(self, mock_session_class):
+        """Test wait_ms is sent and extends the read timeout."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK", "entries": [], "last_lsn": 7, "count": 0}
+        )
+
+        client = Client("http://localhost:3000", timeout=10)
+        result = client.get_oplog_entries("c", after_lsn=7, wait_ms=30000)
+
+        assert result.last_lsn == 7
+        call_args = mock_session.request.call_args
+        assert call_args[1]["params"] == {
+            "after_lsn": "7",
+            "collection": "c",
+            "wait_ms": "30000",
+        }
+        assert call_args[1]["timeout"] == 40
+
+    @patch("shilp.client.requests.Session")
+    def test_iter_oplog_entries_streams(self, mock_session_class):
+        """Test entries are parsed incrementally from the streamed body."""
+        pytest.importorskip("ijson")
+        from urllib3.response import HTTPResponse
+
+        body = gzip.compress(json.dumps({
+            "success": True,
+            "message": "OK",
+            "entries": [{"lsn": 4, "score": 0.5}, {"lsn": 5, "score": 1.5}],
+            "last_lsn": 5,
+            "count": 2,
+        }).encode("utf-8"))
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers={"Content-Encoding": "gzip"},
+            preload_content=False,
+            decode_content=False,
+        )
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = response
+
+        client = Client("http://localhost:3000")
+        entries = list(client.iter_oplog_entries("c", after_lsn=3, limit=2))
+
+        assert entries == [{"lsn": 4, "score": 0.5}, {"lsn": 5, "score": 1.5}]
+        assert type(entries[0]["score"]) is float
+        call_args = mock_session.request.call_args
+        assert call_args[1]["stream"] is True
+        assert call_args[1]["params"] == {"after_lsn": "3", "collection": "c", "limit": "2"}
+
+    @patch("shilp.client.ijson", None)
+    @patch("shilp.client.requests.Session")
+    def test_iter_oplog_entries_without_ijson(self, mock_session_class):
+        """Test the iterator falls back to a buffered request without ijson."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK", "entries": [{"lsn": 4}], "last_lsn": 4, "count": 1}
+        )
+
+        client = Client("http://localhost:3000")
+        assert list(client.iter_oplog_entries("", after_lsn=3)) == [{"lsn": 4}]
+        assert "stream" not in mock_session.request.call_args[1]
+
+
+class TestEventStreams:
+    """Test SSE streaming endpoints."""
+
+    @staticmethod
+    def event_stream(body):
+        """Build a streamed text/event-stream response without a charset."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "text/event-stream"
+        response.raw = io.BytesIO(body)
+        return response
+
+    @patch("shilp.client.requests.Session")
+    def test_stream_ingest_stats_decodes_utf8_lines(self, mock_session_class):
+        """Test non-empty lines are passed to the callback as UTF-8 text."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.get.return_value = self.event_stream(
+            "data: café\n\ndata: done\n".encode("utf-8")
+        )
+
+        lines = []
+        Client("http://localhost:3000").stream_ingest_stats("c", lines.append)
+
+        assert lines == ["data: café", "data: done"]
+
+    @patch("shilp.client.requests.Session")
+    def test_stream_oplog_entries(self, mock_session_class):
+        """Test each oplog data event is decoded and passed to the callback."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.get.return_value = self.event_stream(
+            b'event: entry\ndata: {"lsn": 4, "op_type": "insert"}\n\n'
+            b'data: {"lsn": 5, "op_type": "delete"}\n'
+        )
+
+        entries = []
+        Client("http://localhost:3000").stream_oplog_entries("c", 3, entries.append)
+
+        assert [e["lsn"] for e in entries] == [4, 5]
+        call_args = mock_session.get.call_args
+        assert call_args[0][0] == "http://localhost:3000/api/oplog/v1/stream"
+        assert call_args[1]["params"] == {"after_lsn": "3", "collection": "c"}
+
+    @patch("shilp.client.requests.Session")
+    def test_stream_keeps_unicode_line_separators(self, mock_session_class):
+        """Test U+0085 and U+2028 inside a data payload do not split the line."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.get.return_value = self.event_stream(
+            'data: {"lsn": 4, "text": "x\u0085y\u2028z"}\n'.encode("utf-8")
+        )
+
+        entries = []
+        Client("http://localhost:3000").stream_oplog_entries("c", 3, entries.append)
+
+        assert entries == [{"lsn": 4, "text": "x\u0085y\u2028z"}]
+
+    @patch("shilp.client.requests.Session")
+    def test_update_collection_model_parses_events(self, mock_session_class):
+        """Test data lines are parsed into events and other lines skipped."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.post.return_value = self.event_stream(
+            b'event: progress\ndata: {"status": "running", "current": 1}\n\n'
+            b": keep-alive\n"
+            b'data: {"status": "done"}\n'
+        )
+
+        events = []
+        Client("http://localhost:3000").update_collection_model("c", events.append)
+
+        assert [e.status for e in events] == ["running", "done"]
+        assert events[0].current == 1
+
+
+class TestJSONEncoding:
+    """Test request body encoding."""
+
+    def test_dumps_array_likes(self):
+        """Test array-like vectors are encoded as JSON lists."""
+        vector = array.array("d", [0.5, 0.25])
+        assert json.loads(_dumps({"vector": vector})) == {"vector": [0.5, 0.25]}
+
+    def test_dumps_numpy_array(self):
+        """Test numpy vectors are encoded as JSON lists."""
+        np = pytest.importorskip("numpy")
+        vector = np.asarray([0.5, 0.25], dtype=np.float32)
+        assert json.loads(_dumps({"vector": vector})) == {"vector": [0.5, 0.25]}
+
+    def test_dumps_rejects_unknown_types(self):
+        """Test unsupported objects still raise TypeError."""
+        with pytest.raises(TypeError):
+            _dumps({"value": object()})
+
+    @patch("shilp.client.requests.Session")
+    def test_responses_decoded_from_content_bytes(self, mock_session_class):
+        """Test responses are parsed from raw bytes, bypassing Response.json()."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_response = mock_json_response({"success": True, "message": "OK"})
+        mock_session.request.return_value = mock_response
+
+        result = Client("http://localhost:3000").flush_collection("c")
+
+        assert result.success is True
+        mock_response.json.assert_not_called()
+
+
+class TestExportCollection:
+    """Test streaming collection export."""
+
+    @patch("shilp.client.requests.Session")
+    def test_export_collection_streams_raw(self, mock_session_class):
+        """Test export returns the decoded raw stream without buffering."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.raw = Mock()
+        mock_response.raw.decode_content = False
+        mock_session.request.return_value = mock_response
+
+        client = Client("http://localhost:3000")
+        result = client.export_collection("my-collection")
+
+        assert result is mock_response.raw
+        assert result.decode_content is True
+        call_args = mock_session.request.call_args
+        assert call_args[1]["stream"] is True
+        assert "/api/collections/v1/my-collection/export" in call_args[1]["url"]
+
+    @patch("shilp.client.requests.Session")
+    def test_export_collection_chunks(self, mock_session_class):
+        """Test chunked export yields iter_content chunks and closes the response."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.return_value = iter([b"ab", b"c"])
+        mock_session.request.return_value = mock_response
+
+        client = Client("http://localhost:3000")
+        chunks = client.export_collection_chunks("my-collection", chunk_size=2)
+
+        mock_session.request.assert_called_once()
+        assert list(chunks) == [b"ab", b"c"]
+        mock_response.iter_content.assert_called_once_with(chunk_size=2)
+        mock_response.__exit__.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,388 @@
+"""
+Unit tests for Shilp SDK DiscoveryClient.
+"""
+
+import dataclasses
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from shilp.discovery_client import DiscoveryClient
+from shilp.exceptions import ShilpError
+from shilp.models import ReplicaType
+
+
+def mock_json_response(payload, status_code=200):
+    """Build a mock response whose body is payload encoded as JSON."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.content = json.dumps(payload).encode("utf-8")
+    mock_response.headers = {}
+    return mock_response
+
+
+STATS_PAYLOAD = {
+    "registry": {
+        "write_replica": {"id": "w", "address": "a:1", "is_healthy": True, "is_syncing": False},
+        "read_replicas": [],
+        "available": 1,
+        "total": 1,
+    },
+    "proxy": {"active_proxies": 0, "targets": []},
+}
+
+
+class TestDiscoveryClient:
+    """Test DiscoveryClient initialization and lifecycle."""
+
+    def test_client_initialization(self):
+        """Test client initialization."""
+        client = DiscoveryClient("http://localhost:8080/", timeout=10)
+        assert client.base_url == "http://localhost:8080"
+        assert client.timeout == 10
+
+    def test_urls_keep_base_path(self):
+        """Test endpoint URLs are built once and keep any base URL path prefix."""
+        session = Mock(spec=requests.Session)
+        session.request.return_value = mock_json_response(STATS_PAYLOAD)
+        client = DiscoveryClient("http://gateway/discovery/", session=session)
+
+        client.get_shilp_stats("acct")
+
+        assert session.request.call_args[1]["url"] == (
+            "http://gateway/discovery/api/v1/discovery/shilp/stats"
+        )
+
+    def test_default_session_uses_pooled_adapter(self):
+        """Test the default session mounts the pooled, retrying adapter."""
+        client = DiscoveryClient("http://localhost:8080")
+        adapter = client.session.get_adapter("http://localhost:8080")
+        assert adapter is client.session.get_adapter("https://localhost:8080")
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.respect_retry_after_header
+
+    def test_default_session_accepts_compressed_responses(self):
+        """Test the default session advertises every encoding urllib3 decodes."""
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        client = DiscoveryClient("http://localhost:8080")
+        assert client.session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert "gzip" in ACCEPT_ENCODING
+
+    def test_close_keeps_caller_session(self):
+        """Test close only closes sessions the client created."""
+        session = Mock(spec=requests.Session)
+        with DiscoveryClient("http://localhost:8080", session=session):
+            pass
+        session.close.assert_not_called()
+
+        client = DiscoveryClient("http://localhost:8080")
+        client.session = Mock(spec=requests.Session)
+        client.close()
+        client.session.close.assert_called_once()
+
+
+class TestDiscoveryRequests:
+    """Test request encoding and response decoding."""
+
+    def test_request_sends_serialized_body(self):
+        """Test JSON bodies are serialized once and sent as bytes."""
+        session = Mock(spec=requests.Session)
+        session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        client = DiscoveryClient("http://localhost:8080", session=session)
+
+        result = client.register_tei_service("acct", "10.0.0.1:80", "tei-1")
+
+        assert result.success is True
+        kwargs = session.request.call_args[1]
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        assert json.loads(kwargs["data"]) == {
+            "account_id": "acct",
+            "address": "10.0.0.1:80",
+            "id": "tei-1",
+        }
+        assert "json" not in kwargs
+
+    def test_generic_responses_are_shared_and_frozen(self):
+        """Test identical write responses reuse one frozen GenericResponse."""
+        session = Mock(spec=requests.Session)
+        session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        client = DiscoveryClient("http://localhost:8080", session=session)
+
+        first = client.register_tei_service("acct", "a:1", "t1")
+        second = client.unregister_tei_service("acct", "a:1", "t1")
+
+        assert first is second
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.success = False
+
+    def test_write_ignores_unknown_keys(self):
+        """Test keys besides success/message do not break write responses."""
+        session = Mock(spec=requests.Session)
+        session.request.return_value = mock_json_response(
+            {"message": "OK", "success": True, "request_id": "r1"}
+        )
+        client = DiscoveryClient("http://localhost:8080", session=session)
+
+        result = client.register_tei_service("acct", "a:1", "t1")
+        assert (result.success, result.message) == (True, "OK")
+
+    @pytest.mark.parametrize("payload", [{}, {"message": "OK"}, {"id": "s1"}])
+    def test_write_requires_success_field(self, payload):
+        """Test a non-empty write reply without success raises ShilpError."""
+        session = Mock(spec=requests.Session)
+        session.request.return_value = mock_json_response(payload)
+        client = DiscoveryClient("http://localhost:8080", session=session)
+
+        with pytest.raises(ShilpError, match="no success field"):
+            client.register_tei_service("acct", "a:1", "t1")
+
+    def test_request_empty_body(self):
+        """Test an empty response body decodes to an empty dict."""
+        session = Mock(spec=requests.Session)
+        response = mock_json_response({})
+        response.content = b""
+        session.request.return_value = response
+        client = DiscoveryClient("http://localhost:8080", session=session)
+
+        assert client._request("GET", "shilp_stats") == {}
+        assert session.request.call_args[1]["data"] is None
+
+    def test_request_no_content(self):
+        """Test 204 and zero Content-Length responses are not decoded."""
+        session = Mock(spec=requests.Session)
+        client = DiscoveryClient("http://localhost:8080", session=session)
+
+        no_content = Mock(status_code=204, headers={})
+        zero_length = Mock(status_code=200, headers={"Content-Length": "0"})
+        for response in (no_content, zero_length):
+            session.request.return_value = response
+            assert client._request("DELETE", "tei_unregister", json_data={}) == {}
+
+    def test_write_no_content_succeeds(self):
+        """Test a 204 from register/unregister maps to a success response."""
+        session = Mock(spec=requests.Session)
+        session.request.return_value = Mock(status_code=204, headers={})
+        client = DiscoveryClient("http://localhost:8080", session=session)
+
+        result = client.register_shilp_service("acct", "a:1", "s1", ReplicaType.SINGLE_NODE)
+        assert result.success is True
+        assert client.unregister_tei_service("acct", "a:1", "t1").success is True
+
+
+class TestStatsCache:
+    """Test the get_shilp_stats TTL cache."""
+
+    def make_client(self, **kwargs):
+        session = Mock(spec=requests.Session)
+        session.request.return_value = mock_json_response(STATS_PAYLOAD)
+        return DiscoveryClient("http://localhost:8080", session=session, **kwargs)
+
+    @patch("shilp.discovery_client.time.monotonic")
+    def test_stats_cached_until_ttl(self, mock_monotonic):
+        """Test stats are reused per account until the TTL expires."""
+        client = self.make_client(stats_ttl=5)
+        mock_monotonic.return_value = 100.0
+
+        first = client.get_shilp_stats("acct")
+        mock_monotonic.return_value = 104.9
+        assert client.get_shilp_stats("acct") is first
+        assert client.session.request.call_count == 1
+
+        client.get_shilp_stats("other")
+        assert client.session.request.call_count == 2
+
+        mock_monotonic.return_value = 105.0
+        assert client.get_shilp_stats("acct") is not first
+        assert client.session.request.call_count == 3
+
+    def test_invalidate_stats(self):
+        """Test invalidate_stats drops one account or all of them."""
+        client = self.make_client()
+        client.get_shilp_stats("a")
+        client.get_shilp_stats("b")
+
+        client.invalidate_stats("a")
+        client.get_shilp_stats("a")
+        client.get_shilp_stats("b")
+        assert client.session.request.call_count == 3
+
+        client.invalidate_stats()
+        client.get_shilp_stats("b")
+        assert client.session.request.call_count == 4
+
+    def test_concurrent_fetches_share_one_request(self):
+        """Test threads asking at once wait for the request in flight."""
+        client = self.make_client()
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            release.wait(5)
+            return mock_json_response(STATS_PAYLOAD)
+
+        client.session.request.side_effect = slow_request
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(client.get_shilp_stats, "acct") for _ in range(4)]
+            while len(client._stats_inflight) == 0:
+                pass
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert client.session.request.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_invalidate_during_fetch(self):
+        """Test a fetch started before an invalidation is neither joined nor cached."""
+        client = self.make_client()
+        release = threading.Event()
+        old = {**STATS_PAYLOAD, "registry": {**STATS_PAYLOAD["registry"], "total": 1}}
+        new = {**STATS_PAYLOAD, "registry": {**STATS_PAYLOAD["registry"], "total": 2}}
+        responses = iter([old, new])
+
+        def request(*args, **kwargs):
+            payload = next(responses)
+            if payload is old:
+                release.wait(5)
+            return mock_json_response(payload)
+
+        client.session.request.side_effect = request
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stale = executor.submit(client.get_shilp_stats, "acct")
+            while len(client._stats_inflight) == 0:
+                pass
+
+            client.invalidate_stats("acct")
+            assert client.get_shilp_stats("acct").registry.total == 2
+
+            release.set()
+            assert stale.result().registry.total == 1
+
+        assert client._stats_inflight == {}
+        assert client.get_shilp_stats("acct").registry.total == 2
+        assert client.session.request.call_count == 2
+
+    def test_failed_fetch_is_not_cached(self):
+        """Test an error is raised and the next call retries."""
+        client = self.make_client()
+        client.session.request.return_value = mock_json_response(
+            {"message": "boom"}, status_code=500
+        )
+        with pytest.raises(ShilpError):
+            client.get_shilp_stats("acct")
+        assert client._stats_inflight == {}
+
+        client.session.request.return_value = mock_json_response(STATS_PAYLOAD)
+        assert client.get_shilp_stats("acct").registry.total == 1
+
+    def test_stats_ttl_zero_disables_cache(self):
+        """Test stats_ttl=0 sends a request on every call."""
+        client = self.make_client(stats_ttl=0)
+        client.get_shilp_stats("acct")
+        client.get_shilp_stats("acct")
+        assert client.session.request.call_count == 2
+        assert client._stats_cache == {}
+
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("update_shilp_sync_status", ("acct", "a:1", "ready")),
+            ("register_shilp_service", ("acct", "a:1", "s1", ReplicaType.READ_REPLICA)),
+            ("unregister_shilp_service", ("acct", "a:1", "s1", ReplicaType.READ_REPLICA)),
+            ("register_tei_service", ("acct", "a:1", "t1")),
+            ("unregister_tei_service", ("acct", "a:1", "t1")),
+        ],
+    )
+    def test_writes_invalidate_account_stats(self, method, args):
+        """Test each write drops the cached stats of its account only."""
+        client = self.make_client()
+        client.get_shilp_stats("acct")
+        client.get_shilp_stats("other")
+
+        client.session.request.return_value = mock_json_response(
+            {"success": True, "message": "OK"}
+        )
+        getattr(client, method)(*args)
+
+        assert "acct" not in client._stats_cache
+        assert "other" in client._stats_cache
+
+
+class TestShilpServiceBody:
+    """Test the register/unregister request body."""
+
+    @pytest.mark.parametrize(
+        "replica_type, flags",
+        [
+            (ReplicaType.READ_REPLICA, (True, False)),
+            (ReplicaType.WRITE_REPLICA, (False, True)),
+            (ReplicaType.SINGLE_NODE, (True, True)),
+        ],
+    )
+    def test_replica_type_flags(self, replica_type, flags):
+        """Test each replica type maps to its is_read/is_write flags."""
+        body = DiscoveryClient._shilp_service_to_dict("acct", "a:1", "s1", replica_type)
+        assert (body["is_read"], body["is_write"]) == flags
+
+    def test_unknown_replica_type(self):
+        """Test an unknown replica type is rejected instead of sent as no-access."""
+        with pytest.raises(ValueError):
+            DiscoveryClient._shilp_service_to_dict("acct", "a:1", "s1", 7)
+
+
+class TestParseShilpStats:
+    """Test conversion of the stats payload to DiscoveryStats."""
+
+    def test_parse_replicas(self):
+        """Test replicas are built field by field and unknown keys are ignored."""
+        replica = {"id": "r1", "address": "a:2", "is_healthy": False,
+                   "is_syncing": True, "region": "eu"}
+        payload = {
+            "registry": {**STATS_PAYLOAD["registry"], "read_replicas": [replica]},
+            "proxy": {"active_proxies": 2, "targets": ["a:2"]},
+        }
+
+        stats = DiscoveryClient._parse_shilp_stats(payload)
+
+        assert stats.registry.write_replica.id == "w"
+        (read,) = stats.registry.read_replicas
+        assert (read.id, read.address, read.is_healthy, read.is_syncing) == (
+            "r1", "a:2", False, True
+        )
+        assert stats.proxy.active_proxies == 2
+
+    def test_replica_missing_field(self):
+        """Test an incomplete replica payload names the missing field."""
+        payload = {"registry": {"write_replica": {"id": "w", "address": "a:1"}}}
+        with pytest.raises(TypeError, match="missing field 'is_healthy'"):
+            DiscoveryClient._parse_shilp_stats(payload)
+
+    def test_decode_stats_typed_and_lenient(self):
+        """Test full payloads decode directly and partial ones fall back."""
+        full = DiscoveryClient._decode_shilp_stats(json.dumps(STATS_PAYLOAD).encode())
+        assert full.registry.write_replica.id == "w"
+        assert full == DiscoveryClient._parse_shilp_stats(STATS_PAYLOAD)
+
+        # No proxy section: the typed decoder rejects it, the parser defaults it
+        partial = {"registry": STATS_PAYLOAD["registry"]}
+        result = DiscoveryClient._decode_shilp_stats(json.dumps(partial).encode())
+        assert result.proxy.active_proxies == 0
+        assert result.proxy.targets == ()
+
+    def test_stats_lists_are_tuples(self):
+        """Test cached stats cannot be changed through their list fields."""
+        content = json.dumps(STATS_PAYLOAD).encode()
+        for stats in (
+            DiscoveryClient._decode_shilp_stats(content),
+            DiscoveryClient._parse_shilp_stats(STATS_PAYLOAD),
+        ):
+            assert isinstance(stats.registry.read_replicas, tuple)
+            assert isinstance(stats.proxy.targets, tuple)
@@ -0,0 +1,59 @@
+"""
+Unit tests for Shilp SDK parallel ingestion helpers.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from shilp import ingest
+from shilp.models import BulkInsertResponse
+
+
+class TestShard:
+    """Test splitting records into worker shards."""
+
+    def test_shard_balances_sizes(self):
+        """Test shards are contiguous and differ in size by at most one."""
+        shards = ingest._shard(list(range(10)), 4)
+        assert shards == [[0, 1, 2], [3, 4, 5], [6, 7], [8, 9]]
+
+    def test_shard_drops_empty_slices(self):
+        """Test fewer records than shards yields one shard per record."""
+        assert ingest._shard([1, 2], 4) == [[1], [2]]
+
+
+class TestParallelInsert:
+    """Test parallel_insert, with threads standing in for processes."""
+
+    @patch("shilp.ingest.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("shilp.ingest._insert_shard")
+    def test_parallel_insert_sums_shards(self, mock_insert_shard):
+        """Test each shard is inserted once and counts are summed."""
+        mock_insert_shard.side_effect = (
+            lambda url, collection, records, *args: BulkInsertResponse(
+                success=True, message="OK", inserted=len(records)
+            )
+        )
+
+        result = ingest.parallel_insert(
+            "http://localhost:3000", "test", list(range(9)), workers=3
+        )
+
+        assert result.success is True
+        assert result.inserted == 9
+        assert mock_insert_shard.call_count == 3
+        assert mock_insert_shard.call_args[0][:2] == ("http://localhost:3000", "test")
+
+    @patch("shilp.ingest.ProcessPoolExecutor")
+    def test_parallel_insert_empty(self, mock_executor):
+        """Test no workers are started for an empty record list."""
+        result = ingest.parallel_insert("http://localhost:3000", "test", [])
+        assert result.inserted == 0
+        mock_executor.assert_not_called()
+
+    def test_parallel_insert_invalid_workers(self):
+        """Test non-positive workers is rejected."""
+        with pytest.raises(ValueError):
+            ingest.parallel_insert("http://localhost:3000", "test", [1], workers=0)
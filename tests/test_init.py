@@ -0,0 +1,82 @@
+"""
+Unit tests for the Shilp SDK package exports.
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import shilp
+import shilp.models
+
+
+class TestLazyExports:
+    """Test PEP 562 lazy re-exports."""
+
+    def test_all_names_resolve(self):
+        """Test every name in __all__ resolves to an object."""
+        for name in shilp.__all__:
+            assert getattr(shilp, name) is not None
+
+    def test_names_defined_in_mapped_module(self):
+        """Test each export is defined by the module it is mapped to."""
+        for name, module_name in shilp._LAZY.items():
+            assert getattr(shilp, name).__module__ == module_name, name
+
+    def test_all_matches_models(self):
+        """Test non-client exports all come from shilp.models."""
+        others = {
+            "Client",
+            "AsyncClient",
+            "DiscoveryClient",
+            "AsyncDiscoveryClient",
+            "ShilpError",
+            "NotFoundError",
+        }
+        assert set(shilp.__all__) - others <= set(dir(shilp.models))
+        assert len(shilp.__all__) == len(set(shilp.__all__))
+
+    def test_type_checking_imports_match_lazy(self):
+        """Test the TYPE_CHECKING block imports every export from its module."""
+        tree = ast.parse(Path(shilp.__file__).read_text())
+        (block,) = [
+            node for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+        ]
+        imported = {
+            alias.name: node.module
+            for node in block.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+        assert imported == shilp._LAZY
+
+    def test_version_matches_pyproject(self):
+        """Test the package version matches the published metadata."""
+        pyproject = Path(__file__).resolve().parent.parent / "pyproject.toml"
+        assert f'version = "{shilp.__version__}"' in pyproject.read_text()
+
+    def test_unknown_name_raises(self):
+        """Test unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            shilp.DoesNotExist
+
+    def test_dir_lists_lazy_names(self):
+        """Test lazy names are listed by dir()."""
+        assert set(shilp.__all__) <= set(dir(shilp))
+
+    def test_model_import_does_not_load_http_stack(self):
+        """Test importing a model does not import the HTTP client modules."""
+        code = (
+            "import sys; from shilp import FilterOp; "
+            "assert 'shilp.client' not in sys.modules; "
+            "assert 'requests' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,7 +2,13 @@
 Unit tests for Shilp SDK models and validation.
 """
 
+import dataclasses
+import json
+import pickle
+import sys
+
 import pytest
+import shilp.models
 from shilp.models import (
     FilterExpression,
     FilterOp,
@@ -10,6 +16,7 @@ from shilp.models import (
     SortOrder,
     CompoundFilter,
     CompoundSort,
+    GetOplogResponse,
     AttrType,
     IndexType,
     AttributeType,
@@ -38,6 +45,26 @@ from shilp.models import (
 )
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need Python 3.10+")
+class TestModelSlots:
+    """Test dataclass models are slotted."""
+
+    def test_models_have_no_instance_dict(self):
+        """Test every dataclass model declares __slots__."""
+        models = [
+            obj for obj in vars(shilp.models).values()
+            if isinstance(obj, type) and dataclasses.is_dataclass(obj)
+        ]
+        assert models
+        for model in models:
+            assert "__slots__" in model.__dict__, model.__name__
+
+    def test_slotted_model_pickles(self):
+        """Test slotted models still round-trip through pickle."""
+        record = CollectionDataRecord(id="1", data={"title": "Hello"})
+        assert pickle.loads(pickle.dumps(record)) == record
+
+
 class TestFilterExpression:
     """Test FilterExpression validation."""
 
@@ -105,7 +132,8 @@ class TestCompoundFilter:
                 FilterExpression(
                     attribute="status", op=FilterOp.EQUALS, value="active"
                 ),
-            ]
+            ],
+            reorder=False,
         )
 
         result = compound.to_dict()
@@ -115,12 +143,35 @@ class TestCompoundFilter:
         assert result["and"][0]["op"] == FilterOp.GREATER_THAN
         assert result["and"][0]["value"] == 25
 
+    def test_to_dict_reorders_by_selectivity(self):
+        """Test AND filters are sent most selective first, OR filters last."""
+        age = FilterExpression(attribute="age", op=FilterOp.GREATER_THAN, value=25)
+        status = FilterExpression(
+            attribute="status", op=FilterOp.EQUALS, value="active"
+        )
+        compound = CompoundFilter(and_=[age, status], or_=[status, age])
+
+        result = compound.to_dict()
+        assert [f["attribute"] for f in result["and"]] == ["status", "age"]
+        assert [f["attribute"] for f in result["or"]] == ["age", "status"]
+        # The caller's lists are left untouched
+        assert compound.and_ == [age, status]
+
     def test_to_dict_empty(self):
         """Test conversion to dictionary with no filters."""
         compound = CompoundFilter()
         result = compound.to_dict()
         assert result == {}
 
+    def test_to_dict_omits_unset_values(self):
+        """Test unset value/values keys are omitted and ops are plain ints."""
+        compound = CompoundFilter(
+            and_=[FilterExpression(attribute="tag", op=FilterOp.IN, values=["a"])]
+        )
+        (entry,) = compound.to_dict()["and"]
+        assert entry == {"attribute": "tag", "op": int(FilterOp.IN), "values": ["a"]}
+        assert type(entry["op"]) is int
+
 
 class TestCompoundSort:
     """Test CompoundSort serialization."""
@@ -157,6 +208,18 @@ class TestAttrType:
         assert AttrType.STRING == 2
         assert AttrType.BOOL == 3
 
+    def test_attr_type_accepts_legacy_names(self):
+        """Test AttrType can be built from legacy string names."""
+        assert AttrType("string") is AttrType.STRING
+        assert AttrType("FLOAT64") is AttrType.FLOAT64
+        assert AttrType(3) is AttrType.BOOL
+        with pytest.raises(ValueError):
+            AttrType("unknown")
+
+    def test_attr_type_serializes_as_int(self):
+        """Test AttrType is encoded as its integer value."""
+        assert json.dumps({"a": AttrType.STRING}) == '{"a": 2}'
+
 
 class TestFilterOp:
     """Test FilterOp enum."""
@@ -388,6 +451,35 @@ class TestV014Models:
         )
         assert resp.timing == {"total_ms": 12}
 
+    def test_search_response_as_records(self):
+        """Test as_records extracts columns and fills missing ones."""
+        response = SearchResponse(
+            success=True,
+            data=[{"id": "1", "title": "a"}, {"id": "2"}],
+        )
+        assert response.as_records(["id", "title"], default="N/A") == [
+            ("1", "a"),
+            ("2", "N/A"),
+        ]
+        assert response.as_records(["id"]) == [("1",), ("2",)]
+
+    def test_get_oplog_response_as_columns(self):
+        """Test as_columns gathers one list per field across entries."""
+        response = GetOplogResponse(
+            success=True,
+            message="ok",
+            entries=[
+                {"lsn": 1, "op_type": "insert", "doc_id": "a"},
+                {"lsn": 2, "op_type": "delete"},
+            ],
+            last_lsn=2,
+            count=2,
+        )
+        assert response.as_columns(["lsn", "doc_id"]) == {
+            "lsn": [1, 2],
+            "doc_id": ["a", None],
+        }
+
     def test_enable_metadata_store_response(self):
         resp = EnableMetadataStoreResponse(
             success=True, message="ok", records_indexed=10